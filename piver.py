@@ -8,8 +8,16 @@ then be assigned with new tasks and new properties/attributes. Far more importan
 handler class, inheriting from the 'PiverRequestHandler' class, which is the core class for adding new functionality.
 If the developer wants to add a new remote functionality of the server, that can be called by the client, he simply has
 to add the according method to the handler class (The first parameter of that method has to be reserved for the
-RequestTransfer object, that triggered the method call) and define its parameters, it will automatically be called by,
-when the server receives a RequestTransfer object, that specifies said method by its string name
+RequestTransfer object, that triggered the method call), define its parameters and decorate it with 'remote', it will
+automatically be called by, when the server receives a RequestTransfer object, that specifies said method by its string
+name. Only the methods decorated with 'remote' can be called by the clients, all the other attributes of the handler
+stay private. The decorator also describes the method, for example whether it is idempotent and may thus be executed in
+parallel with others:
+
+    class MyHandler(PiverRequestHandler):
+        @remote(idempotent=True)
+        def get_points(self, received_object, subject):
+            ...
 
 2) The Client:
 A new Client class has to be created. The client class has to inherit from the 'BaseClient' class of the piver module.
@@ -22,14 +30,33 @@ client object
 User profiles can be extended as one wishes, as long as the original functionality of organizing the login data
 (username, password) is not being shadowed.
 """
+import concurrent.futures
+import multiprocessing
+import asyncio
 import configparser
+import collections
 import socketserver
+import itertools
+import functools
+import hashlib
+import hmac
+import heapq
+import shutil
+import tempfile
+import json
+import queue
 import threading
 import datetime
 import socket
 import random
 import pickle
+import select
+import signal
+import struct
+import lzma
+import math
 import time
+import zlib
 import os
 
 
@@ -49,448 +76,3864 @@ def get_project_path():
 
 PROJECT_PATH = get_project_path()
 
+# Every object passing a piver socket connection is being transmitted as a single frame. A frame starts with a fixed
+# size header, consisting of one byte of flags and an unsigned 8 byte integer, that announces the length of the
+# payload (the serialized object) following the header
+FRAME_HEADER = struct.Struct("!BQ")
+# The lower four bits of the flags byte contain the id of the codec, with which the payload was serialized
+FRAME_CODEC_MASK = 0x0F
+# The next two bits contain the id of the compression, with which the serialized payload was compressed (0 for none)
+FRAME_COMPRESSION_MASK = 0x30
+FRAME_COMPRESSION_SHIFT = 4
+# A response frame with this flag set is followed by a stream of data frames, which carry raw bytes instead of a
+# serialized object. The stream ends with an empty data frame
+FRAME_STREAM_FLAG = 0x40
+FRAME_DATA_FLAG = 0x80
+# The maximum size of a single frame payload, that is accepted by the receiving side, so that a corrupted or malicious
+# header cannot make the program allocate an arbitrary amount of memory
+MAX_FRAME_SIZE = 1024 ** 3
+# The maximum size of a request frame accepted by the servers. Requests are received before the client is
+# authenticated, so the limit is kept small. Big payloads are sent as a stream of data frames after the request
+MAX_REQUEST_FRAME_SIZE = 8 * 1024 ** 2
+# The maximum amount of bytes, that is allocated for a payload before its data has actually arrived. Bigger payloads
+# are received into a buffer, that grows with the received data, so that a header alone cannot claim the memory
+FRAME_PREALLOCATION_SIZE = 1024 ** 2
+# The maximum amount of bytes, that is being received with a single call to the socket, while reading a payload
+FRAME_CHUNK_SIZE = 65536
+# The maximum amount of bytes sent within a single data frame of a streamed response or upload
+STREAM_CHUNK_SIZE = 1024 ** 2
+# The maximum size of a data frame accepted by the server, so that the data of an upload is never buffered in memory
+# beyond a few chunks
+MAX_STREAM_FRAME_SIZE = 4 * STREAM_CHUNK_SIZE
+# A file download starts with the file server announcing the amount of bytes, that are going to be sent, as an
+# unsigned 8 byte integer
+FILE_SIZE_HEADER = struct.Struct("!Q")
+# The name of the hash algorithm of the 'hashlib' module, with which the digests of downloaded files are computed
+FILE_DIGEST_ALGORITHM = "sha256"
+
+
+class ServerBusyError(ConnectionRefusedError):
+    """
+    The error, that is being sent to a client, whose connection was refused, because the server already has as many
+    connections waiting to be served as it is willing to queue
+    """
 
-class BaseUserProfile:
+
+class RateLimitError(ServerBusyError):
+    """
+    The error, that is being sent to a client, whose user sent more requests than the rate limit of the server allows
     """
-    The 'BaseUserProfile' is a (abstract) base class for all further, more specific UserProfile classes. This class
-    contains the most basic and required properties of a user profile, which are the username and the password.
 
-    Attributes:
-        username: The string user name, under which the user is registered on the server
-        password: The string password for the users account
+
+class FileIntegrityError(OSError):
     """
-    def __init__(self, username, password):
-        self.username = username
-        self.password = password
+    The error, that is being raised, when the digest of a downloaded file does not match the digest the server
+    announced for the file
+    """
+    pass
 
-    def get_password(self):
-        """
-        Returns:
-        The password of the user, the profile belongs to
-        """
-        return self.password
 
-    def get_username(self):
-        """
-        Returns:
-        The username with which the profile is connected
-        """
-        return self.username
+def send_frame(sock, payload, flags=0):
+    """
+    Sends the given payload as a single frame through the given socket. The payload is being prefixed with the frame
+    header, that contains the flags and the length of the payload, so that the receiving side knows exactly how many
+    bytes belong to the transmitted object
+    Args:
+        sock: The connected socket object, through which the frame is to be sent
+        payload: The bytes like object, that is to be sent. Can also be a list of bytes like objects, which are sent
+            one after another as the parts of a single payload, without having to be joined first
+        flags: The integer flags byte of the frame header
+
+    Returns:
+    void
+    """
+    parts = payload if isinstance(payload, list) else [payload]
+    length = get_payload_length(parts)
+    header = FRAME_HEADER.pack(flags, length)
+    # Small payloads are being sent together with the header in one call, to avoid an additional tiny TCP segment.
+    # Big payloads though are sent separately, so that the payload does not have to be copied
+    if length < FRAME_CHUNK_SIZE:
+        sock.sendall(b"".join([header] + parts))
+    else:
+        sock.sendall(header)
+        for part in parts:
+            sock.sendall(part)
+
+
+def get_payload_length(parts):
+    """
+    Args:
+        parts: The list of bytes like objects, that make up a payload
+
+    Returns:
+    The integer amount of bytes of all the parts combined
+    """
+    return sum(memoryview(part).nbytes for part in parts)
 
 
-class UserDict(dict):
+def receive_frame(sock, max_size=MAX_FRAME_SIZE):
     """
-    The UserDict class is a specialized dictionary class, that has to be created during the runtime of the server
-    program, it manages all user profiles
+    Receives a single frame from the given socket. First the header is being read to know the length of the payload,
+    then a buffer of exactly that size is being preallocated and the payload is being read directly into that buffer.
+
+    Raises:
+        ConnectionAbortedError: In case the connection was closed by the other side before the frame was complete
+        ValueError: In case the header announces a payload bigger than the maximum size
+
+    Args:
+        sock: The connected socket object, from which the frame is to be read
+        max_size: The maximum amount of bytes of the payload, MAX_FRAME_SIZE by default
+
+    Returns:
+    A tuple, whose first element is the integer flags byte of the header and the second element is the bytearray
+    containing the payload
     """
-    def __init__(self):
-        super(UserDict, self).__init__()
-        pass
+    header = receive_exactly(sock, FRAME_HEADER.size)
+    flags, length = FRAME_HEADER.unpack(header)
+    if length > max_size:
+        raise ValueError("The announced frame size of {} bytes exceeds the maximum frame size".format(length))
 
-    def user_exists(self, username):
+    payload = receive_exactly(sock, length)
+    return flags, payload
+
+
+def receive_exactly(sock, length):
+    """
+    Receives exactly the given amount of bytes from the socket. The data is being read directly into a preallocated
+    buffer with 'recv_into', so that there are no intermediate copies or concatenations of received chunks. Only up to
+    FRAME_PREALLOCATION_SIZE bytes are allocated in advance, beyond that the buffer is doubled whenever it is full.
+
+    Raises:
+        ConnectionAbortedError: In case the connection was closed before the given amount of bytes was received
+
+    Args:
+        sock: The connected socket object, from which the data is to be read
+        length: The integer amount of bytes to receive
+
+    Returns:
+    The bytearray of the given length, containing the received data
+    """
+    buffer = bytearray(min(length, FRAME_PREALLOCATION_SIZE))
+    received = 0
+    while received < length:
+        if received == len(buffer):
+            # The view has to be released before the bytearray can be resized
+            buffer.extend(bytes(min(len(buffer), length - len(buffer))))
+        with memoryview(buffer) as view:
+            chunk_size = sock.recv_into(view[received:], min(len(buffer) - received, FRAME_CHUNK_SIZE))
+        if chunk_size == 0:
+            raise ConnectionAbortedError("The connection was closed after {} of {} bytes".format(received, length))
+        received += chunk_size
+    return buffer
+
+
+async def send_frame_async(writer, payload, flags=0):
+    """
+    The asyncio counterpart to 'send_frame'. Writes the given payload as a single frame to the given stream writer and
+    waits until the writer's buffer has been drained
+    Args:
+        writer: The 'asyncio.StreamWriter' of the connection
+        payload: The bytes like object or the list of bytes like objects, that is to be sent
+        flags: The integer flags byte of the frame header
+
+    Returns:
+    void
+    """
+    parts = payload if isinstance(payload, list) else [payload]
+    writer.write(FRAME_HEADER.pack(flags, get_payload_length(parts)))
+    for part in parts:
+        writer.write(part)
+    await writer.drain()
+
+
+async def receive_frame_async(reader, max_size=MAX_FRAME_SIZE):
+    """
+    The asyncio counterpart to 'receive_frame'. Reads a single frame from the given stream reader
+
+    Raises:
+        asyncio.IncompleteReadError: In case the connection was closed before the frame was complete
+        ValueError: In case the header announces a payload bigger than the maximum size
+
+    Args:
+        reader: The 'asyncio.StreamReader' of the connection
+        max_size: The maximum amount of bytes of the payload, MAX_FRAME_SIZE by default
+
+    Returns:
+    A tuple, whose first element is the integer flags byte of the header and the second element is the bytes object
+    containing the payload
+    """
+    header = await reader.readexactly(FRAME_HEADER.size)
+    flags, length = FRAME_HEADER.unpack(header)
+    if length > max_size:
+        raise ValueError("The announced frame size of {} bytes exceeds the maximum frame size".format(length))
+
+    payload = await reader.readexactly(length)
+    return flags, payload
+
+
+def send_object(sock, obj, codec=None):
+    """
+    Serializes the given object with the given codec and sends it as a single frame through the given socket. The id
+    of the codec is being stored within the flags of the frame, so that the receiving side knows how to deserialize it
+    Args:
+        sock: The connected socket object, through which the object is to be sent
+        obj: The object to send
+        codec: The codec object to serialize the object with. The pickle codec is used by default, as it is the only
+            codec, that is understood by every piver program without a prior negotiation
+
+    Returns:
+    void
+    """
+    flags, parts = encode_object(obj, codec)
+    send_frame(sock, parts, flags=flags)
+
+
+def receive_object(sock):
+    """
+    Receives a single frame from the given socket and deserializes its payload with the codec, whose id is stored
+    within the flags of the frame
+    Args:
+        sock: The connected socket object, from which the object is to be received
+
+    Returns:
+    The deserialized object
+    """
+    flags, payload = receive_frame(sock)
+    return decode_object(flags, payload)
+
+
+def receive_stream(sock, sink=None):
+    """
+    Receives the data frames of a streamed response, until the empty frame marking the end of the stream arrives
+    Args:
+        sock: The connected socket object, from which the stream is to be received
+        sink: The callable, which is called with every received chunk of data. None to discard the data
+
+    Raises:
+        ConnectionAbortedError: In case a frame, that is not a data frame, was received
+
+    Returns:
+    The integer amount of received bytes
+    """
+    received_size = 0
+    while True:
+        flags, payload = receive_frame(sock)
+        if not flags & FRAME_DATA_FLAG:
+            raise ConnectionAbortedError("Received a response frame in the middle of a streamed response")
+        if not payload:
+            return received_size
+        received_size += len(payload)
+        if sink is not None:
+            sink(payload)
+
+
+def send_stream(sock, source):
+    """
+    Sends the chunks of data of the given source as data frames, finishing with an empty data frame
+    Args:
+        sock: The connected socket object, through which the stream is to be sent
+        source: The iterable of the bytes like objects to send. Empty chunks are skipped, as they would end the stream
+
+    Returns:
+    void
+    """
+    for chunk in source:
+        if chunk:
+            send_frame(sock, chunk, flags=FRAME_DATA_FLAG)
+    send_frame(sock, b"", flags=FRAME_DATA_FLAG)
+
+
+def iter_file_chunks(file_path, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Args:
+        file_path: The string path of the file to read
+        chunk_size: The maximum amount of bytes per chunk
+
+    Returns:
+    A generator of the bytes objects, that make up the content of the file
+    """
+    with open(file_path, "rb") as file:
+        for chunk in iter(functools.partial(file.read, chunk_size), b""):
+            yield chunk
+
+
+def encode_object(obj, codec=None):
+    """
+    Serializes the given object with the given codec
+    Args:
+        obj: The object to serialize
+        codec: The codec object to use, by default the pickle codec
+
+    Returns:
+    A tuple, whose first element is the integer flags byte for the frame and the second element the list of bytes like
+    objects, that make up the payload
+    """
+    if codec is None:
+        codec = PICKLE_CODEC
+    return codec.codec_id, codec.encode(obj)
+
+
+def decode_object(flags, payload):
+    """
+    Deserializes the payload of a frame with the codec, whose id is stored within the given flags. In case the flags
+    specify a compression, the payload is being decompressed first
+
+    Raises:
+        ValueError: In case the flags specify an unknown codec
+
+    Args:
+        flags: The integer flags byte of the frame header
+        payload: The bytes like payload of the frame
+
+    Returns:
+    The deserialized object
+    """
+    compression_id = (flags & FRAME_COMPRESSION_MASK) >> FRAME_COMPRESSION_SHIFT
+    if compression_id:
+        if compression_id not in COMPRESSIONS_BY_ID:
+            raise ValueError("The frame was compressed with the unknown compression id {}".format(compression_id))
+        payload = COMPRESSIONS_BY_ID[compression_id].decompress(payload)
+
+    codec_id = flags & FRAME_CODEC_MASK
+    if codec_id not in CODECS_BY_ID:
+        raise ValueError("The frame was serialized with the unknown codec id {}".format(codec_id))
+    return CODECS_BY_ID[codec_id].decode(payload)
+
+
+class PickleCodec:
+    """
+    The codec, that serializes the objects with the pickle module, using the default protocol. This is the codec every
+    connection starts with, as every piver program understands it.
+
+    Every codec has a unique integer 'codec_id' (0 to 15), which is stored within the frame header, and a unique string
+    'name', which is used for the negotiation. The 'encode' method turns an object into a list of bytes like objects
+    and the 'decode' method turns a bytes like payload back into the object
+    """
+    codec_id = 0
+    name = "pickle"
+
+    def encode(self, obj):
+        return [pickle.dumps(obj)]
+
+    def decode(self, payload):
+        return pickle.loads(payload)
+
+
+class Pickle5Codec(PickleCodec):
+    """
+    The codec, that serializes the objects with the pickle protocol 5, passing big binary buffers out of band. Buffers,
+    that are wrapped into a 'pickle.PickleBuffer' (directly or by the '__reduce_ex__' method of an object), are not
+    being copied into the pickled byte sequence. Their buffers are instead sent as
+    separate parts of the payload directly from their memory, and the receiving side reconstructs them from views into
+    the received payload.
+
+    PAYLOAD LAYOUT
+    unsigned 4 byte integer: the amount of out of band buffers N
+    N unsigned 8 byte integers: the lengths of the buffers
+    unsigned 8 byte integer: the length of the pickled byte sequence
+    the pickled byte sequence, followed by the raw data of the N buffers
+    """
+    codec_id = 1
+    name = "pickle5"
+
+    COUNT = struct.Struct("!I")
+    LENGTH = struct.Struct("!Q")
+
+    def encode(self, obj):
+        buffers = []
+        pickled_object = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        prefix = bytearray(self.COUNT.pack(len(raw_buffers)))
+        for raw_buffer in raw_buffers:
+            prefix += self.LENGTH.pack(raw_buffer.nbytes)
+        prefix += self.LENGTH.pack(len(pickled_object))
+        return [prefix, pickled_object] + raw_buffers
+
+    def decode(self, payload):
+        # A truncated or otherwise malformed payload is reported as a ValueError, like the pickle codec does
+        try:
+            return self._decode(payload)
+        except (struct.error, IndexError) as error:
+            raise ValueError("The pickle5 payload is malformed: {}".format(error)) from error
+
+    def _decode(self, payload):
+        view = memoryview(payload)
+        count, = self.COUNT.unpack_from(view, 0)
+        offset = self.COUNT.size
+        lengths = []
+        for index in range(count + 1):
+            length, = self.LENGTH.unpack_from(view, offset)
+            lengths.append(length)
+            offset += self.LENGTH.size
+
+        # The last length is the one of the pickled byte sequence, which comes before the buffers though
+        pickled_length = lengths.pop()
+        if offset + pickled_length + sum(lengths) > len(view):
+            raise ValueError("The pickle5 payload is shorter than the lengths of its parts")
+        pickled_object = view[offset:offset + pickled_length]
+        offset += pickled_length
+        buffers = []
+        for length in lengths:
+            buffers.append(view[offset:offset + length])
+            offset += length
+        return pickle.loads(pickled_object, buffers=buffers)
+
+
+class SchemaCodec:
+    """
+    A compact codec for the most common transfer objects. The 'LoginTransfer' and 'RequestTransfer' objects are encoded
+    by a fixed schema, that only contains the values of their attributes, without the module and class names and
+    attribute names pickle would store. Simple values (None, booleans, integers, floats, strings, bytes, lists and
+    tuples of these) are encoded by a type tag followed by their binary representation. All other values, for example
+    'LearningProcess' objects as parameters or responses, and all other transfer objects are being pickled.
+
+    PAYLOAD LAYOUT
+    1 byte object tag: OBJECT_PICKLE, OBJECT_LOGIN or OBJECT_REQUEST
+    OBJECT_PICKLE: the pickled byte sequence of the object
+    OBJECT_LOGIN: the values username, password and authentication code
+    OBJECT_REQUEST: the values authentication code, request subject, request id, parameters, response and exception
+    """
+    codec_id = 2
+    name = "schema"
+
+    OBJECT_PICKLE = 0
+    OBJECT_LOGIN = 1
+    OBJECT_REQUEST = 2
+
+    VALUE_NONE = 0
+    VALUE_TRUE = 1
+    VALUE_FALSE = 2
+    VALUE_INTEGER = 3
+    VALUE_FLOAT = 4
+    VALUE_STRING = 5
+    VALUE_BYTES = 6
+    VALUE_LIST = 7
+    VALUE_TUPLE = 8
+    VALUE_PICKLE = 9
+
+    INTEGER = struct.Struct("!q")
+    FLOAT = struct.Struct("!d")
+    LENGTH = struct.Struct("!I")
+
+    def encode(self, obj):
+        buffer = bytearray()
+        # Only the exact classes can be encoded by the schema, as subclasses might have additional attributes
+        if type(obj) is LoginTransfer:
+            buffer.append(self.OBJECT_LOGIN)
+            for value in (obj.username, obj.password, obj.authentication_code):
+                self._encode_value(buffer, value)
+        elif type(obj) is RequestTransfer:
+            buffer.append(self.OBJECT_REQUEST)
+            for value in (obj.authentication_code, obj.request_subject, obj.request_id, obj.parameters, obj.response,
+                          obj.exception):
+                self._encode_value(buffer, value)
+        else:
+            buffer.append(self.OBJECT_PICKLE)
+            return [buffer, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)]
+        return [buffer]
+
+    def decode(self, payload):
+        # A truncated or otherwise malformed payload is reported as a ValueError, like the pickle codec does
+        try:
+            return self._decode(payload)
+        except (struct.error, IndexError) as error:
+            raise ValueError("The schema payload is malformed: {}".format(error)) from error
+
+    def _decode(self, payload):
+        view = memoryview(payload)
+        object_tag = view[0]
+        if object_tag == self.OBJECT_PICKLE:
+            return pickle.loads(view[1:])
+
+        values = []
+        offset = 1
+        while offset < len(view):
+            value, offset = self._decode_value(view, offset)
+            values.append(value)
+
+        if object_tag == self.OBJECT_LOGIN:
+            username, password, authentication_code = values
+            login_transfer = LoginTransfer(username, password)
+            login_transfer.add_authentication_code(authentication_code)
+            return login_transfer
+
+        if object_tag == self.OBJECT_REQUEST:
+            authentication_code, request_subject, request_id, parameters, response, exception = values
+            request_transfer = RequestTransfer(authentication_code, request_subject, parameters, request_id=request_id)
+            request_transfer.add_response(response)
+            request_transfer.add_exception(exception)
+            return request_transfer
+
+        raise ValueError("The payload contains the unknown object tag {}".format(object_tag))
+
+    def _encode_value(self, buffer, value):
         """
-        Checks Whether or not the user exists/ is registered in the servers database
+        Appends the encoded value to the given buffer
         Args:
-            username: The string of the username in question
+            buffer: The bytearray to append the value to
+            value: The value to encode
 
         Returns:
-        The boolean value of whether or not the user exists
+        void
         """
-        # If the user existed, the username would have to be a key of the dictionary, whose assigned value would be
-        # the UserProfile of the according user
-        user_exists = username in self.keys()
-        return user_exists
+        value_type = type(value)
+        if value is None:
+            buffer.append(self.VALUE_NONE)
+        elif value is True:
+            buffer.append(self.VALUE_TRUE)
+        elif value is False:
+            buffer.append(self.VALUE_FALSE)
+        elif value_type is int and -2 ** 63 <= value < 2 ** 63:
+            buffer.append(self.VALUE_INTEGER)
+            buffer += self.INTEGER.pack(value)
+        elif value_type is float:
+            buffer.append(self.VALUE_FLOAT)
+            buffer += self.FLOAT.pack(value)
+        elif value_type is str:
+            encoded_string = value.encode("utf-8")
+            buffer.append(self.VALUE_STRING)
+            buffer += self.LENGTH.pack(len(encoded_string))
+            buffer += encoded_string
+        elif value_type is bytes:
+            buffer.append(self.VALUE_BYTES)
+            buffer += self.LENGTH.pack(len(value))
+            buffer += value
+        elif value_type is list or value_type is tuple:
+            buffer.append(self.VALUE_LIST if value_type is list else self.VALUE_TUPLE)
+            buffer += self.LENGTH.pack(len(value))
+            for item in value:
+                self._encode_value(buffer, item)
+        else:
+            pickled_value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            buffer.append(self.VALUE_PICKLE)
+            buffer += self.LENGTH.pack(len(pickled_value))
+            buffer += pickled_value
 
-    def password_valid(self, username, password):
+    def _decode_value(self, view, offset):
         """
-        Checks whether or not the given password is the correct password for the given username
+        Decodes the value starting at the given offset of the given memoryview
         Args:
-            username: The string format of the username, whose password is to be checked
-            password: The string format of the password in question
+            view: The memoryview of the payload
+            offset: The integer index, at which the encoded value starts
 
         Returns:
-        The boolean value of whether or not the specified password is actually correct for the given username
+        A tuple of the decoded value and the offset, at which the next value starts
         """
-        # The methods goes on and loads the correct password, that is stored within the user profile and then compares
-        # it to the password in question
-        user_profile = self[username]
-        stored_password = user_profile.get_password()
-        if password == stored_password:
-            return True
-        else:
-            return False
+        value_tag = view[offset]
+        offset += 1
+        if value_tag == self.VALUE_NONE:
+            return None, offset
+        if value_tag == self.VALUE_TRUE:
+            return True, offset
+        if value_tag == self.VALUE_FALSE:
+            return False, offset
+        if value_tag == self.VALUE_INTEGER:
+            return self.INTEGER.unpack_from(view, offset)[0], offset + self.INTEGER.size
+        if value_tag == self.VALUE_FLOAT:
+            return self.FLOAT.unpack_from(view, offset)[0], offset + self.FLOAT.size
+
+        length, = self.LENGTH.unpack_from(view, offset)
+        offset += self.LENGTH.size
+        if value_tag in (self.VALUE_STRING, self.VALUE_BYTES, self.VALUE_PICKLE) and offset + length > len(view):
+            raise ValueError("The payload ends within a value of {} bytes".format(length))
+        if value_tag == self.VALUE_STRING:
+            return str(view[offset:offset + length], "utf-8"), offset + length
+        if value_tag == self.VALUE_BYTES:
+            return view[offset:offset + length].tobytes(), offset + length
+        if value_tag == self.VALUE_PICKLE:
+            return pickle.loads(view[offset:offset + length]), offset + length
+        if value_tag == self.VALUE_LIST or value_tag == self.VALUE_TUPLE:
+            items = []
+            for index in range(length):
+                item, offset = self._decode_value(view, offset)
+                items.append(item)
+            return (items if value_tag == self.VALUE_LIST else tuple(items)), offset
+
+        raise ValueError("The payload contains the unknown value tag {}".format(value_tag))
+
+
+PICKLE_CODEC = PickleCodec()
+# All the codecs supported by this module, by their names and by their ids
+CODECS = {codec.name: codec for codec in (PICKLE_CODEC, Pickle5Codec(), SchemaCodec())}
+CODECS_BY_ID = {codec.codec_id: codec for codec in CODECS.values()}
+
+
+def compress_payload(flags, parts, compression):
+    """
+    Compresses the serialized payload of a frame with the given compression
+    Args:
+        flags: The integer flags byte of the frame, containing the codec id
+        parts: The list of bytes like objects, that make up the serialized payload
+        compression: The compression object to use
 
+    Returns:
+    A tuple of the flags byte, now also containing the id of the compression and the list with the compressed payload
+    """
+    compressed_payload = compression.compress(parts)
+    flags = (flags & ~FRAME_COMPRESSION_MASK) | (compression.compression_id << FRAME_COMPRESSION_SHIFT)
+    return flags, [compressed_payload]
 
-class BaseTransferObject:
 
-    def __init__(self, authentication_code):
-        self.authentication_code = authentication_code
+class ZlibCompression:
+    """
+    The compression of frame payloads with the zlib module. It is fast and already reduces the size of the pickled
+    schedules and histories considerably.
 
-    def get_authentication(self):
-        return self.authentication_code
+    Every compression has a unique integer 'compression_id' (1 to 3), which is stored within the frame header, and a
+    unique string 'name', which is used for the negotiation. The 'compress' method compresses a list of bytes like
+    objects into a single bytes object and the 'decompress' method reverses that. The decompression is limited to
+    MAX_FRAME_SIZE bytes, so that a small malicious payload cannot make the program allocate huge amounts of memory
+    """
+    compression_id = 1
+    name = "zlib"
 
+    def __init__(self, level=6):
+        self.level = level
 
-class LoginTransfer:
+    def compress(self, parts):
+        compressor = zlib.compressobj(self.level)
+        compressed_parts = [compressor.compress(part) for part in parts]
+        compressed_parts.append(compressor.flush())
+        return b"".join(compressed_parts)
+
+    def decompress(self, payload):
+        decompressor = zlib.decompressobj()
+        data = decompressor.decompress(payload, MAX_FRAME_SIZE)
+        if decompressor.unconsumed_tail:
+            raise ValueError("The decompressed frame exceeds the maximum frame size")
+        return data
+
+
+class LzmaCompression:
     """
-    Objects of this class are being used to establish for the first communication attempt between a client program and
-    the server. By sending an object of this type the user identifies himself with his username and his password to
-    request an authentication code, that can be used as an temporary identifier for all further communication.
-    The authentication code exists, so that the server knows which user profile to activate/edit upon receiving a
-    request.
+    The compression of frame payloads with the lzma module. It compresses better than zlib, but costs considerably more
+    CPU time, which pays off for big responses sent to clients with slow connections
+    """
+    compression_id = 2
+    name = "lzma"
 
-    Attributes:
-        username: The string of the username of the user, requesting the authentication code
-        password: The string of the password of the user requesting the authentication code
-        authentication_code: Is None at first (upon creation) but gets set to the string of the authentication code
-            by the server and maintains that value, when being sent back to the user
+    def __init__(self, preset=1):
+        self.preset = preset
+
+    def compress(self, parts):
+        compressor = lzma.LZMACompressor(preset=self.preset)
+        compressed_parts = [compressor.compress(part) for part in parts]
+        compressed_parts.append(compressor.flush())
+        return b"".join(compressed_parts)
+
+    def decompress(self, payload):
+        decompressor = lzma.LZMADecompressor()
+        data = decompressor.decompress(payload, MAX_FRAME_SIZE)
+        if not decompressor.eof:
+            raise ValueError("The decompressed frame exceeds the maximum frame size")
+        return data
+
+
+# All the compressions supported by this module, by their names and by their ids
+COMPRESSIONS = {compression.name: compression for compression in (ZlibCompression(), LzmaCompression())}
+COMPRESSIONS_BY_ID = {compression.compression_id: compression for compression in COMPRESSIONS.values()}
+
+
+class CompressionStatistics:
     """
-    def __init__(self, username, password):
-        # Assigning the given username and password as object attributes, so they are stored during the pickled socket
-        # transfer
-        self.username = username
-        self.password = password
-        # After the object has been created by the user side of the program it is being sent to the server, where a
-        # authentication code is being created by the authentication guard and then added as attribute to this object
-        # then the object is being sent back to the user, where the authentication code can be stored and used
-        self.authentication_code = None
+    Keeps track of how well the compression of the responses works, separately for every requested method. For every
+    method the amount of compressed responses, the amount of bytes before and after the compression and the time spent
+    compressing are being summed up. The statistics are updated by multiple handler threads, so they are secured by a
+    lock.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        # The dictionary with the method names as keys and lists [count, original bytes, compressed bytes, seconds] as
+        # values
+        self.methods = {}
 
-    def get_username(self):
+    def record(self, method_name, original_size, compressed_size, duration):
         """
+        Adds a compressed response to the statistics
+        Args:
+            method_name: The string name of the method, whose response was compressed
+            original_size: The integer amount of bytes before the compression
+            compressed_size: The integer amount of bytes after the compression
+            duration: The float amount of seconds the compression took
+
         Returns:
-        The string of the username, of the user, that sent the login request
+        void
         """
-        return self.username
-
-    def get_password(self):
+        with self.lock:
+            entry = self.methods.setdefault(method_name, [0, 0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += original_size
+            entry[2] += compressed_size
+            entry[3] += duration
+
+    def get_statistics(self):
         """
         Returns:
-        The string of the password of the user
+        A dictionary with the method names as keys and dictionaries with the keys 'count', 'original_bytes',
+        'compressed_bytes', 'ratio' (compressed bytes per original byte) and 'seconds_per_megabyte' (CPU time spent
+        per megabyte of original data) as values
         """
-        return self.password
+        with self.lock:
+            methods = {method_name: list(entry) for method_name, entry in self.methods.items()}
+
+        statistics = {}
+        for method_name, (count, original_size, compressed_size, duration) in methods.items():
+            statistics[method_name] = {
+                "count": count,
+                "original_bytes": original_size,
+                "compressed_bytes": compressed_size,
+                "ratio": compressed_size / original_size if original_size else 1.0,
+                "seconds_per_megabyte": duration / original_size * 1024 ** 2 if original_size else 0.0
+            }
+        return statistics
+
+
+class ServerStatistics:
+    """
+    Keeps track of the requests of the server per method: the amount of requests, the amount of failed requests, the
+    bytes received and sent and the distribution of the latencies, from which the percentiles are computed.
+    As every request is recorded, the recording has to be cheap even with many handler threads. The counters are thus
+    split into STRIPE_COUNT stripes, each with a lock of its own, and every thread always records into the same stripe,
+    so that threads rarely wait for each other. Only reading the statistics merges the stripes.
+    The latencies are counted within a histogram of logarithmic buckets, BUCKETS_PER_DOUBLING buckets for every doubling
+    of the latency starting at MIN_LATENCY seconds, so that recording is a single increment and the percentiles are
+    accurate to about 20 percent, no matter how many requests were recorded.
 
-    def set_password(self, password):
+    Attributes:
+        stripes: The list of tuples of a lock and the dict with the method names as keys and lists
+            [count, errors, bytes in, bytes out, seconds, max seconds, histogram] as values
+        start_time: The time, at which the statistics were created
+        dump_path: The string path of the file, to which the statistics are dumped periodically or None
+        dump_interval: The amount of seconds between two dumps
+    """
+    STRIPE_COUNT = 16
+    BUCKETS_PER_DOUBLING = 4
+    MIN_LATENCY = 0.000001
+    # Covering the latencies from one microsecond up to about 18 minutes
+    BUCKET_COUNT = 30 * BUCKETS_PER_DOUBLING
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self):
+        self.stripes = [(threading.Lock(), {}) for index in range(self.STRIPE_COUNT)]
+        self.stripe_counter = itertools.count()
+        self.local = threading.local()
+        self.start_time = time.time()
+        self.dump_path = None
+        self.dump_interval = None
+        self.dump_thread = None
+        self.dump_stop_event = threading.Event()
+
+    def record(self, method_name, duration, bytes_in, bytes_out, failed=False):
         """
-        Sets the password of the user profile to the new password
+        Adds a request to the statistics
         Args:
-            password: The string password
+            method_name: The string name of the requested method
+            duration: The float amount of seconds from receiving the request to sending the response
+            bytes_in: The integer amount of bytes received for the request
+            bytes_out: The integer amount of bytes sent as the response
+            failed: The boolean value of whether the request failed
 
         Returns:
         void
         """
-        self.password = password
+        bucket = self.get_bucket(duration)
+        lock, methods = self._get_stripe()
+        with lock:
+            entry = methods.get(method_name)
+            if entry is None:
+                entry = [0, 0, 0, 0, 0.0, 0.0, [0] * self.BUCKET_COUNT]
+                methods[method_name] = entry
+            entry[0] += 1
+            entry[1] += failed
+            entry[2] += bytes_in
+            entry[3] += bytes_out
+            entry[4] += duration
+            if duration > entry[5]:
+                entry[5] = duration
+            entry[6][bucket] += 1
+
+    def _get_stripe(self):
+        """
+        Returns:
+        The tuple of the lock and the dict of the stripe of the current thread. The threads are assigned to the stripes
+        in turns, the first time they record
+        """
+        stripe_index = getattr(self.local, "stripe_index", None)
+        if stripe_index is None:
+            stripe_index = next(self.stripe_counter) % self.STRIPE_COUNT
+            self.local.stripe_index = stripe_index
+        return self.stripes[stripe_index]
+
+    @classmethod
+    def get_bucket(cls, duration):
+        """
+        Returns:
+        The integer index of the histogram bucket of the given latency in seconds
+        """
+        if duration <= cls.MIN_LATENCY:
+            return 0
+        bucket = int(math.log2(duration / cls.MIN_LATENCY) * cls.BUCKETS_PER_DOUBLING)
+        return min(bucket, cls.BUCKET_COUNT - 1)
 
-    def get_authentication(self):
+    @classmethod
+    def get_bucket_limit(cls, bucket):
         """
-        Notes:
-            This method should only by called, once the object was sent back from the server, as the authentication code
-            property of such an object is None, until one is being created and added by the server.
         Returns:
-        The string format of the authentication code, that was created for the user.
+        The float upper limit of the latencies in seconds counted within the given bucket
         """
-        return self.authentication_code
+        return cls.MIN_LATENCY * 2 ** ((bucket + 1) / cls.BUCKETS_PER_DOUBLING)
 
-    def add_authentication_code(self, authentication_code):
+    def get_statistics(self):
         """
-        Adds the authentication code, that was created for the user with the specified username and password, as the
-        authentication_code property of the object
+        Returns:
+        A dictionary with the keys 'uptime' (seconds), 'requests' (the total amount), 'requests_per_second' and
+        'methods', which is a dictionary with the method names as keys and dictionaries with the keys 'count',
+        'errors', 'bytes_in', 'bytes_out', 'mean', 'max' and the percentiles 'p50', 'p95' and 'p99' (all latencies
+        in seconds) as values
+        """
+        # Merging the stripes into a single entry per method
+        methods = {}
+        for lock, stripe_methods in self.stripes:
+            with lock:
+                for method_name, entry in stripe_methods.items():
+                    merged_entry = methods.get(method_name)
+                    if merged_entry is None:
+                        methods[method_name] = [entry[0], entry[1], entry[2], entry[3], entry[4], entry[5],
+                                                list(entry[6])]
+                        continue
+                    for index in range(5):
+                        merged_entry[index] += entry[index]
+                    merged_entry[5] = max(merged_entry[5], entry[5])
+                    merged_entry[6] = [count + other for count, other in zip(merged_entry[6], entry[6])]
+
+        uptime = time.time() - self.start_time
+        total_count = 0
+        statistics = {}
+        for method_name, (count, errors, bytes_in, bytes_out, duration, max_duration, histogram) in methods.items():
+            total_count += count
+            method_statistics = {
+                "count": count,
+                "errors": errors,
+                "bytes_in": bytes_in,
+                "bytes_out": bytes_out,
+                "mean": duration / count,
+                "max": max_duration
+            }
+            for percentile in self.PERCENTILES:
+                method_statistics["p{}".format(percentile)] = self._get_percentile(histogram, count, percentile,
+                                                                                   max_duration)
+            statistics[method_name] = method_statistics
+
+        return {
+            "uptime": uptime,
+            "requests": total_count,
+            "requests_per_second": total_count / uptime if uptime > 0 else 0.0,
+            "methods": statistics
+        }
+
+    def _get_percentile(self, histogram, count, percentile, max_duration):
+        """
+        Returns:
+        The float latency in seconds, below which the given percentile of the requests lies, estimated by the upper
+        limit of the bucket, in which it falls, but never more than the maximum latency
+        """
+        rank = count * percentile / 100
+        cumulative_count = 0
+        for bucket, bucket_count in enumerate(histogram):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank and cumulative_count > 0:
+                return min(self.get_bucket_limit(bucket), max_duration)
+        return max_duration
+
+    def dump(self, file_path, extra=None):
+        """
+        Writes the statistics as JSON to the given file. The file is written to a temporary file first and then
+        replaces the old one, so that readers never see a partial file
         Args:
-            authentication_code: The string format of the authentication code, created by the authentication guard
+            file_path: The string path of the file
+            extra: A dict of additional entries to add to the statistics or None
 
         Returns:
         void
         """
-        self.authentication_code = authentication_code
-
+        statistics = self.get_statistics()
+        statistics["time"] = time.time()
+        if extra:
+            statistics.update(extra)
+        temporary_path = "{}.tmp".format(file_path)
+        with open(temporary_path, "w") as file:
+            json.dump(statistics, file, indent=4)
+        os.replace(temporary_path, file_path)
+
+    def start_dumping(self, file_path, interval, extra=None):
+        """
+        Starts a daemon thread, that dumps the statistics to the given file every 'interval' seconds, until
+        'stop_dumping' is called
+        Args:
+            file_path: The string path of the file
+            interval: The amount of seconds between two dumps
+            extra: A callable returning a dict of additional entries for every dump or None
 
-class RequestTransfer(BaseTransferObject):
+        Returns:
+        void
+        """
+        self.dump_path = file_path
+        self.dump_interval = interval
+        self.dump_stop_event.clear()
+        self.dump_thread = threading.Thread(target=self._dump_periodically, args=(extra,), name="PiverStatistics",
+                                            daemon=True)
+        self.dump_thread.start()
+
+    def stop_dumping(self):
+        """
+        Stops the periodic dumps, after dumping the statistics one last time
+        Returns:
+        void
+        """
+        if self.dump_thread is None:
+            return
+        self.dump_stop_event.set()
+        self.dump_thread.join()
+        self.dump_thread = None
+
+    def _dump_periodically(self, extra):
+        stopped = False
+        while not stopped:
+            stopped = self.dump_stop_event.wait(self.dump_interval)
+            try:
+                self.dump(self.dump_path, extra=None if extra is None else extra())
+            except OSError:
+                # The statistics are not worth stopping for, the next dump might succeed again
+                pass
+
+
+class CachedResponse:
     """
-    The 'RequestTransfer' objects, or request objects in short, are created by the client side program and then sent
-    to the server. They are created with the intention of triggering some sort of action and a response within the
-    server. This requested action of the server side program is being specified by passing the request object the
-    string name of a method, more specifically a method of the handler object, that is created by the server once the
-    request was received and then handles the incoming communication attempt.
-    If a developer now wanted to add a new remote action to the project that uses piver servers the functionality would
-    only have to be implemented as a method of the handler object and then a request object with the methods name
-    would have to be sent to the server. The request objects also requires the 'parameter_list' parameter, which is
-    a list of all the positional parameters, that should additionally be added to the method call of the handler.
-    Once the action within the server side program has been successfully executed, a response of some sort will have
-    been created. This response is then added to the request object and the object is being send back to the client,
-    where the response can be read.
+    A response, that was taken from the 'ResponseCache' and is thus already serialized. It is sent as it is, instead of
+    being serialized again
 
     Attributes:
-        authentication_code: The string authentication code of the client object, that created the request object
-        request_subject: the string method name of the method of the handler object to be called
-        parameter_list: The list of all the positional parameters to be added to the method call
+        flags: The integer flags byte of the frame
+        payload: The bytes payload of the frame
     """
-    def __init__(self, authentication_code, request_subject, parameter_list):
-        super(RequestTransfer, self).__init__(authentication_code)
-        self.request_subject = request_subject
-        self.parameters = parameter_list
-        self.response = None
+    def __init__(self, flags, payload):
+        self.flags = flags
+        self.payload = payload
 
-    def add_response(self, response):
+
+class ResponseCache:
+    """
+    Caches the serialized responses of the remote methods, that are marked as cacheable, so that repeating a request
+    neither calls the method nor serializes the response again. The entries are kept per user and are keyed by the
+    authentication code, the method name, the parameters and the codec and compression of the connection, as all of
+    them end up within the serialized bytes. Whenever a user calls a mutating method, all the entries of that user are
+    dropped. To not store a response, that was computed while a mutating method was running, every user has a
+    generation counter, which is increased by every invalidation: a response is only stored, in case the generation did
+    not change since the method was called.
+    The entries expire after 'max_age' seconds, so that changes, that are not made through mutating remote methods,
+    are picked up eventually, and the least recently used entries are dropped once the cache exceeds 'max_size' bytes.
+
+    Notes:
+        The cache is kept per process, so with a 'PreforkPiverServer' a mutating call only invalidates the cache of
+        the worker, that processed it, just like it only changes the user dict of that worker
+
+    Attributes:
+        max_size: The maximum amount of bytes of all cached payloads
+        max_age: The amount of seconds, after which an entry expires
+        entries: The OrderedDict with the keys as keys and the tuples (flags, payload, expiration time) as values, in
+            the order of their last use
+        user_keys: The dict with the usernames as keys and the sets of the keys of their entries as values
+        generations: The dict with the usernames as keys and their integer generations as values
+        size: The integer amount of bytes of all cached payloads
+        hit_count: The integer amount of requests answered from the cache
+        miss_count: The integer amount of cacheable requests, that were not in the cache
+        lock: The threading.Lock securing the cache
+    """
+    DEFAULT_MAX_SIZE = 64 * 1024 ** 2
+    DEFAULT_MAX_AGE = 300
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, max_age=DEFAULT_MAX_AGE):
+        self.max_size = max_size
+        self.max_age = max_age
+        self.entries = collections.OrderedDict()
+        self.user_keys = {}
+        self.generations = {}
+        self.size = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(username, request_transfer, codec, compression):
         """
-        The response to the initial RequestTransfer object sent to the server does not contain a response. Its
-        'response' property is empty. The response is being created by the server side program, then added to the object
-        and the object is being sent back to the client, now containing the response.
-        This method is for the server to add the generated response to the object.
         Args:
-            response: whatever object the server uses as a response to the initial request
+            username: The string username of the user, that sent the request
+            request_transfer: The 'RequestTransfer' object of the request
+            codec: The codec of the connection
+            compression: The compression of the connection or None
 
         Returns:
-        void
+        The hashable key of the response to the request or None, in case the parameters are not iterable or not
+        hashable
         """
-        self.response = response
-
-    def get_method_name(self):
+        compression_name = None if compression is None else compression.name
+        try:
+            key = (username, request_transfer.get_authentication(), request_transfer.get_method_name(),
+                   tuple(request_transfer.get_parameter_list()), codec.name, compression_name)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get_generation(self, username):
         """
-        The RequestTransfer object is being created by the client side program, it will contain the information about
-        the 'request_subject', which essentially is the name of the method of the RequestHandler object, that is to be
-        called within the server side program.
-        Therefore this method returns exactly this method name, which is the subject of the request
         Returns:
-        The string of the method name
+        The integer generation of the entries of the given user, to be passed to 'store' later on
         """
-        return self.request_subject
+        with self.lock:
+            return self.generations.get(username, 0)
 
-    def get_parameter_list(self):
+    def lookup(self, key):
         """
-        Since many of the RequestHandlers methods processes are dependant on additional parameters, those parameters
-        can also be passed to the server by putting them (IN ORDER) into a parameter list, that is also being
-        transported with the RequestTransfer object.
+        Args:
+            key: The key of the response
+
         Returns:
-        The list, containing all the POSITIONAL arguments of the method to call
+        The 'CachedResponse' or None, in case there is no entry or it has expired
         """
-        return self.parameters
-
-    def get_response(self):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[2] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.miss_count += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hit_count += 1
+            return CachedResponse(entry[0], entry[1])
+
+    def store(self, key, generation, flags, parts):
         """
-        The response to the initial RequestTransfer object sent to the server does not contain a response. Its
-        'response' property is empty. The response is being created by the server side program, then added to the object
-        and the object is being sent back to the client, now containing the response.
-        This method returns the value of the objects attribute 'response'. Should only be called after the object came
-        back from the server, as the attribute will be None before.
+        Stores a serialized response, unless the entries of the user were invalidated after the given generation was
+        obtained or the response is bigger than the whole cache
+        Args:
+            key: The key of the response, as returned by 'get_key'
+            generation: The generation of the user from before the method was called
+            flags: The integer flags byte of the frame
+            parts: The list of bytes like objects of the payload
+
         Returns:
-        Whatever object the server created as response to the initial request
+        void
         """
-        return self.response
-
+        payload = b"".join(parts)
+        if len(payload) > self.max_size:
+            return
+        username = key[0]
+        with self.lock:
+            if self.generations.get(username, 0) != generation:
+                return
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (flags, payload, time.monotonic() + self.max_age)
+            self.user_keys.setdefault(username, set()).add(key)
+            self.size += len(payload)
+            # Dropping the least recently used entries, until the cache fits again
+            while self.size > self.max_size:
+                self._remove(next(iter(self.entries)))
+
+    def invalidate(self, username):
+        """
+        Drops all the entries of the given user and starts a new generation for the user
+        Args:
+            username: The string username
 
-class PiverClient:
-    """
-    The base class for all further, individual client classes. The client object is an object that has to be created and
-    alive during the runtime of the client side program of a piver project. The client essentially manages all
-    communication with the server and is supposed to wrap more complex interactions between client and server into
-    simple methods.
-    To really use a client object it has to be created and then logged into the server system by calling the 'login'
-    method with the username and password of the registered user, by doing so the client obtains a authentication
-    code, that is required by any tranfer object sent through the socket connection, so that the server can identify
-    which request to execute for which user, without the client having to transmit the sensitive login information.
-    The client requires the server ip and the server to establish socket connections
+        Returns:
+        void
+        """
+        with self.lock:
+            self.generations[username] = self.generations.get(username, 0) + 1
+            for key in list(self.user_keys.get(username, ())):
+                self._remove(key)
+
+    def _remove(self, key):
+        flags, payload, expiration_time = self.entries.pop(key)
+        self.size -= len(payload)
+        user_keys = self.user_keys[key[0]]
+        user_keys.discard(key)
+        if not user_keys:
+            del self.user_keys[key[0]]
+
+    def get_statistics(self):
+        """
+        Returns:
+        A dictionary with the keys 'entries', 'size' (bytes), 'hits', 'misses' and 'hit_ratio'
+        """
+        with self.lock:
+            requests = self.hit_count + self.miss_count
+            return {
+                "entries": len(self.entries),
+                "size": self.size,
+                "hits": self.hit_count,
+                "misses": self.miss_count,
+                "hit_ratio": self.hit_count / requests if requests else 0.0
+            }
+
+
+class TokenBucket:
     """
-    def __init__(self, server_ip, server_port):
-        self.server_ip = server_ip
-        self.server_port = server_port
-        self.authentication_code = None
+    A token bucket, that allows a steady rate of events with bursts. The bucket holds up to 'capacity' tokens and is
+    refilled with 'rate' tokens per second. Every event takes tokens from the bucket and is only allowed, in case there
+    are enough tokens. Instead of refilling the bucket continuously, the tokens are computed from the time passed,
+    whenever the bucket is used
 
-    def login(self, username, password):
+    Attributes:
+        rate: The float amount of tokens added per second
+        capacity: The float maximum amount of tokens
+        tokens: The float amount of tokens at the time of the last update
+        update_time: The monotonic time of the last update
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.update_time = time.monotonic()
+
+    def _update(self):
+        current_time = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (current_time - self.update_time) * self.rate)
+        self.update_time = current_time
+
+    def take(self, tokens=1):
         """
-        This method attempts to log into the server using the users data, that is specified by the username and the
-        password. A LoginTransfer object is being sent to the server and in response a authentication code is being
-        created and sent back as a response. The authentication code is then being assigned as the value to the clients
-        'authentication_code' property and also returned. The authentication code is being used as a temporary
-        identifier, that has to be sent with every following communication with the server, so the server knows
-        which request belongs to which user and which users profile is to be modified.
+        Takes the given amount of tokens from the bucket, in case there are enough. Not thread safe on its own
+        Args:
+            tokens: The amount of tokens the event costs
 
-        Raises:
-            ConnectionRefusedError: In case the username is not registered in the server database
-            PermissionError: In case the password is not correct
+        Returns:
+        0 in case the tokens were taken, otherwise the float amount of seconds until there will be enough tokens
+        """
+        self._update()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0
+        return (tokens - self.tokens) / self.rate
 
+    def get_wait_time(self, tokens=1):
+        """
+        Checks whether the given amount of tokens could be taken, without taking them. Not thread safe on its own
         Args:
-            username: The string of the username
-            password: The string of the password
+            tokens: The amount of tokens the event costs
 
         Returns:
-        The string of the authentication code
+        0 in case there are enough tokens, otherwise the float amount of seconds until there will be enough tokens
         """
-        # Creating the 'LoginTransfer' object, that signals the server, that the sent request is an attempted login
-        # for obtaining an authentication code for the specified user.
-        login_transfer = LoginTransfer(username, password)
-        # Sending the object and getting the response from the send method. The response is supposed to be the very
-        # same object, that was sent, only with the now created authentication code added
-        login_transfer_response = self.send(login_transfer)
-        authentication_code = login_transfer_response.get_authetication()
-        self.authentication_code = authentication_code
-        return authentication_code
+        self._update()
+        if self.tokens >= tokens:
+            return 0
+        return (tokens - self.tokens) / self.rate
 
-    def download_file(self, relative_server_path, save_path, blocking=False):
+    def is_full(self):
         """
-        Downloads a file from the server.
-        Sends a request for the file download, which triggers the server to check for the existance of the file,
-        specified by 'relative_server_path'. If the file exists the server acquires an open port and starts a
-        'FileSendServer' on it and sends the port of the server as a response back to the client.
-        The client then starts a 'ClientFileDownloader' object(thread) that automatically downloads the file and saves
-        it as specified by 'save_path'. The method can be blocking, meaning it waits till the download is finished, or
-        starts it and lets it run as a thread
-        Args:
-            relative_server_path: The string path that specifies the file to download. The path is supposed to be
-                relative to the servers main folder, meaning that files, that dont belong to the server cannot be
-                downloaded.
-            save_path: The string path to where the file is supposed to the saved to. In case the path does not
-                refer to an already existing file, the file is being created.
-            blocking: The boolean value of whether or not the method is supposed to wait till the download is finished
-                or not
         Returns:
-        The string path of the saved file
+        The boolean value of whether the bucket is full, which means it has not been used for a while
         """
-        # Requesting the 'download_file' method of the server, that checks for the existence of the file and opens a
-        # FileSendServer for the requested file in case the path was correct
-        file_server_port = self.request("download_file", relative_server_path)
-        # Creating a downloader object, that automatically downloads the file from the FileSendServer, that has been
-        # started at the server side program
-        downloader = SimpleClientFileDownloader(self.server_ip, file_server_port, save_path)
-        downloader.start()
-        if blocking:
-            # Waiting for the receiving process to finish in case the method was set to be blocking
-            downloader.wait()
+        self._update()
+        return self.tokens >= self.capacity
 
-        # returning the full file path of the received file
-        return save_path
 
-    def request(self, method_name, parameter_list):
-        """
-        This method will create a 'RequestTransfer' object and send it to the server, using the authentication of the
-        client object (An error will be raised in case no authentication has been obtained up to call of this method).
-        The request system works by specifying a method of the servers RequestHandler object by its string name, that
-        is supposed to be executed in the server side program. The 'parameter_list' parameter gives the option to pass
-        the additional parameters to the method of the servers handler object.
-        Once the handler object successfully executed the requested method, a response of some sort will have been
-        created and is then being sent back to the client and this response is also being returned by this method
+class RateLimiter:
+    """
+    Limits the rate of the requests of every user with a token bucket of its own. Every user may send 'rate' requests
+    per second on average and up to 'burst' requests at once. The buckets of the users, that have not sent any requests
+    for long enough to fill their buckets again, are dropped every PRUNE_INTERVAL requests, so that the amount of
+    buckets stays bounded by the amount of active users.
+
+    Attributes:
+        rate: The float amount of requests per second, that every user may send on average
+        burst: The maximum amount of requests, that a user may send at once
+        buckets: The dict with the usernames as keys and the 'TokenBucket' objects as values
+        request_count: The integer amount of requests, that tokens were taken for
+        limited_count: The integer amount of those requests, that were rejected
+        lock: The threading.Lock securing the buckets
+    """
+    PRUNE_INTERVAL = 4096
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = max(1, 2 * rate) if burst is None else burst
+        self.buckets = {}
+        self.request_count = 0
+        self.limited_count = 0
+        self.lock = threading.Lock()
 
+    def acquire(self, username, cost=1):
+        """
+        Takes the tokens for a request of the given user
         Args:
-            method_name: The string name of the method of the handler object to be called
-            parameter_list: The list containing the positional arguments to this method in order
+            username: The string username of the user
+            cost: The amount of tokens the request costs, for example the amount of requests of a batch. Costs
+                exceeding the burst are capped at the burst, so that the request is possible at all
 
         Returns:
-        Whatever the response to the specific request was
+        0 in case the request is allowed, otherwise the float amount of seconds after which it would be
         """
-        # Calling the 'check_login' method to check whether or not the client object already obtained the necessary
-        # authentication code, raises an exception in the case there is no authentication code yet
-        self.check_login()
-        # Creating the 'RequestTransfer' object, to send to the server
-        request_transfer = RequestTransfer(self.authentication_code, method_name, parameter_list)
-        request_transfer_response = self.send(request_transfer)
-        # returning the response
-        return request_transfer_response.get_response()
-
-    def send(self, obj, timeout=10):
+        with self.lock:
+            self.request_count += 1
+            if self.request_count % self.PRUNE_INTERVAL == 0:
+                self._prune()
+            bucket = self.buckets.get(username)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self.buckets[username] = bucket
+            wait_time = bucket.take(min(cost, self.burst))
+            if wait_time:
+                self.limited_count += 1
+            return wait_time
+
+    def get_wait_time(self, username, cost=1):
         """
-        Creates a socket, that connects to the PiverServer, by using the IP and the port attributes of the object and
-        then sends the given object pickled, as a byte sequence through the given socket to the server. The method will
-        then instantly wait for the server to make a response through the very same socket connection and returns the
-        response as a BYTE SEQUENCE.
-
-        Raises:
-            socket.SO_ERROR: The socket error is being fetched by a try except statement, so that the socket can be
-                properly closed first, but the very same error is then raised again, so that the higher level
-                functionality can handle its occurrance properly
-            Exception: The socket connection works by the user sending a specific transfer object to accomplish/trigger
-                a specific task within the server side program, which in turn then sends back a response.
-                In case the initial request was faulty though the server would send back some sort of Exception object,
-                describing the error, that occured during the processing of the request.
+        Checks whether a request of the given user would be allowed, without taking any tokens. The check is not
+        counted within the statistics, only 'acquire' is
         Args:
-            obj: The object to be send through the socket to the server
-            timeout: The amount of time in seconds, after which the connect should be terminated
+            username: The string username of the user
+            cost: The amount of tokens the request would cost
 
         Returns:
-        A byte sequence, that has been received in response to the sent object. Byte sequence is most likely a
-        pickled object.
+        0 in case the request would be allowed, otherwise the float amount of seconds after which it would be
         """
-        # Pickling the passed object into a byte sequence, setting up the socket with the server information given from
-        # the objects attributes and then connects to the server
-        pickled_object = pickle.dumps(obj)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        server_tuple = self._get_server_tuple()
-        sock.connect(server_tuple)
+        with self.lock:
+            bucket = self.buckets.get(username)
+            if bucket is None:
+                return 0
+            return bucket.get_wait_time(min(cost, self.burst))
 
-        # Sends the pickled object through the socket and then instantly waits for the server response
-        try:
-            sock.sendall(pickled_object)
-            response = sock.recv(8192)
-        except socket.SO_ERROR as error:
-            sock.close()
-            raise error
+    def _prune(self):
+        for username in [username for username, bucket in self.buckets.items() if bucket.is_full()]:
+            del self.buckets[username]
 
-        sock.close()
-        # In case the received object was an exception, indication that an error occurred during the processing of the
-        # initial request, the exception will be risen
-        self._raise_exception(response)
+    def get_statistics(self):
+        """
+        Returns:
+        A dictionary with the keys 'users' (the amount of users with a bucket), 'requests' and 'limited'
+        """
+        with self.lock:
+            return {"users": len(self.buckets), "requests": self.request_count, "limited": self.limited_count}
 
-        return response
 
-    def check_login(self):
+class FairScheduler:
+    """
+    Limits the amount of requests, that are processed at the same time, and decides which of the waiting requests is
+    processed next by weighted fair queuing between the users. Every user has a virtual finish time, which every
+    request advances by its cost divided by the weight of the user. The waiting request with the earliest finish time
+    is processed next, so that the users share the processing slots in proportion to their weights, no matter how many
+    requests a single user sends. A user, that was idle, starts at the current virtual time and thus neither gains
+    credit while being idle nor has to wait for the backlog of the others. A request, that gives up waiting, gives
+    back its share of the finish time of the user.
+    Threads wait for a slot with 'acquire', coroutines with 'acquire_async', both share the same queue.
+
+    Attributes:
+        slots: The maximum amount of requests processed at the same time
+        weights: The dict with the usernames as keys and their float weights as values. Users, that are not within
+            the dict, have the default weight
+        default_weight: The float weight of the users, that are not within the weights
+        available: The integer amount of free slots
+        queue: The heap of the waiting requests as lists [finish time, sequence number, start time, wake, state,
+            username, cost share], wake being the callable, that is called once the request was granted a slot
+        finish_times: The dict with the usernames as keys and their virtual finish times as values
+        virtual_time: The float virtual time, which is the start time of the request, that was granted last
+        lock: The threading.Lock securing the scheduler
+    """
+    # The states of a waiting request
+    WAITING = 0
+    GRANTED = 1
+    CANCELLED = 2
+    # The amount of requests after which the finish times of the idle users are dropped
+    PRUNE_INTERVAL = 4096
+
+    def __init__(self, slots, weights=None, default_weight=1.0):
+        self.slots = slots
+        self.weights = {} if weights is None else dict(weights)
+        self.default_weight = default_weight
+        self.available = slots
+        self.queue = []
+        self.finish_times = {}
+        self.virtual_time = 0.0
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+
+    def acquire(self, username, cost=1, timeout=None):
         """
-        Checks whether the client object is logged into the server system or not. More specifically: Checking whether
-        the client object posses an authentication code, that is needed for all communication with the server.
-        Raises a PermissionError in case the client is not logged in.
-        This method is supposed to be called before calling any other method, that sends transfer objects, that rely on
-        valid authentication codes.
+        Waits for a processing slot for a request of the given user
+        Args:
+            username: The string username of the user
+            cost: The cost of the request, for example the amount of requests of a batch
+            timeout: The maximum amount of seconds to wait or None to wait forever
+
         Returns:
-        void
+        The boolean value of whether a slot was acquired. In that case 'release' has to be called once the request
+        was processed
         """
-        if not self.is_logged_in():
-            error_message = "The client does not have a authentication code. Log in first!"
-            raise PermissionError(error_message)
+        event = threading.Event()
+        entry = self._enqueue(username, cost, event.set)
+        if entry is None or event.wait(timeout):
+            return True
+        return self._cancel(entry)
 
-    def is_logged_in(self):
+    async def acquire_async(self, username, cost=1, timeout=None):
         """
+        The asyncio counterpart to 'acquire'. Waits for a processing slot without blocking the event loop
+        Args:
+            username: The string username of the user
+            cost: The cost of the request, for example the amount of requests of a batch
+            timeout: The maximum amount of seconds to wait or None to wait forever
+
         Returns:
-        The boolean value of whether the client is logged into the server system, meaning the client posses an
-        authentication code
+        The boolean value of whether a slot was acquired. In that case 'release' has to be called once the request
+        was processed
         """
-        authentication_code_exists = self.authentication_code is not None
-        return authentication_code_exists
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
 
-    def _get_server_tuple(self):
+        def resolve():
+            if not future.done():
+                future.set_result(True)
+
+        # The slot is granted by 'release', which might be called from any thread
+        entry = self._enqueue(username, cost, lambda: loop.call_soon_threadsafe(resolve))
+        if entry is None:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return self._cancel(entry)
+        except asyncio.CancelledError:
+            # Passing on a slot, that was granted in the meantime
+            if self._cancel(entry):
+                self.release()
+            raise
+
+    def _enqueue(self, username, cost, wake):
         """
-        Simply assembles the server information given, which is the server ip address and the server port into a tuple,
-        which is needed for the socket connections
+        Advances the finish time of the user by the request and grants it a slot right away, in case one is free and
+        nobody is waiting, otherwise adds it to the queue of the waiting requests
+        Args:
+            username: The string username of the user
+            cost: The cost of the request
+            wake: The callable, that is called, once the waiting request was granted a slot
+
         Returns:
-        The tuple, whose first item is the server ip address as string and the second is the server port as int
+        None in case the slot was granted right away, otherwise the entry of the request within the queue
         """
-        server_tuple = (self.server_ip, self.server_port)
-        return server_tuple
-
-    @staticmethod
-    def _raise_exception(received_object):
+        with self.lock:
+            sequence_number = next(self.counter)
+            if sequence_number % self.PRUNE_INTERVAL == 0:
+                self._prune()
+            weight = self.weights.get(username, self.default_weight)
+            start_time = max(self.virtual_time, self.finish_times.get(username, 0.0))
+            finish_time = start_time + cost / weight
+            self.finish_times[username] = finish_time
+            if self.available > 0 and not self.queue:
+                self.available -= 1
+                self.virtual_time = start_time
+                return None
+            entry = [finish_time, sequence_number, start_time, wake, self.WAITING, username, cost / weight]
+            heapq.heappush(self.queue, entry)
+            return entry
+
+    def _cancel(self, entry):
         """
-        The socket connection works by the user sending a specific transfer object to accomplish/trigger a specific
-        task within the server side program, which in turn then sends back a response.
-        In case the initial request was faulty though the server would send back some sort of Exception object,
-        describing the error, that occured during the processing of the request.
-        This method has to be called on the received object, as it will raise the exception in case it is one.
+        Cancels a waiting request, that gave up waiting, and rolls back the finish time of its user, so that the user
+        does not pay for a request, that was never processed
         Args:
-            received_object: The received object, that came back as the response to the initial request
+            entry: The entry of the request within the queue
+
+        Returns:
+        The boolean value of whether the slot had already been granted, right after the waiting ended, in which case
+        the request is not cancelled
+        """
+        with self.lock:
+            if entry[4] == self.GRANTED:
+                return True
+            entry[4] = self.CANCELLED
+            username = entry[5]
+            if username in self.finish_times:
+                self.finish_times[username] = max(self.virtual_time, self.finish_times[username] - entry[6])
+            return False
 
+    def release(self):
+        """
+        Frees the slot of a processed request, granting it to the waiting request with the earliest finish time
         Returns:
         void
         """
-        if isinstance(received_object, Exception):
-            raise received_object
+        with self.lock:
+            while self.queue:
+                entry = heapq.heappop(self.queue)
+                if entry[4] == self.CANCELLED:
+                    continue
+                entry[4] = self.GRANTED
+                self.virtual_time = entry[2]
+                entry[3]()
+                return
+            self.available += 1
+
+    def _prune(self):
+        # Users, whose finish time lies in the past, would start at the virtual time anyways
+        for username in [username for username, finish_time in self.finish_times.items()
+                         if finish_time <= self.virtual_time]:
+            del self.finish_times[username]
+
+    def get_statistics(self):
+        """
+        Returns:
+        A dictionary with the keys 'slots', 'busy' (the amount of occupied slots) and 'waiting'
+        """
+        with self.lock:
+            waiting = sum(1 for entry in self.queue if entry[4] == self.WAITING)
+            return {"slots": self.slots, "busy": self.slots - self.available, "waiting": waiting}
 
 
-class AuthenticationGuard:
+class BaseUserProfile:
     """
-    The AuthenticationGuard object is one of the main instances during the server runtime. It is created on server
-    startup and does not require/load any data from memory. The AuthenticationGuard stores and manages the
-    authentication code system.
-    Whenever a user wants to communicate/connect with the server system for the first time, the profile information
-    (username and password) have to be transmitted, the server then creates a individual authentication code for the
-    user, which the user side program has to use as a prefix to all requests, so that the user does not have to enter
-    his info all the time, and that the server knows for whose user profile the incoming request are supposed to be
-    processed.
-
+    The 'BaseUserProfile' is a (abstract) base class for all further, more specific UserProfile classes. This class
+    contains the most basic and required properties of a user profile, which are the username and the password.
+
+    Attributes:
+        username: The string user name, under which the user is registered on the server
+        password: The string password for the users account
+    """
+    def __init__(self, username, password):
+        self.username = username
+        self.password = password
+
+    def get_password(self):
+        """
+        Returns:
+        The password of the user, the profile belongs to
+        """
+        return self.password
+
+    def get_username(self):
+        """
+        Returns:
+        The username with which the profile is connected
+        """
+        return self.username
+
+
+class UserDict(dict):
+    """
+    The UserDict class is a specialized dictionary class, that has to be created during the runtime of the server
+    program, it manages all user profiles
+    """
+    def __init__(self):
+        super(UserDict, self).__init__()
+        pass
+
+    def user_exists(self, username):
+        """
+        Checks Whether or not the user exists/ is registered in the servers database
+        Args:
+            username: The string of the username in question
+
+        Returns:
+        The boolean value of whether or not the user exists
+        """
+        # If the user existed, the username would have to be a key of the dictionary, whose assigned value would be
+        # the UserProfile of the according user
+        user_exists = username in self.keys()
+        return user_exists
+
+    def password_valid(self, username, password):
+        """
+        Checks whether or not the given password is the correct password for the given username
+        Args:
+            username: The string format of the username, whose password is to be checked
+            password: The string format of the password in question
+
+        Returns:
+        The boolean value of whether or not the specified password is actually correct for the given username
+        """
+        # The methods goes on and loads the correct password, that is stored within the user profile and then compares
+        # it to the password in question
+        user_profile = self[username]
+        stored_password = user_profile.get_password()
+        if password == stored_password:
+            return True
+        else:
+            return False
+
+
+class BaseTransferObject:
+
+    def __init__(self, authentication_code):
+        self.authentication_code = authentication_code
+
+    def get_authentication(self):
+        return self.authentication_code
+
+
+class LoginTransfer:
+    """
+    Objects of this class are being used to establish for the first communication attempt between a client program and
+    the server. By sending an object of this type the user identifies himself with his username and his password to
+    request an authentication code, that can be used as an temporary identifier for all further communication.
+    The authentication code exists, so that the server knows which user profile to activate/edit upon receiving a
+    request.
+
+    Attributes:
+        username: The string of the username of the user, requesting the authentication code
+        password: The string of the password of the user requesting the authentication code
+        authentication_code: Is None at first (upon creation) but gets set to the string of the authentication code
+            by the server and maintains that value, when being sent back to the user
+    """
+    def __init__(self, username, password):
+        # Assigning the given username and password as object attributes, so they are stored during the pickled socket
+        # transfer
+        self.username = username
+        self.password = password
+        # After the object has been created by the user side of the program it is being sent to the server, where a
+        # authentication code is being created by the authentication guard and then added as attribute to this object
+        # then the object is being sent back to the user, where the authentication code can be stored and used
+        self.authentication_code = None
+
+    def get_username(self):
+        """
+        Returns:
+        The string of the username, of the user, that sent the login request
+        """
+        return self.username
+
+    def get_password(self):
+        """
+        Returns:
+        The string of the password of the user
+        """
+        return self.password
+
+    def set_password(self, password):
+        """
+        Sets the password of the user profile to the new password
+        Args:
+            password: The string password
+
+        Returns:
+        void
+        """
+        self.password = password
+
+    def get_authentication(self):
+        """
+        Notes:
+            This method should only by called, once the object was sent back from the server, as the authentication code
+            property of such an object is None, until one is being created and added by the server.
+        Returns:
+        The string format of the authentication code, that was created for the user.
+        """
+        return self.authentication_code
+
+    def add_authentication_code(self, authentication_code):
+        """
+        Adds the authentication code, that was created for the user with the specified username and password, as the
+        authentication_code property of the object
+        Args:
+            authentication_code: The string format of the authentication code, created by the authentication guard
+
+        Returns:
+        void
+        """
+        self.authentication_code = authentication_code
+
+
+class RequestTransfer(BaseTransferObject):
+    """
+    The 'RequestTransfer' objects, or request objects in short, are created by the client side program and then sent
+    to the server. They are created with the intention of triggering some sort of action and a response within the
+    server. This requested action of the server side program is being specified by passing the request object the
+    string name of a method, more specifically a method of the handler object, that is created by the server once the
+    request was received and then handles the incoming communication attempt.
+    If a developer now wanted to add a new remote action to the project that uses piver servers the functionality would
+    only have to be implemented as a method of the handler object and then a request object with the methods name
+    would have to be sent to the server. The request objects also requires the 'parameter_list' parameter, which is
+    a list of all the positional parameters, that should additionally be added to the method call of the handler.
+    Once the action within the server side program has been successfully executed, a response of some sort will have
+    been created. This response is then added to the request object and the object is being send back to the client,
+    where the response can be read.
+
+    Attributes:
+        authentication_code: The string authentication code of the client object, that created the request object
+        request_subject: the string method name of the method of the handler object to be called
+        parameter_list: The list of all the positional parameters to be added to the method call
+        request_id: An integer, that identifies the request among all requests sent through the same connection.
+            Requests with an id are pipelined: The server processes them concurrently and sends back the responses in
+            the order they are finished, the id being used to match the responses to the requests. None for ordinary
+            requests, that are answered before the next one is being read
+        exception: The error, that occurred while processing a pipelined request. As the response to a pipelined request
+            has to carry the request id, errors are not sent back on their own, but added to the request object
+    """
+    def __init__(self, authentication_code, request_subject, parameter_list, request_id=None):
+        super(RequestTransfer, self).__init__(authentication_code)
+        self.request_subject = request_subject
+        self.parameters = parameter_list
+        self.response = None
+        self.request_id = request_id
+        self.exception = None
+
+    def get_request_id(self):
+        """
+        Returns:
+        The integer id of the request in case it is pipelined, None otherwise
+        """
+        return self.request_id
+
+    def is_pipelined(self):
+        """
+        Returns:
+        The boolean value of whether or not the request is pipelined, meaning it has a request id
+        """
+        return self.request_id is not None
+
+    def add_exception(self, exception):
+        """
+        This method is for the server to add the error, that occurred while processing a pipelined request, to the
+        request object
+        Args:
+            exception: The Exception object describing the error
+
+        Returns:
+        void
+        """
+        self.exception = exception
+
+    def get_exception(self):
+        """
+        Returns:
+        The error, that occurred while processing the pipelined request on the server or None if there was none
+        """
+        return self.exception
+
+    def add_response(self, response):
+        """
+        The response to the initial RequestTransfer object sent to the server does not contain a response. Its
+        'response' property is empty. The response is being created by the server side program, then added to the object
+        and the object is being sent back to the client, now containing the response.
+        This method is for the server to add the generated response to the object.
+        Args:
+            response: whatever object the server uses as a response to the initial request
+
+        Returns:
+        void
+        """
+        self.response = response
+
+    def get_method_name(self):
+        """
+        The RequestTransfer object is being created by the client side program, it will contain the information about
+        the 'request_subject', which essentially is the name of the method of the RequestHandler object, that is to be
+        called within the server side program.
+        Therefore this method returns exactly this method name, which is the subject of the request
+        Returns:
+        The string of the method name
+        """
+        return self.request_subject
+
+    def get_parameter_list(self):
+        """
+        Since many of the RequestHandlers methods processes are dependant on additional parameters, those parameters
+        can also be passed to the server by putting them (IN ORDER) into a parameter list, that is also being
+        transported with the RequestTransfer object.
+        Returns:
+        The list, containing all the POSITIONAL arguments of the method to call
+        """
+        return self.parameters
+
+    def get_response(self):
+        """
+        The response to the initial RequestTransfer object sent to the server does not contain a response. Its
+        'response' property is empty. The response is being created by the server side program, then added to the object
+        and the object is being sent back to the client, now containing the response.
+        This method returns the value of the objects attribute 'response'. Should only be called after the object came
+        back from the server, as the attribute will be None before.
+        Returns:
+        Whatever object the server created as response to the initial request
+        """
+        return self.response
+
+
+class CodecNegotiationTransfer:
+    """
+    Objects of this class are being sent by a client as the first object through a new connection, in case the client
+    wants to use another codec than pickle for the connection. The client lists the names of the codecs it supports in
+    the order of its preference, the server picks the first one it supports as well and sends the object back with
+    the name of the chosen codec added. From then on both sides serialize the objects sent through the connection with
+    the chosen codec. The negotiation itself is always transferred with the pickle codec.
+    In the same way the client advertises the compressions it is able to decompress. In case the server supports one
+    of them as well, it compresses the big responses it sends through the connection with it.
+
+    Attributes:
+        codec_names: The list of the string names of the codecs, the client supports, in order of preference
+        codec_name: The string name of the codec, that was chosen by the server. None until the server chose one
+        compression_names: The list of the string names of the compressions, the client supports, in order of
+            preference
+        compression_name: The string name of the compression, that was chosen by the server. None in case the
+            responses are not being compressed
+    """
+    def __init__(self, codec_names, compression_names=()):
+        self.codec_names = list(codec_names)
+        self.codec_name = None
+        self.compression_names = list(compression_names)
+        self.compression_name = None
+
+    def get_codec_names(self):
+        """
+        Returns:
+        The list of the string names of the codecs, the client supports, in order of preference
+        """
+        return self.codec_names
+
+    def choose_codec(self, supported_codec_names):
+        """
+        Chooses the first codec of the clients list, that is also supported by the server. In case there is no such
+        codec the pickle codec is being chosen
+        Args:
+            supported_codec_names: The list of the string names of the codecs the server supports
+
+        Returns:
+        The string name of the chosen codec
+        """
+        self.codec_name = PickleCodec.name
+        for codec_name in self.codec_names:
+            if codec_name in supported_codec_names:
+                self.codec_name = codec_name
+                break
+        return self.codec_name
+
+    def get_codec_name(self):
+        """
+        Returns:
+        The string name of the codec, that was chosen by the server
+        """
+        return self.codec_name
+
+    def choose_compression(self, supported_compression_names):
+        """
+        Chooses the first compression of the clients list, that is also supported by the server. In case there is no
+        such compression, the responses will not be compressed
+        Args:
+            supported_compression_names: The list of the string names of the compressions the server supports
+
+        Returns:
+        The string name of the chosen compression or None
+        """
+        self.compression_name = None
+        for compression_name in self.compression_names:
+            if compression_name in supported_compression_names:
+                self.compression_name = compression_name
+                break
+        return self.compression_name
+
+    def get_compression_name(self):
+        """
+        Returns:
+        The string name of the compression, that was chosen by the server or None
+        """
+        return self.compression_name
+
+
+class BatchRequestTransfer(BaseTransferObject):
+    """
+    The 'BatchRequestTransfer' objects bundle multiple requests into a single transfer object, so that they can be
+    executed by the server within one round trip. Each request is specified by a tuple of the string method name of
+    the method of the handler object and the list of positional parameters for that method, just like the ones of a
+    single 'RequestTransfer'.
+    The server executes the requests in order, or in parallel in case the batch was created to be 'parallel' (only
+    appropriate for requests, that do not depend on each other). After the execution the list of responses is being
+    added to the object, one response per request and in the same order. In case one of the requests failed its
+    response is the Exception object describing the error, while the other requests are not affected by the failure.
+
+    Attributes:
+        authentication_code: The string authentication code of the client object, that created the request object
+        requests: The list of tuples (method_name, parameter_list), that specify the requests of the batch
+        parallel: The boolean value of whether or not the requests may be executed in parallel
+        responses: The list of the responses to the requests. Is None until the server added the responses
+    """
+    def __init__(self, authentication_code, requests, parallel=False):
+        super(BatchRequestTransfer, self).__init__(authentication_code)
+        self.requests = [(method_name, list(parameter_list)) for method_name, parameter_list in requests]
+        self.parallel = parallel
+        self.responses = None
+
+    def get_requests(self):
+        """
+        Returns:
+        The list of tuples (method_name, parameter_list), that specify the requests of the batch
+        """
+        return self.requests
+
+    def is_parallel(self):
+        """
+        Returns:
+        The boolean value of whether or not the requests of the batch may be executed in parallel
+        """
+        return self.parallel
+
+    def add_responses(self, responses):
+        """
+        This method is for the server to add the list of generated responses to the object.
+        Args:
+            responses: The list of responses, one for each request of the batch and in the same order
+
+        Returns:
+        void
+        """
+        self.responses = responses
+
+    def get_responses(self):
+        """
+        Should only be called after the object came back from the server, as the attribute will be None before.
+        Returns:
+        The list of responses, one for each request of the batch and in the same order. The response of a failed
+        request is the Exception object describing the error
+        """
+        return self.responses
+
+
+class FileTransferTicket:
+    """
+    The response of the server to a 'download_file' request. The ticket contains the port of the file server, that
+    was started for the download, the range of the file, that is going to be sent by it, and the total size and the
+    digest of the whole file, so that the client can check whether the file it pieced together (possibly over multiple
+    resumed downloads) is the same as the one on the server.
+
+    Attributes:
+        port: The integer port, on which the 'SimpleFileSendServer' of the download is listening
+        offset: The integer position within the file, at which the sent range starts
+        length: The integer amount of bytes, that are going to be sent
+        file_size: The integer size of the whole file in bytes
+        digest: The hex string digest of the whole file, computed with the FILE_DIGEST_ALGORITHM
+        not_modified: The boolean value of whether the download was conditional and the file still has the digest the
+            client already knew. In that case nothing is being sent
+    """
+    def __init__(self, port, offset, length, file_size, digest, not_modified=False):
+        self.port = port
+        self.offset = offset
+        self.length = length
+        self.file_size = file_size
+        self.digest = digest
+        self.not_modified = not_modified
+
+    def is_not_modified(self):
+        """
+        Returns:
+        The boolean value of whether the file still has the digest, the client sent with its conditional request, so
+        that the client can use its own copy of the file and nothing is sent
+        """
+        return self.not_modified
+
+    def get_port(self):
+        """
+        Returns:
+        The integer port, on which the file server of the download is listening
+        """
+        return self.port
+
+    def get_offset(self):
+        """
+        Returns:
+        The integer position within the file, at which the sent range starts
+        """
+        return self.offset
+
+    def get_length(self):
+        """
+        Returns:
+        The integer amount of bytes, that are going to be sent by the file server
+        """
+        return self.length
+
+    def get_file_size(self):
+        """
+        Returns:
+        The integer size of the whole file in bytes
+        """
+        return self.file_size
+
+    def get_digest(self):
+        """
+        Returns:
+        The hex string digest of the whole file
+        """
+        return self.digest
+
+    def is_complete_file(self):
+        """
+        Returns:
+        The boolean value of whether the sent range reaches up to the end of the file, so that the file is complete
+        once the range has been received (given, that the part before the range is already present)
+        """
+        return self.offset + self.length == self.file_size
+
+
+class StreamingResponse:
+    """
+    The base class for the responses of handler methods, that send a big amount of data back to the client, without
+    building it up as a single object in memory and without opening a separate connection for it. The object returned
+    by 'get_response' is sent as the ordinary response to the request, flagged with the FRAME_STREAM_FLAG, and is
+    followed by the data of the stream, sent as data frames on the same connection.
+    Subclasses have to implement 'iter_chunks' and should implement 'close', in case they hold resources, as the
+    response might be discarded without being streamed. Streaming is only possible for requests, that are neither
+    pipelined nor part of a batch, as the data frames would otherwise interleave with other responses.
+
+    Attributes:
+        response: The response object, that is sent before the data
+    """
+    def __init__(self, response):
+        self.response = response
+
+    def get_response(self):
+        """
+        Returns:
+        The response object, that is sent to the client before the data
+        """
+        return self.response
+
+    def iter_chunks(self):
+        """
+        Returns:
+        An iterator over the bytes like objects, that make up the data of the stream
+        """
+        raise NotImplementedError()
+
+    def stream(self, sock):
+        """
+        Sends the data of the stream as data frames through the given socket, finishing with an empty data frame
+        Args:
+            sock: The socket of the connection
+
+        Returns:
+        The integer amount of bytes of data sent
+        """
+        sent_size = 0
+        for chunk in self.iter_chunks():
+            send_frame(sock, chunk, flags=FRAME_DATA_FLAG)
+            sent_size += len(chunk)
+        send_frame(sock, b"", flags=FRAME_DATA_FLAG)
+        return sent_size
+
+    def close(self):
+        """
+        Releases the resources of the stream. Is called once the stream was sent or discarded
+        Returns:
+        void
+        """
+        pass
+
+
+class FileStreamResponse(StreamingResponse):
+    """
+    The streaming response, with which a range of a file is sent to the client on the request connection. The response
+    object is a 'FileTransferTicket' without a port. The data frames are sent with 'socket.sendfile', so that the
+    operating system copies the file to the socket directly (where supported).
+    As every stream occupies one of the download slots of the server, the slot is released, once the stream is closed.
+
+    Attributes:
+        file: The byte reading open()-fileobject of the file to be sent
+        download_slot: The semaphore of the server limiting the concurrent downloads, that is released on closing or
+            None
+    """
+    def __init__(self, ticket, file_path, download_slot=None):
+        super(FileStreamResponse, self).__init__(ticket)
+        self.file = open(file_path, "rb")
+        self.download_slot = download_slot
+
+    def iter_chunks(self):
+        position = self.response.get_offset()
+        end = position + self.response.get_length()
+        while position < end:
+            self.file.seek(position)
+            chunk = self.file.read(min(STREAM_CHUNK_SIZE, end - position))
+            if not chunk:
+                raise ConnectionAbortedError("The file was truncated while being streamed")
+            position += len(chunk)
+            yield chunk
+
+    def stream(self, sock):
+        position = self.response.get_offset()
+        end = position + self.response.get_length()
+        while position < end:
+            count = min(STREAM_CHUNK_SIZE, end - position)
+            sock.sendall(FRAME_HEADER.pack(FRAME_DATA_FLAG, count))
+            sent = sock.sendfile(self.file, position, count)
+            if sent != count:
+                # The data frame announced more bytes than there are, so the connection is unusable from here on
+                raise ConnectionAbortedError("The file was truncated while being streamed")
+            position += count
+        send_frame(sock, b"", flags=FRAME_DATA_FLAG)
+        return self.response.get_length()
+
+    def close(self):
+        self.file.close()
+        if self.download_slot is not None:
+            self.download_slot.release()
+            self.download_slot = None
+
+
+class IncomingStream:
+    """
+    The data a client streams to the server right after a request frame, that is flagged with the FRAME_STREAM_FLAG,
+    as it is done by uploads. The handler method processing the request can get the stream with
+    'PiverRequestHandler.get_incoming_stream' and read the data chunk by chunk with 'iter_chunks', so that it never has
+    to be held in memory as a whole. Whatever the method did not read is discarded afterwards, so that the next request
+    can be read from the connection.
+
+    Attributes:
+        sock: The socket of the connection
+        received_size: The integer amount of bytes received so far
+        finished: The boolean value of whether the end of the stream was reached
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self.received_size = 0
+        self.finished = False
+
+    def iter_chunks(self):
+        """
+        Raises:
+            ConnectionAbortedError: In case a frame, that is not a data frame, was received
+            ValueError: In case a data frame is bigger than MAX_STREAM_FRAME_SIZE
+
+        Returns:
+        A generator of the received chunks of data
+        """
+        while not self.finished:
+            flags, payload = receive_frame(self.sock, max_size=MAX_STREAM_FRAME_SIZE)
+            if not flags & FRAME_DATA_FLAG:
+                raise ConnectionAbortedError("Received a request frame in the middle of a streamed request")
+            if not payload:
+                self.finished = True
+                return
+            self.received_size += len(payload)
+            yield payload
+
+    def drain(self):
+        """
+        Receives and discards the rest of the stream
+        Returns:
+        void
+        """
+        for chunk in self.iter_chunks():
+            pass
+
+    def close(self):
+        pass
+
+
+class SpooledIncomingStream(IncomingStream):
+    """
+    An incoming stream, that was already received completely and spooled to a temporary file. The AsyncPiverServer
+    receives streamed requests this way, as the handler methods run in threads and cannot read from the connection
+    themselves. The temporary file is being deleted, once the stream is closed
+
+    Attributes:
+        file: The temporary file object containing the data
+    """
+    def __init__(self, file):
+        super(SpooledIncomingStream, self).__init__(None)
+        self.file = file
+
+    def iter_chunks(self):
+        while not self.finished:
+            chunk = self.file.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                self.finished = True
+                return
+            self.received_size += len(chunk)
+            yield chunk
+
+    def drain(self):
+        self.finished = True
+
+    def close(self):
+        self.file.close()
+
+
+def get_negotiated_codec(negotiation_response):
+    """
+    Returns the codec, that the server chose in response to a 'CodecNegotiationTransfer'
+    Args:
+        negotiation_response: The object the server sent in response to the negotiation
+
+    Raises:
+        Exception: The error the server sent in response, unless it is the error of a server, that does not support
+            the negotiation. For example the 'ServerBusyError' of a server refusing the connection
+
+    Returns:
+    The codec object to use for the connection
+    """
+    # Servers, that do not support the negotiation, respond with the error of an unsupported transfer object or, in
+    # case they do not know the class at all, with the error of the unpickling, in which case pickle is being used
+    if isinstance(negotiation_response, (TypeError, AttributeError)):
+        return PICKLE_CODEC
+    if isinstance(negotiation_response, Exception):
+        raise negotiation_response
+    if not isinstance(negotiation_response, CodecNegotiationTransfer):
+        return PICKLE_CODEC
+    return CODECS.get(negotiation_response.get_codec_name(), PICKLE_CODEC)
+
+
+class PiverConnection:
+    """
+    A single socket connection from a client to a PiverServer. The connection wraps the socket object and the framing
+    protocol, so that transfer objects can be exchanged with the server by a single method call. Since the server
+    keeps serving a connection until the client closes it or it has been idle for too long, a connection object can
+    be used for many subsequent requests, which saves the cost of establishing a new TCP connection for every request.
+
+    Attributes:
+        server_ip: The string, containing the servers IP address or hostname
+        server_port: The integer port on which the PiverServer is listening
+        timeout: The amount of seconds after which a blocking socket operation is being aborted
+        sock: The socket object of the connection. None while the connection is not established
+        last_used: The float time.monotonic value of the moment the connection was last used for an exchange
+        codec_names: The list of the string names of the codecs, that are proposed to the server, once the connection
+            is established. In case the list is empty no negotiation takes place and the pickle codec is being used
+        codec: The codec object, with which the objects are being serialized for this connection
+        compression_names: The list of the string names of the compressions, that are advertised to the server, so that
+            it may compress big responses
+        request_sent: The boolean value of whether the request of the last exchange was sent completely. Only then
+            the server might have processed it, even if the exchange failed afterwards
+    """
+    def __init__(self, server_ip, server_port, timeout=10, codec_names=(), compression_names=()):
+        self.server_ip = server_ip
+        self.server_port = server_port
+        self.timeout = timeout
+        self.sock = None
+        self.last_used = time.monotonic()
+        self.request_sent = False
+        self.codec_names = list(codec_names)
+        self.codec = PICKLE_CODEC
+        self.compression_names = list(compression_names)
+
+    def connect(self):
+        """
+        Creates the socket and connects it to the server. In case the connection has a list of codecs, the codec for
+        the connection is being negotiated with the server right away
+        Returns:
+        void
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect((self.server_ip, self.server_port))
+            # Requests are mostly small objects, that should not wait for the Nagle algorithm to fill up a segment
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.codec = self._negotiate_codec(sock)
+        except BaseException:
+            sock.close()
+            raise
+        self.sock = sock
+        self.last_used = time.monotonic()
+
+    def _negotiate_codec(self, sock):
+        """
+        Proposes the codecs of the connection to the server and returns the codec the server chose
+        Args:
+            sock: The freshly connected socket
+
+        Returns:
+        The codec object to use for the connection
+        """
+        if not self.codec_names and not self.compression_names:
+            return PICKLE_CODEC
+        try:
+            send_object(sock, CodecNegotiationTransfer(self.codec_names, self.compression_names))
+        except ConnectionError as error:
+            # A server refusing the connection closes it right after sending its error, which might still be read
+            try:
+                return get_negotiated_codec(receive_object(sock))
+            except (OSError, EOFError, ValueError):
+                raise error
+        return get_negotiated_codec(receive_object(sock))
+
+    def close(self):
+        """
+        Closes the socket of the connection, if it is open
+        Returns:
+        void
+        """
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def is_connected(self):
+        """
+        Returns:
+        The boolean value of whether or not the socket of the connection is established
+        """
+        return self.sock is not None
+
+    def is_healthy(self, max_idle_time):
+        """
+        Checks whether or not the connection can be reused for another exchange. A connection is not healthy anymore
+        in case it is closed, it has been idle for longer than the given time (the server might reap it any moment) or
+        in case the socket is readable while no request is pending, which means the server closed the connection or
+        the stream contains unexpected data
+        Args:
+            max_idle_time: The amount of seconds, the connection may have been idle to still be considered healthy
+
+        Returns:
+        The boolean value of whether or not the connection is healthy
+        """
+        if not self.is_connected():
+            return False
+        if time.monotonic() - self.last_used > max_idle_time:
+            return False
+        try:
+            readable, _, _ = select.select([self.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def set_timeout(self, timeout):
+        """
+        Sets the amount of seconds after which a blocking socket operation of the connection is being aborted
+        Args:
+            timeout: The amount of seconds
+
+        Returns:
+        void
+        """
+        self.timeout = timeout
+        if self.sock is not None:
+            self.sock.settimeout(timeout)
+
+    def exchange(self, obj, sink=None, source=None):
+        """
+        Sends the given object to the server and waits for the response object. In case the exchange fails due to a
+        socket error the connection is being closed, as the framing of the stream can not be trusted anymore.
+        In case a source is given, its data is streamed to the server right after the object. In case the server
+        streams data after the response, the data is passed to the sink
+
+        Raises:
+            OSError: In case the exchange failed due to a socket error or a closed connection
+
+        Args:
+            obj: The object to send to the server
+            sink: The callable, which is called with every chunk of streamed data. None to discard the data
+            source: The iterable of bytes like objects to stream to the server after the object or None
+
+        Returns:
+        The object, that was received in response
+        """
+        self.request_sent = False
+        if not self.is_connected():
+            self.connect()
+        try:
+            if source is None:
+                send_object(self.sock, obj, self.codec)
+            else:
+                flags, parts = encode_object(obj, self.codec)
+                send_frame(self.sock, parts, flags=flags | FRAME_STREAM_FLAG)
+                send_stream(self.sock, source)
+            self.request_sent = True
+            flags, payload = receive_frame(self.sock)
+            response = decode_object(flags, payload)
+            if flags & FRAME_STREAM_FLAG:
+                receive_stream(self.sock, sink)
+        except OSError:
+            self.close()
+            raise
+        self.last_used = time.monotonic()
+        return response
+
+
+class PiverConnectionPool:
+    """
+    A thread safe pool of connections to a single PiverServer. Threads can check out a connection from the pool, use
+    it for an exchange with the server and then return it to the pool, so that it can be reused by the next thread.
+    The pool creates new connections only when there is no idle one available and never holds more than 'max_size'
+    connections at a time. A thread trying to check out a connection while all of them are in use, waits for one to
+    be returned, at most for 'checkout_timeout' seconds though. Idle connections are checked for their health before
+    being handed out and are being discarded in case the server closed them in the meantime.
+
+    Examples:
+        pool = PiverConnectionPool("localhost", 5000, max_size=4)
+        with pool.connection() as connection:
+            response = connection.exchange(request_transfer)
+        pool.close()
+
+    Attributes:
+        server_ip: The string, containing the servers IP address or hostname
+        server_port: The integer port on which the PiverServer is listening
+        max_size: The maximum amount of connections the pool holds at a time
+        checkout_timeout: The amount of seconds a thread waits for a connection, before a TimeoutError is raised
+        max_idle_time: The amount of seconds a connection may be idle in the pool to still be reused. Should be lower
+            than the idle timeout of the server
+        timeout: The amount of seconds after which blocking socket operations of the connections are aborted
+        codec_names: The list of the string names of the codecs, the connections propose to the server
+        compression_names: The list of the string names of the compressions, the connections advertise to the server
+        idle_connections: The list of the connections, that are currently not checked out. Used as a stack, so that the
+            most recently used connections are reused first
+        size: The amount of connections, that currently exist, including the ones, that are checked out
+    """
+    DEFAULT_MAX_SIZE = 8
+    DEFAULT_CHECKOUT_TIMEOUT = 10
+    DEFAULT_MAX_IDLE_TIME = 30
+
+    def __init__(self, server_ip, server_port, max_size=DEFAULT_MAX_SIZE, checkout_timeout=DEFAULT_CHECKOUT_TIMEOUT,
+                 max_idle_time=DEFAULT_MAX_IDLE_TIME, timeout=10, codec_names=(), compression_names=()):
+        self.server_ip = server_ip
+        self.server_port = server_port
+        self.codec_names = list(codec_names)
+        self.compression_names = list(compression_names)
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_idle_time = max_idle_time
+        self.timeout = timeout
+
+        self.idle_connections = []
+        self.size = 0
+        self.closed = False
+        # The condition is used both to secure the access to the idle connections and the size counter and to let
+        # threads wait for a connection to be returned to the pool
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Checks out a connection from the pool. Idle connections are preferred, in case there is none a new connection
+        is being created, as long as the pool has not reached its maximum size, otherwise waiting for another thread
+        to release its connection. The returned connection might not be connected yet, it is being connected
+        automatically with the first exchange though
+
+        Raises:
+            TimeoutError: In case no connection became available within the checkout timeout
+            RuntimeError: In case the pool has already been closed
+
+        Returns:
+        The checked out 'PiverConnection' object
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        with self.condition:
+            while True:
+                if self.closed:
+                    raise RuntimeError("The connection pool has already been closed")
+
+                # Reusing the most recently used idle connection, that is still healthy. Unhealthy connections are
+                # closed and discarded, which frees up space for a new one
+                while self.idle_connections:
+                    connection = self.idle_connections.pop()
+                    if connection.is_healthy(self.max_idle_time):
+                        return connection
+                    connection.close()
+                    self.size -= 1
+
+                if self.size < self.max_size:
+                    self.size += 1
+                    return PiverConnection(self.server_ip, self.server_port, timeout=self.timeout,
+                                           codec_names=self.codec_names, compression_names=self.compression_names)
+
+                remaining_time = deadline - time.monotonic()
+                if remaining_time <= 0:
+                    error_message = "No connection to the server became available within {} seconds"
+                    raise TimeoutError(error_message.format(self.checkout_timeout))
+                self.condition.wait(remaining_time)
+
+    def release(self, connection, discard=False):
+        """
+        Returns a checked out connection to the pool, so that it can be reused by other threads
+        Args:
+            connection: The 'PiverConnection' object, that was checked out from the pool
+            discard: The boolean value of whether the connection is to be closed instead of reused. Should be True in
+                case the connection has been used for an exchange, that failed
+
+        Returns:
+        void
+        """
+        with self.condition:
+            if discard or self.closed or not connection.is_connected():
+                connection.close()
+                self.size -= 1
+            else:
+                connection.set_timeout(self.timeout)
+                self.idle_connections.append(connection)
+            self.condition.notify()
+
+    def connection(self):
+        """
+        Returns:
+        A context manager, that checks out a connection from the pool and releases it again after the with block. In
+        case the with block raised an error, the connection is being discarded instead
+        """
+        return _PooledConnectionContext(self)
+
+    def close(self):
+        """
+        Closes all the idle connections of the pool. Connections, that are checked out at the time, are being closed,
+        once they are released
+        Returns:
+        void
+        """
+        with self.condition:
+            self.closed = True
+            for connection in self.idle_connections:
+                connection.close()
+                self.size -= 1
+            self.idle_connections = []
+            self.condition.notify_all()
+
+
+class _PooledConnectionContext:
+    """
+    The context manager returned by 'PiverConnectionPool.connection'
+    """
+    def __init__(self, pool):
+        self.pool = pool
+        self.connection = None
+
+    def __enter__(self):
+        self.connection = self.pool.acquire()
+        return self.connection
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.pool.release(self.connection, discard=exception_type is not None)
+        return False
+
+
+class PiverClient:
+    """
+    The base class for all further, individual client classes. The client object is an object that has to be created and
+    alive during the runtime of the client side program of a piver project. The client essentially manages all
+    communication with the server and is supposed to wrap more complex interactions between client and server into
+    simple methods.
+    To really use a client object it has to be created and then logged into the server system by calling the 'login'
+    method with the username and password of the registered user, by doing so the client obtains a authentication
+    code, that is required by any tranfer object sent through the socket connection, so that the server can identify
+    which request to execute for which user, without the client having to transmit the sensitive login information.
+    The client requires the server ip and the server to establish socket connections.
+    By default every request is being sent through a new socket connection. If the client is created to be
+    'persistent' though, it keeps a single connection to the server open and sends all requests through it, which
+    avoids the costly establishing of a new connection for every request. The persistent connection is automatically
+    re-established in case the server closed it in the meantime, for example because it was idle for too long.
+    A persistent client should be closed by calling its 'close' method once it is not needed anymore.
+    Persistent connections can also use another codec than pickle for the serialization of the transfer objects, by
+    passing the names of the preferred codecs as 'codec_names'. The codec is being negotiated with the server once per
+    connection, which is why this is not done for the connections, that are only used for a single request. The same
+    goes for the 'compression_names', which the client advertises, so that the server compresses big responses.
+    Given a 'download_cache', whole files downloaded by blocking downloads are being cached and only downloaded again
+    in case the file on the server changed.
+    A request, that fails on a reused connection, is only sent a second time, in case it was not sent completely before
+    or in case it is a login or a request of one of the 'idempotent_methods', so that a request, which the server might
+    already have processed, is not executed twice.
+    """
+    # The default amount of times a blocking download is resumed, after the connection to the file server broke
+    DOWNLOAD_RETRIES = 3
+    # The default maximum amount of files 'download_files' downloads at the same time
+    MAX_CONCURRENT_DOWNLOADS = 4
+
+    def __init__(self, server_ip, server_port, persistent=False, codec_names=(), compression_names=(),
+                 download_cache=None, idempotent_methods=()):
+        self.server_ip = server_ip
+        self.server_port = server_port
+        self.authentication_code = None
+        # The names of the remote methods, whose requests may be repeated after a failed exchange
+        self.idempotent_methods = set(idempotent_methods)
+
+        self.persistent = persistent
+        self.codec_names = list(codec_names)
+        self.compression_names = list(compression_names)
+        # The connection, that is being reused for all requests, in case the client is persistent. As the connection
+        # can only be used for one exchange at a time, the access to it is being secured by a lock
+        self.connection = None
+        self.connection_lock = threading.Lock()
+        # The downloader of the last file download, so that a download, that was not started blocking, can be waited for
+        self.downloader = None
+        # The 'DownloadCache', in which downloaded files are kept, so that they do not have to be downloaded again as
+        # long as they did not change on the server
+        self.download_cache = download_cache
+
+    def login(self, username, password):
+        """
+        This method attempts to log into the server using the users data, that is specified by the username and the
+        password. A LoginTransfer object is being sent to the server and in response a authentication code is being
+        created and sent back as a response. The authentication code is then being assigned as the value to the clients
+        'authentication_code' property and also returned. The authentication code is being used as a temporary
+        identifier, that has to be sent with every following communication with the server, so the server knows
+        which request belongs to which user and which users profile is to be modified.
+
+        Raises:
+            ConnectionRefusedError: In case the username is not registered in the server database
+            PermissionError: In case the password is not correct
+
+        Args:
+            username: The string of the username
+            password: The string of the password
+
+        Returns:
+        The string of the authentication code
+        """
+        # Creating the 'LoginTransfer' object, that signals the server, that the sent request is an attempted login
+        # for obtaining an authentication code for the specified user.
+        login_transfer = LoginTransfer(username, password)
+        # Sending the object and getting the response from the send method. The response is supposed to be the very
+        # same object, that was sent, only with the now created authentication code added
+        login_transfer_response = self.send(login_transfer)
+        authentication_code = login_transfer_response.get_authentication()
+        self.authentication_code = authentication_code
+        return authentication_code
+
+    def download_file(self, relative_server_path, save_path, blocking=False, offset=None, length=None,
+                      resume=True, retries=DOWNLOAD_RETRIES):
+        """
+        Downloads a file from the server.
+        Sends a request for the file download, which triggers the server to check for the existance of the file,
+        specified by 'relative_server_path'. If the file exists the server acquires an open port and starts a
+        'FileSendServer' on it and sends a 'FileTransferTicket' with the port of the server and the digest of the file
+        as a response back to the client.
+        The client then starts a 'ClientFileDownloader' object(thread) that automatically downloads the file and saves
+        it as specified by 'save_path'. The method can be blocking, meaning it waits till the download is finished, or
+        starts it and lets it run as a thread.
+        In case the file at 'save_path' already exists and 'resume' is True, it is treated as the partial result of an
+        earlier download and only the rest of the file is being requested. Once the file is complete, its digest is
+        compared with the one of the file on the server and a FileIntegrityError is raised if they differ. A blocking
+        download is resumed automatically 'retries' times, in case the connection breaks, and restarted from the
+        beginning in case the integrity check failed. A download, that is not blocking, is not retried, its errors are
+        raised by the 'wait' method of the downloader instead.
+        In case the client has a download cache, a blocking download of a whole file is conditional: If the cache
+        contains the file with the same digest as the file on the server, the server sends nothing and the file is
+        copied from the cache instead.
+        By passing an 'offset' and/or a 'length' only that range of the file is downloaded and written to the same
+        position within the file at 'save_path'. The digest is not checked for such range downloads.
+        Args:
+            relative_server_path: The string path that specifies the file to download. The path is supposed to be
+                relative to the servers main folder, meaning that files, that dont belong to the server cannot be
+                downloaded.
+            save_path: The string path to where the file is supposed to the saved to. In case the path does not
+                refer to an already existing file, the file is being created.
+            blocking: The boolean value of whether or not the method is supposed to wait till the download is finished
+                or not
+            offset: The integer position within the file, at which the requested range starts. None for the whole file
+            length: The integer amount of bytes to download. None for everything up to the end of the file
+            resume: The boolean value of whether an existing file at 'save_path' is to be resumed
+            retries: The amount of times a blocking download is resumed or restarted after it failed
+        Returns:
+        The string path of the saved file, in case the method is not blocking the 'SimpleClientFileDownloader' can be
+        found as the 'downloader' attribute of the client, to wait for it
+        """
+        if not blocking:
+            # Continuing from the end of the already existing part of the file, in case it is a resumed download
+            range_request = offset is not None or length is not None
+            # A range given only by its length starts at the beginning of the file
+            start = (offset or 0) if range_request else self._get_resume_offset(save_path, resume)
+            self._start_download(relative_server_path, save_path, start, length, not range_request)
+            return save_path
+
+        return self._download(self._receive_file, relative_server_path, save_path, offset, length, resume, retries)
+
+    def upload_file(self, file_path, relative_server_path, overwrite=False, timeout=30):
+        """
+        Uploads a file to the server. The request announces the size and the digest of the file and is followed by the
+        content of the file, streamed in chunks on the same connection, so that neither side has to hold the whole
+        file in memory. The server writes the data to a temporary file and only moves it to its final place, once the
+        size and the digest match the announced ones
+        Args:
+            file_path: The string path of the local file to upload
+            relative_server_path: The string path, under which the file is to be saved on the server, relative to the
+                servers main folder
+            overwrite: The boolean value of whether an existing file on the server may be replaced
+            timeout: The amount of seconds to wait for the server
+
+        Raises:
+            ValueError: In case the file is bigger than the server accepts
+            FileExistsError: In case the file exists on the server and 'overwrite' is False
+
+        Returns:
+        The 'FileTransferTicket' describing the uploaded file
+        """
+        self.check_login()
+        file_size = os.path.getsize(file_path)
+        digest = compute_file_digest(file_path)
+        request_transfer = RequestTransfer(self.authentication_code, "upload_file",
+                                           [relative_server_path, file_size, digest, overwrite])
+        response = self.send(request_transfer, timeout=timeout, source=iter_file_chunks(file_path))
+        return response.get_response()
+
+    def download_files(self, files, max_concurrent=MAX_CONCURRENT_DOWNLOADS, progress=None, resume=True,
+                       retries=DOWNLOAD_RETRIES):
+        """
+        Downloads multiple files at the same time, with at most 'max_concurrent' downloads running at once. Every file
+        is downloaded just like with 'stream_file', so it is resumed, verified and cached. The method returns once all
+        the downloads have finished. A failed download does not affect the other ones, its error is returned instead
+        of the path.
+        The progress of all the downloads together is being tracked by a 'DownloadProgress' object, which can be passed
+        to watch the progress from another thread or to get notified via its callback.
+        Each download needs a connection of its own: A client, that is not persistent, opens a new connection per
+        file and a 'PooledPiverClient' uses the connections of its pool (which should be at least 'max_concurrent').
+        A persistent 'PiverClient' only has a single connection, so its downloads are sent one after another
+        Args:
+            files: The list of tuples (relative_server_path, save_path), that specify the files to download
+            max_concurrent: The maximum amount of files, that are downloaded at the same time
+            progress: The 'DownloadProgress' object, that keeps track of the downloads. None to create a new one
+            resume: The boolean value of whether existing files are to be resumed
+            retries: The amount of times each download is resumed or restarted after it failed
+
+        Returns:
+        The list with the string path of the saved file or the error, that made the download fail, for every file and
+        in the same order
+        """
+        self.check_login()
+        files = list(files)
+        progress = DownloadProgress() if progress is None else progress
+        progress.start(len(files))
+        if not files:
+            return []
+
+        def download(relative_server_path, save_path):
+            try:
+                self.stream_file(relative_server_path, save_path, resume=resume, retries=retries, progress=progress)
+            except Exception as error:
+                progress.finish_file(save_path, error)
+                return error
+            progress.finish_file(save_path)
+            return save_path
+
+        max_workers = min(max_concurrent, len(files))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(download, relative_server_path, save_path)
+                       for relative_server_path, save_path in files]
+            return [future.result() for future in futures]
+
+    def stream_file(self, relative_server_path, save_path, offset=None, length=None, resume=True,
+                    retries=DOWNLOAD_RETRIES, timeout=30, progress=None):
+        """
+        Downloads a file from the server, by letting the server stream the file over the request connection itself,
+        instead of starting a file server on another port. Apart from that it works just like a blocking
+        'download_file': Existing files are resumed, broken streams are resumed up to 'retries' times, the download
+        cache is used and the digest of the complete file is checked, unless only the range given by 'offset' and
+        'length' was requested.
+        A persistent client streams the file over its persistent connection, so no additional connection is needed
+        Args:
+            relative_server_path: The string path that specifies the file to download. The path is supposed to be
+                relative to the servers main folder
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts. None for the whole file
+            length: The integer amount of bytes to download. None for everything up to the end of the file
+            resume: The boolean value of whether an existing file at 'save_path' is to be resumed
+            retries: The amount of times the download is resumed or restarted after it failed
+            timeout: The amount of seconds to wait for data from the server
+            progress: The 'DownloadProgress' object, to which the received bytes are added, or None
+
+        Returns:
+        The string path of the saved file
+        """
+        self.check_login()
+        receive_range = functools.partial(self._receive_file_stream, timeout=timeout, progress=progress)
+        return self._download(receive_range, relative_server_path, save_path, offset, length, resume, retries)
+
+    def _download(self, receive_range, relative_server_path, save_path, offset, length, resume, retries):
+        """
+        Downloads a file or a range of it with the given function, resuming the download in case it broke off and
+        restarting it in case the integrity check of the file failed. Whole files are looked up in and added to the
+        download cache
+        Args:
+            receive_range: The function, that downloads a range of the file. It is called with the path on the server,
+                the save path, the offset, the length, whether to verify the digest and the digest of the cached copy
+                and returns the 'FileTransferTicket' of the download
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts. None for the whole file
+            length: The integer amount of bytes to download. None for everything up to the end of the file
+            resume: The boolean value of whether an existing file at 'save_path' is to be resumed
+            retries: The amount of times the download is resumed or restarted after it failed
+
+        Returns:
+        The string path of the saved file
+        """
+        range_request = offset is not None or length is not None
+        use_cache = self.download_cache is not None and not range_request
+        cache_key = self._get_cache_key(relative_server_path)
+        cached_digest = self.download_cache.lookup(cache_key) if use_cache else None
+        attempt = 0
+        while True:
+            # Continuing from the end of the already existing part of the file, in case it is a resumed download. A
+            # range given only by its length starts at the beginning of the file
+            start = (offset or 0) if range_request else self._get_resume_offset(save_path, resume)
+            try:
+                ticket = receive_range(relative_server_path, save_path, start, length, not range_request,
+                                       cached_digest)
+                if ticket.is_not_modified():
+                    if self.download_cache.restore(cached_digest, save_path):
+                        return save_path
+                    # The cached copy was evicted in the meantime, so the file has to be downloaded after all
+                    cached_digest = None
+                    continue
+                if use_cache:
+                    self.download_cache.store(cache_key, ticket.get_digest(), save_path)
+                # returning the full file path of the received file
+                return save_path
+            except (FileIntegrityError, ValueError, ConnectionError, TimeoutError, socket.timeout) as error:
+                self._recover_download(error, save_path, range_request, start, attempt, retries)
+            attempt += 1
+
+    @staticmethod
+    def _recover_download(error, save_path, range_request, start, attempt, retries):
+        """
+        Decides whether a failed download is attempted again, for the download loops of both the 'PiverClient' and
+        the 'AsyncPiverClient'. Removes the partial file, in case the download can not be resumed, but has to start
+        from the beginning
+        Args:
+            error: The exception, that made the download fail
+            save_path: The string path to where the file is supposed to the saved to
+            range_request: The boolean value of whether only a range of the file was requested
+            start: The integer position within the file, at which the failed attempt started
+            attempt: The amount of attempts, that failed before this one
+            retries: The amount of times the download is resumed or restarted after it failed
+
+        Raises:
+            Exception: The given error, in case the download is not attempted again
+
+        Returns:
+        void
+        """
+        if isinstance(error, FileIntegrityError):
+            # The existing part of the file was not the beginning of the file on the server, so it has to be
+            # downloaded from the beginning
+            os.remove(save_path)
+            if attempt >= retries:
+                raise error
+        elif isinstance(error, ValueError):
+            # The existing file was bigger than the file on the server, so it can not be a partial download of it
+            if range_request or start == 0 or attempt >= retries:
+                raise error
+            os.remove(save_path)
+        elif range_request or attempt >= retries:
+            raise error
+
+    def _receive_file(self, relative_server_path, save_path, offset, length, verify, if_none_match=None):
+        """
+        Downloads a range of a file through a file server and waits for the download to be finished
+        Args:
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes to download or None
+            verify: The boolean value of whether the digest of the file is to be checked, once it is complete
+            if_none_match: The hex string digest of the cached copy of the file or None
+
+        Returns:
+        The 'FileTransferTicket' of the download
+        """
+        ticket, downloader = self._start_download(relative_server_path, save_path, offset, length, verify,
+                                                  if_none_match=if_none_match)
+        if downloader is not None:
+            # Waiting for the receiving process to finish
+            downloader.wait()
+        return ticket
+
+    def _receive_file_stream(self, relative_server_path, save_path, offset, length, verify, if_none_match=None,
+                             timeout=30, progress=None):
+        """
+        Requests a range of a file to be streamed by the server and writes it to the same position within the file at
+        the given path
+        Args:
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes to download or None
+            verify: The boolean value of whether the digest of the file is to be checked, once it is complete
+            if_none_match: The hex string digest of the cached copy of the file or None
+            timeout: The amount of seconds to wait for data from the server
+            progress: The 'DownloadProgress' object, to which the received bytes are added, or None
+
+        Raises:
+            ConnectionAbortedError: In case the stream ended before the whole range was received
+            FileIntegrityError: In case the digest of the complete file does not match the one of the server
+
+        Returns:
+        The 'FileTransferTicket' of the download
+        """
+        request_transfer = RequestTransfer(self.authentication_code, "stream_file",
+                                           [relative_server_path, offset, length, if_none_match])
+        with open_download_file(save_path, offset) as file:
+            sink = file.write if progress is None else progress.create_sink(file.write)
+            response = self.send(request_transfer, timeout=timeout, sink=sink)
+            ticket = response.get_response()
+            if ticket.is_not_modified():
+                return ticket
+            received_size = file.tell() - offset
+            if received_size != ticket.get_length():
+                raise ConnectionAbortedError("The stream ended after {} of {} bytes".format(received_size,
+                                                                                           ticket.get_length()))
+            if ticket.is_complete_file():
+                file.truncate()
+        if verify and ticket.is_complete_file() and compute_file_digest(save_path) != ticket.get_digest():
+            raise FileIntegrityError("The digest of the downloaded file '{}' does not match the digest of the file "
+                                     "on the server".format(save_path))
+        return ticket
+
+    def _start_download(self, relative_server_path, save_path, offset, length, verify, if_none_match=None):
+        """
+        Requests a range of a file from the server and starts a downloader thread for it
+        Args:
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes to download or None
+            verify: The boolean value of whether the digest of the file is to be checked, once it is complete
+            if_none_match: The hex string digest of the cached copy of the file or None
+
+        Returns:
+        A tuple of the 'FileTransferTicket' and the started 'SimpleClientFileDownloader' object, which is None in case
+        the file was not modified
+        """
+        # Requesting the 'download_file' method of the server, that checks for the existence of the file and opens a
+        # FileSendServer for the requested range of the file in case the path was correct
+        ticket = self.request("download_file", [relative_server_path, offset, length, if_none_match])
+        if ticket.is_not_modified():
+            return ticket, None
+        # Creating a downloader object, that automatically downloads the file from the FileSendServer, that has been
+        # started at the server side program
+        downloader = SimpleClientFileDownloader(self.server_ip, ticket.get_port(), save_path,
+                                                offset=ticket.get_offset(), length=ticket.get_length(),
+                                                digest=ticket.get_digest() if verify else None,
+                                                file_size=ticket.get_file_size())
+        downloader.start()
+        self.downloader = downloader
+        return ticket, downloader
+
+    def _get_cache_key(self, relative_server_path):
+        """
+        Returns:
+        The string key, under which the digest of the given file of this server is stored within the download cache
+        """
+        return "{}:{}/{}".format(self.server_ip, self.server_port, relative_server_path)
+
+    @staticmethod
+    def _get_resume_offset(save_path, resume):
+        """
+        Returns:
+        The integer size of the already existing file at the given path, in case downloads are to be resumed, otherwise
+        zero
+        """
+        if resume and os.path.isfile(save_path):
+            return os.path.getsize(save_path)
+        return 0
+
+    def request(self, method_name, parameter_list):
+        """
+        This method will create a 'RequestTransfer' object and send it to the server, using the authentication of the
+        client object (An error will be raised in case no authentication has been obtained up to call of this method).
+        The request system works by specifying a method of the servers RequestHandler object by its string name, that
+        is supposed to be executed in the server side program. The 'parameter_list' parameter gives the option to pass
+        the additional parameters to the method of the servers handler object.
+        Once the handler object successfully executed the requested method, a response of some sort will have been
+        created and is then being sent back to the client and this response is also being returned by this method
+
+        Args:
+            method_name: The string name of the method of the handler object to be called
+            parameter_list: The list containing the positional arguments to this method in order
+
+        Returns:
+        Whatever the response to the specific request was
+        """
+        # Calling the 'check_login' method to check whether or not the client object already obtained the necessary
+        # authentication code, raises an exception in the case there is no authentication code yet
+        self.check_login()
+        # Creating the 'RequestTransfer' object, to send to the server
+        request_transfer = RequestTransfer(self.authentication_code, method_name, parameter_list)
+        request_transfer_response = self.send(request_transfer)
+        # returning the response
+        return request_transfer_response.get_response()
+
+    def request_batch(self, requests, parallel=False):
+        """
+        Sends multiple requests to the server within a single 'BatchRequestTransfer' object, so that all of them are
+        being executed within a single round trip. Every request is specified by the string method name of the
+        method of the servers handler object and the list of positional parameters for it, just like with the
+        'request' method. Failing requests do not raise an exception, instead the Exception object describing the error
+        is being returned as the response of that request, so that the responses of the other requests are not lost.
+
+        Examples:
+            responses = client.request_batch([
+                ("get_learning_process", ["Elektronik", "Halbleiterphysik"]),
+                ("get_learning_process", ["Mathematik", "Analysis"])
+            ], parallel=True)
+
+        Args:
+            requests: The list of tuples (method_name, parameter_list), specifying the requests
+            parallel: The boolean value of whether or not the server may execute the requests in parallel. Should only
+                be set, if the requests do not depend on each other. The server only does so, in case all the methods
+                are idempotent
+
+        Returns:
+        The list of responses, one for each request and in the same order
+        """
+        self.check_login()
+        batch_request_transfer = BatchRequestTransfer(self.authentication_code, requests, parallel=parallel)
+        batch_request_transfer_response = self.send(batch_request_transfer)
+        return batch_request_transfer_response.get_responses()
+
+    def send(self, obj, timeout=10, sink=None, source=None):
+        """
+        Sends the given object pickled as a single frame to the PiverServer, using either a new socket connection or,
+        in case the client is persistent, the connection that is being kept open. The method will then instantly wait
+        for the server to make a response through the very same socket connection and returns the unpickled response
+        object.
+        Since both the request and the response are transmitted as length prefixed frames, objects of arbitrary size
+        can be transferred without being truncated. Data the server streams after the response is passed to the
+        'sink' callable chunk by chunk. The data of the 'source' iterable is streamed to the server after the object.
+
+        Raises:
+            OSError: In case the socket connection failed. The socket is being properly closed first, but the very same
+                error is then raised again, so that the higher level functionality can handle its occurrance properly
+            Exception: The socket connection works by the user sending a specific transfer object to accomplish/trigger
+                a specific task within the server side program, which in turn then sends back a response.
+                In case the initial request was faulty though the server would send back some sort of Exception object,
+                describing the error, that occured during the processing of the request.
+        Args:
+            obj: The object to be send through the socket to the server
+            timeout: The amount of time in seconds, after which the connect should be terminated
+            sink: The callable, which is called with every chunk of data streamed after the response
+            source: The iterable of bytes like objects to stream to the server after the object
+
+        Returns:
+        The object, that has been received in response to the sent object.
+        """
+        if self.persistent:
+            response = self._send_persistent(obj, timeout, sink=sink, source=source)
+        else:
+            # Creating a new connection just for this one exchange and closing it right after the response arrived
+            connection = PiverConnection(self.server_ip, self.server_port, timeout=timeout)
+            try:
+                response = connection.exchange(obj, sink=sink, source=source)
+            finally:
+                connection.close()
+
+        # In case the received object was an exception, indication that an error occurred during the processing of the
+        # initial request, the exception will be risen
+        self._raise_exception(response)
+
+        return response
+
+    def close(self):
+        """
+        Closes the persistent connection of the client, if there is one. The client can still be used afterwards, the
+        connection will then simply be re-established with the next request
+        Returns:
+        void
+        """
+        with self.connection_lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def _send_persistent(self, obj, timeout, sink=None, source=None):
+        """
+        Exchanges the given object with the server through the persistent connection of the client. In case the
+        connection was already established before and the exchange fails, the server most likely closed the idle
+        connection, so the connection is being re-established and the exchange is being attempted a second time, as
+        long as the request may be repeated (see 'may_resend').
+        Exchanges with a sink or a source are not repeated, as the sink might already have received a part of the data
+        and the source might already be consumed
+        Args:
+            obj: The object to be send through the socket to the server
+            timeout: The amount of time in seconds, after which blocking socket operations are aborted
+            sink: The callable, which is called with every chunk of data streamed after the response
+            source: The iterable of bytes like objects to stream to the server after the object
+
+        Returns:
+        The object, that has been received in response to the sent object
+        """
+        with self.connection_lock:
+            if self.connection is None:
+                self.connection = PiverConnection(self.server_ip, self.server_port, timeout=timeout,
+                                                  codec_names=self.codec_names,
+                                                  compression_names=self.compression_names)
+            # A connection, that the server closed in the meantime, is replaced before the request is sent, as the
+            # request might not be repeatable once it was sent
+            if self.connection.is_connected() and not self.connection.is_healthy(math.inf):
+                self.connection.close()
+            # The connection is reused for requests with different timeouts
+            self.connection.set_timeout(timeout)
+            was_connected = self.connection.is_connected()
+            try:
+                return self.connection.exchange(obj, sink=sink, source=source)
+            except (ConnectionError, EOFError):
+                # Only retrying in case the connection was reused, as a fresh connection failing means, that the
+                # server is not reachable at all
+                if not was_connected or sink is not None or source is not None:
+                    raise
+                if not self.may_resend(obj, self.connection):
+                    raise
+                return self.connection.exchange(obj)
+
+    def may_resend(self, obj, connection):
+        """
+        Checks whether the object of a failed exchange may be sent a second time. That is the case, if the request was
+        not sent completely, as the server does not process incomplete frames, or if processing it twice has the same
+        effect as processing it once: logins and the requests of the idempotent methods of the client
+        Args:
+            obj: The object of the failed exchange
+            connection: The 'PiverConnection', whose exchange failed
+
+        Returns:
+        The boolean value of whether the object may be sent again
+        """
+        if not connection.request_sent:
+            return True
+        if isinstance(obj, LoginTransfer):
+            return True
+        if isinstance(obj, RequestTransfer):
+            return obj.get_method_name() in self.idempotent_methods
+        return False
+
+    def check_login(self):
+        """
+        Checks whether the client object is logged into the server system or not. More specifically: Checking whether
+        the client object posses an authentication code, that is needed for all communication with the server.
+        Raises a PermissionError in case the client is not logged in.
+        This method is supposed to be called before calling any other method, that sends transfer objects, that rely on
+        valid authentication codes.
+        Returns:
+        void
+        """
+        if not self.is_logged_in():
+            error_message = "The client does not have a authentication code. Log in first!"
+            raise PermissionError(error_message)
+
+    def is_logged_in(self):
+        """
+        Returns:
+        The boolean value of whether the client is logged into the server system, meaning the client posses an
+        authentication code
+        """
+        authentication_code_exists = self.authentication_code is not None
+        return authentication_code_exists
+
+    def _get_server_tuple(self):
+        """
+        Simply assembles the server information given, which is the server ip address and the server port into a tuple,
+        which is needed for the socket connections
+        Returns:
+        The tuple, whose first item is the server ip address as string and the second is the server port as int
+        """
+        server_tuple = (self.server_ip, self.server_port)
+        return server_tuple
+
+    @staticmethod
+    def _raise_exception(received_object):
+        """
+        The socket connection works by the user sending a specific transfer object to accomplish/trigger a specific
+        task within the server side program, which in turn then sends back a response.
+        In case the initial request was faulty though the server would send back some sort of Exception object,
+        describing the error, that occured during the processing of the request.
+        This method has to be called on the received object, as it will raise the exception in case it is one.
+        Args:
+            received_object: The received object, that came back as the response to the initial request
+
+        Returns:
+        void
+        """
+        if isinstance(received_object, Exception):
+            raise received_object
+
+
+class PooledPiverClient(PiverClient):
+    """
+    A PiverClient, that can be shared between multiple threads. Instead of a single connection, the client uses a
+    'PiverConnectionPool', so that concurrent requests are sent through separate connections, that are being reused
+    afterwards. That way concurrent requests do not have to wait for each other, while the amount of open sockets
+    is still limited by the maximum size of the pool.
+
+    Attributes:
+        pool: The 'PiverConnectionPool' object, from which the connections for the requests are checked out
+    """
+    def __init__(self, server_ip, server_port, max_size=PiverConnectionPool.DEFAULT_MAX_SIZE,
+                 checkout_timeout=PiverConnectionPool.DEFAULT_CHECKOUT_TIMEOUT,
+                 max_idle_time=PiverConnectionPool.DEFAULT_MAX_IDLE_TIME, codec_names=(), compression_names=(),
+                 download_cache=None, idempotent_methods=()):
+        PiverClient.__init__(self, server_ip, server_port, persistent=True, codec_names=codec_names,
+                             compression_names=compression_names, download_cache=download_cache,
+                             idempotent_methods=idempotent_methods)
+        self.pool = PiverConnectionPool(server_ip, server_port, max_size=max_size, checkout_timeout=checkout_timeout,
+                                        max_idle_time=max_idle_time, codec_names=codec_names,
+                                        compression_names=compression_names)
+
+    def close(self):
+        """
+        Closes all the connections of the pool
+        Returns:
+        void
+        """
+        self.pool.close()
+
+    def _send_persistent(self, obj, timeout, sink=None, source=None):
+        """
+        Exchanges the given object with the server through a connection checked out from the pool. In case a reused
+        connection fails, the exchange is being attempted a second time with a new connection, unless data was
+        streamed to a sink or from a source or the request may not be repeated (see 'may_resend')
+        Args:
+            obj: The object to be send through the socket to the server
+            timeout: The amount of time in seconds, after which blocking socket operations are aborted
+            sink: The callable, which is called with every chunk of data streamed after the response
+            source: The iterable of bytes like objects to stream to the server after the object
+
+        Returns:
+        The object, that has been received in response to the sent object
+        """
+        connection = self.pool.acquire()
+        try:
+            connection.set_timeout(timeout)
+            was_connected = connection.is_connected()
+            try:
+                response = connection.exchange(obj, sink=sink, source=source)
+            except (ConnectionError, EOFError):
+                if not was_connected or sink is not None or source is not None:
+                    raise
+                if not self.may_resend(obj, connection):
+                    raise
+                response = connection.exchange(obj)
+        except BaseException:
+            self.pool.release(connection, discard=True)
+            raise
+        self.pool.release(connection)
+        return response
+
+
+class PipelinedPiverClient(PiverClient):
+    """
+    A PiverClient, that sends all requests through a single connection without waiting for the responses of the
+    previous requests. Every request is being assigned a request id and the server processes these pipelined requests
+    concurrently, sending back the responses as soon as they are finished, possibly in a different order. A reader
+    thread receives the responses and matches them to the waiting requests by their id. That way a slow request does
+    not block the fast requests sent after it, while all of them share the same connection.
+    The 'submit' method sends a request and returns a 'concurrent.futures.Future' for its response, the 'request'
+    method does the same, but waits for the response.
+    The login is being done through a separate short lived connection, as with an ordinary client.
+
+    Attributes:
+        max_in_flight: The maximum amount of requests, that may be waiting for their response at the same time
+        timeout: The amount of seconds 'request' waits for a response before raising a TimeoutError
+        pending_requests: The dictionary, with the ids of the requests, that are waiting for a response, as the keys
+            and the Future objects for those responses as the values
+    """
+    DEFAULT_MAX_IN_FLIGHT = 32
+
+    def __init__(self, server_ip, server_port, max_in_flight=DEFAULT_MAX_IN_FLIGHT, timeout=10, codec_names=(),
+                 compression_names=(), download_cache=None):
+        PiverClient.__init__(self, server_ip, server_port, codec_names=codec_names,
+                             compression_names=compression_names, download_cache=download_cache)
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+
+        self.pending_requests = {}
+        self.request_ids = itertools.count(1)
+        self.in_flight_semaphore = threading.BoundedSemaphore(max_in_flight)
+        # The lock secures the sending through the connection as well as the access to the pending requests and to
+        # the connection itself, which is being replaced once it failed
+        self.pipeline_lock = threading.Lock()
+        self.pipeline_connection = None
+
+    def submit(self, method_name, parameter_list):
+        """
+        Sends a pipelined request to the server without waiting for the response.
+        Args:
+            method_name: The string name of the method of the handler object to be called
+            parameter_list: The list containing the positional arguments to this method in order
+
+        Returns:
+        The 'concurrent.futures.Future' object, that will contain the response to the request. In case the request
+        failed on the server or could not be sent, the future contains the error instead
+        """
+        self.check_login()
+        # Blocking until one of the requests in flight has been answered, in case the limit has been reached
+        self.in_flight_semaphore.acquire()
+        future = concurrent.futures.Future()
+        future.add_done_callback(lambda _: self.in_flight_semaphore.release())
+
+        with self.pipeline_lock:
+            request_id = next(self.request_ids)
+            request_transfer = RequestTransfer(self.authentication_code, method_name, parameter_list,
+                                               request_id=request_id)
+            self.pending_requests[request_id] = future
+            try:
+                connection = self._get_pipeline_connection()
+                send_object(connection.sock, request_transfer, connection.codec)
+            except Exception as error:
+                # The future has to be resolved in any case, as only that releases the slot of the request
+                del self.pending_requests[request_id]
+                # Errors of the serialization occur before anything is sent, so only the errors of the socket leave
+                # the connection in an unknown state
+                if isinstance(error, OSError):
+                    self._close_pipeline_connection(connection=self.pipeline_connection)
+                future.set_exception(error)
+
+        return future
+
+    def request(self, method_name, parameter_list):
+        """
+        Sends a pipelined request to the server and waits for its response. Can be called from multiple threads at the
+        same time, the requests will all be in flight through the same connection
+
+        Raises:
+            TimeoutError: In case the response did not arrive within the timeout of the client
+            Exception: In case the request failed on the server, the error, that occurred
+
+        Args:
+            method_name: The string name of the method of the handler object to be called
+            parameter_list: The list containing the positional arguments to this method in order
+
+        Returns:
+        Whatever the response to the specific request was
+        """
+        future = self.submit(method_name, parameter_list)
+        try:
+            return future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            # Giving up on the request, so that it does not hold its slot forever. In case the response arrived in
+            # the meantime, the future can not be cancelled anymore
+            if not self._cancel_request(future):
+                return future.result()
+            raise TimeoutError("The response to the request '{}' did not arrive in time".format(method_name))
+
+    def _cancel_request(self, future):
+        """
+        Removes the request of the given future from the pending requests and cancels the future, which releases the
+        slot of the request. A response arriving later on is ignored by the reader thread
+        Args:
+            future: The 'concurrent.futures.Future' object of the request
+
+        Returns:
+        The boolean value of whether the future was cancelled, False in case it was already done
+        """
+        with self.pipeline_lock:
+            for request_id, pending_future in self.pending_requests.items():
+                if pending_future is future:
+                    del self.pending_requests[request_id]
+                    break
+        return future.cancel()
+
+    def close(self):
+        """
+        Closes the pipelined connection. Requests, that are still waiting for their response fail with a
+        ConnectionAbortedError
+        Returns:
+        void
+        """
+        with self.pipeline_lock:
+            self._close_pipeline_connection(connection=self.pipeline_connection)
+
+    def _get_pipeline_connection(self):
+        """
+        Returns the connection used for the pipelined requests, establishing it and starting the reader thread for it,
+        in case there is none yet. Has to be called while holding the pipeline lock
+        Returns:
+        The 'PiverConnection' object
+        """
+        if self.pipeline_connection is None:
+            connection = PiverConnection(self.server_ip, self.server_port, timeout=self.timeout,
+                                         codec_names=self.codec_names, compression_names=self.compression_names)
+            connection.connect()
+            # The reader thread is supposed to wait for responses indefinitely, idle connections are being closed by
+            # the server, which ends the reader thread
+            connection.set_timeout(None)
+            self.pipeline_connection = connection
+            reader_thread = threading.Thread(target=self._read_responses, args=(connection,), daemon=True)
+            reader_thread.start()
+        return self.pipeline_connection
+
+    def _close_pipeline_connection(self, connection, error=None):
+        """
+        Closes the given connection in case it is the current pipeline connection and lets all requests, that are still
+        waiting for a response, fail. Has to be called while holding the pipeline lock
+        Args:
+            connection: The 'PiverConnection' object to close
+            error: The error, that caused the connection to be closed
+
+        Returns:
+        void
+        """
+        if connection is None or connection is not self.pipeline_connection:
+            return
+        connection.close()
+        self.pipeline_connection = None
+        if error is None:
+            error = ConnectionAbortedError("The connection was closed before the response arrived")
+        for future in self.pending_requests.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending_requests = {}
+
+    def _read_responses(self, connection):
+        """
+        The method run by the reader thread. Receives the responses from the given connection and resolves the futures
+        of the matching requests, until the connection is closed
+        Args:
+            connection: The 'PiverConnection' object, whose responses are to be read
+
+        Returns:
+        void
+        """
+        sock = connection.sock
+        while True:
+            try:
+                response = receive_object(sock)
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError) as error:
+                with self.pipeline_lock:
+                    self._close_pipeline_connection(connection, error=ConnectionAbortedError(str(error)))
+                return
+
+            # Errors, that could not be assigned to a request, for example because the server could not unpickle the
+            # request, make the connection unusable, as it is unknown which request failed
+            if not isinstance(response, RequestTransfer):
+                with self.pipeline_lock:
+                    self._close_pipeline_connection(connection, error=response)
+                return
+
+            with self.pipeline_lock:
+                future = self.pending_requests.pop(response.get_request_id(), None)
+            # The future might have been cancelled in the meantime
+            if future is None or future.done():
+                continue
+            exception = response.get_exception()
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(response.get_response())
+
+
+class AsyncPiverClient:
+    """
+    The asyncio counterpart to the PiverClient. All methods, that communicate with the server are coroutines, so that
+    an asyncio program can send many requests concurrently from a single thread. The requests are being pipelined
+    through a single connection: Every request is being assigned a request id and a reader task matches the responses,
+    which the server sends as soon as a request is done, to the waiting requests. The login is being done through a
+    separate short lived connection.
+
+    Examples:
+        client = AsyncPiverClient("localhost", 5000)
+        await client.login("username", "password")
+        responses = await asyncio.gather(*[client.request("get_learning_process", [subject, subsubject])
+                                           for subject, subsubject in subjects])
+        await client.close()
+
+    Attributes:
+        server_ip: The string, containing the servers IP address or hostname
+        server_port: The integer port on which the PiverServer is listening
+        authentication_code: The string authentication code obtained by the login. None before the login
+        timeout: The amount of seconds a request waits for its response before raising a TimeoutError
+        max_in_flight: The maximum amount of requests, that may be waiting for their response at the same time
+        codec_names: The list of the string names of the codecs, that are proposed to the server for the connection
+            of the requests
+        compression_names: The list of the string names of the compressions, that are advertised to the server
+    """
+    DEFAULT_MAX_IN_FLIGHT = 256
+
+    def __init__(self, server_ip, server_port, timeout=10, max_in_flight=DEFAULT_MAX_IN_FLIGHT, codec_names=(),
+                 compression_names=()):
+        self.server_ip = server_ip
+        self.server_port = server_port
+        self.authentication_code = None
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.codec_names = list(codec_names)
+        self.compression_names = list(compression_names)
+        self.codec = PICKLE_CODEC
+
+        self.request_ids = itertools.count(1)
+        self.pending_requests = {}
+        # The asyncio primitives are created lazily, so that they belong to the event loop, that actually uses the
+        # client
+        self.in_flight_semaphore = None
+        self.connection_lock = None
+        self.reader = None
+        self.writer = None
+        self.reader_task = None
+
+    async def login(self, username, password):
+        """
+        Logs into the server using the given username and password, to obtain the authentication code for all further
+        requests
+
+        Raises:
+            ConnectionRefusedError: In case the username is not registered in the server database
+            PermissionError: In case the password is not correct
+
+        Args:
+            username: The string of the username
+            password: The string of the password
+
+        Returns:
+        The string of the authentication code
+        """
+        login_transfer = LoginTransfer(username, password)
+        login_transfer_response = await self.send(login_transfer)
+        authentication_code = login_transfer_response.get_authentication()
+        self.authentication_code = authentication_code
+        return authentication_code
+
+    async def send(self, obj, sink=None, source=None):
+        """
+        Sends the given object to the server through a new connection, that is closed after the response has been
+        received. Data the server streams after the response is passed to the 'sink' callable chunk by chunk and the
+        data of the 'source' iterable is streamed to the server after the object
+
+        Raises:
+            Exception: In case the server sent back an Exception object as the response
+
+        Args:
+            obj: The object to be send to the server
+            sink: The callable, which is called with every chunk of data streamed after the response
+            source: The iterable of bytes like objects to stream to the server after the object. It is iterated within
+                the default executor of the event loop
+
+        Returns:
+        The object, that has been received in response to the sent object
+        """
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.server_ip, self.server_port),
+                                                self.timeout)
+        try:
+            flags, parts = encode_object(obj)
+            if source is None:
+                await send_frame_async(writer, parts, flags=flags)
+            else:
+                await send_frame_async(writer, parts, flags=flags | FRAME_STREAM_FLAG)
+                # The chunks are read within the thread pool, as reading them, for example from a file, might block
+                loop = asyncio.get_running_loop()
+                chunks = iter(source)
+                while True:
+                    chunk = await loop.run_in_executor(None, next, chunks, None)
+                    if chunk is None:
+                        break
+                    if chunk:
+                        await send_frame_async(writer, chunk, flags=FRAME_DATA_FLAG)
+                await send_frame_async(writer, b"", flags=FRAME_DATA_FLAG)
+            flags, payload = await asyncio.wait_for(receive_frame_async(reader), self.timeout)
+            if flags & FRAME_STREAM_FLAG:
+                while True:
+                    data_flags, data = await asyncio.wait_for(receive_frame_async(reader), self.timeout)
+                    if not data_flags & FRAME_DATA_FLAG:
+                        raise ConnectionAbortedError("Received a response frame in the middle of a streamed response")
+                    if not data:
+                        break
+                    if sink is not None:
+                        sink(data)
+        except asyncio.IncompleteReadError:
+            raise ConnectionAbortedError("The server closed the connection before the response was complete")
+        finally:
+            writer.close()
+        response = decode_object(flags, payload)
+        PiverClient._raise_exception(response)
+        return response
+
+    async def request(self, method_name, parameter_list):
+        """
+        Sends a request to the server and waits for its response. Many requests can be awaited concurrently, they are
+        all in flight through the same connection
+
+        Raises:
+            PermissionError: In case the client is not logged in
+            TimeoutError: In case the response did not arrive within the timeout of the client
+            Exception: In case the request failed on the server, the error, that occurred
+
+        Args:
+            method_name: The string name of the method of the handler object to be called
+            parameter_list: The list containing the positional arguments to this method in order
+
+        Returns:
+        Whatever the response to the specific request was
+        """
+        self.check_login()
+        await self._connect()
+        async with self.in_flight_semaphore:
+            request_id = next(self.request_ids)
+            request_transfer = RequestTransfer(self.authentication_code, method_name, parameter_list,
+                                               request_id=request_id)
+            future = asyncio.get_running_loop().create_future()
+            self.pending_requests[request_id] = future
+            try:
+                flags, parts = encode_object(request_transfer, self.codec)
+                async with self.connection_lock:
+                    await send_frame_async(self.writer, parts, flags=flags)
+                return await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError("The response to the request '{}' did not arrive in time".format(method_name))
+            finally:
+                self.pending_requests.pop(request_id, None)
+
+    async def download_file(self, relative_server_path, save_path, offset=None, length=None, resume=True,
+                            retries=PiverClient.DOWNLOAD_RETRIES):
+        """
+        Downloads a file from the server and saves it to the given path. The server starts a 'SimpleFileSendServer' for
+        the file and sends back a 'FileTransferTicket' with its port, from which the file is then being downloaded.
+        Just like with 'PiverClient.download_file', an existing file is being resumed, broken downloads are resumed up
+        to 'retries' times and the digest of the complete file is being checked, unless only a range of the file was
+        requested
+        Args:
+            relative_server_path: The string path that specifies the file to download. The path is supposed to be
+                relative to the servers main folder
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts. None for the whole file
+            length: The integer amount of bytes to download. None for everything up to the end of the file
+            resume: The boolean value of whether an existing file at 'save_path' is to be resumed
+            retries: The amount of times the download is resumed or restarted after it failed
+
+        Returns:
+        The string path of the saved file
+        """
+        return await self._download(self._receive_file, relative_server_path, save_path, offset, length, resume,
+                                    retries)
+
+    async def upload_file(self, file_path, relative_server_path, overwrite=False):
+        """
+        Uploads a file to the server through a connection of its own, just like 'PiverClient.upload_file'
+        Args:
+            file_path: The string path of the local file to upload
+            relative_server_path: The string path, under which the file is to be saved on the server, relative to the
+                servers main folder
+            overwrite: The boolean value of whether an existing file on the server may be replaced
+
+        Returns:
+        The 'FileTransferTicket' describing the uploaded file
+        """
+        self.check_login()
+        loop = asyncio.get_running_loop()
+        file_size = os.path.getsize(file_path)
+        digest = await loop.run_in_executor(None, compute_file_digest, file_path)
+        request_transfer = RequestTransfer(self.authentication_code, "upload_file",
+                                           [relative_server_path, file_size, digest, overwrite])
+        response = await self.send(request_transfer, source=iter_file_chunks(file_path))
+        return response.get_response()
+
+    async def download_files(self, files, max_concurrent=PiverClient.MAX_CONCURRENT_DOWNLOADS, progress=None,
+                             resume=True, retries=PiverClient.DOWNLOAD_RETRIES):
+        """
+        Downloads multiple files at the same time with 'stream_file', with at most 'max_concurrent' downloads running
+        at once, just like 'PiverClient.download_files'
+        Args:
+            files: The list of tuples (relative_server_path, save_path), that specify the files to download
+            max_concurrent: The maximum amount of files, that are downloaded at the same time
+            progress: The 'DownloadProgress' object, that keeps track of the downloads. None to create a new one
+            resume: The boolean value of whether existing files are to be resumed
+            retries: The amount of times each download is resumed or restarted after it failed
+
+        Returns:
+        The list with the string path of the saved file or the error, that made the download fail, for every file and
+        in the same order
+        """
+        self.check_login()
+        files = list(files)
+        progress = DownloadProgress() if progress is None else progress
+        progress.start(len(files))
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def download(relative_server_path, save_path):
+            async with semaphore:
+                try:
+                    await self.stream_file(relative_server_path, save_path, resume=resume, retries=retries,
+                                           progress=progress)
+                except Exception as error:
+                    progress.finish_file(save_path, error)
+                    return error
+            progress.finish_file(save_path)
+            return save_path
+
+        return list(await asyncio.gather(*[download(relative_server_path, save_path)
+                                           for relative_server_path, save_path in files]))
+
+    async def stream_file(self, relative_server_path, save_path, offset=None, length=None, resume=True,
+                          retries=PiverClient.DOWNLOAD_RETRIES, progress=None):
+        """
+        Downloads a file from the server, by letting the server stream the file over a request connection, just like
+        'PiverClient.stream_file'. As the data is streamed, the file is received through a connection of its own and
+        not the one shared by the other requests of the client
+        Args:
+            relative_server_path: The string path that specifies the file to download. The path is supposed to be
+                relative to the servers main folder
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts. None for the whole file
+            length: The integer amount of bytes to download. None for everything up to the end of the file
+            resume: The boolean value of whether an existing file at 'save_path' is to be resumed
+            retries: The amount of times the download is resumed or restarted after it failed
+            progress: The 'DownloadProgress' object, to which the received bytes are added, or None
+
+        Returns:
+        The string path of the saved file
+        """
+        self.check_login()
+        receive_range = functools.partial(self._receive_file_stream, progress=progress)
+        return await self._download(receive_range, relative_server_path, save_path, offset, length, resume, retries)
+
+    async def _download(self, receive_range, relative_server_path, save_path, offset, length, resume, retries):
+        """
+        The asyncio counterpart to 'PiverClient._download'. Downloads a file or a range of it with the given coroutine
+        function, resuming the download in case it broke off and restarting it in case the integrity check of the file
+        failed
+        Args:
+            receive_range: The coroutine function, that downloads a range of the file. It is called with the path on
+                the server, the save path, the offset, the length and whether to verify the digest
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts. None for the whole file
+            length: The integer amount of bytes to download. None for everything up to the end of the file
+            resume: The boolean value of whether an existing file at 'save_path' is to be resumed
+            retries: The amount of times the download is resumed or restarted after it failed
+
+        Returns:
+        The string path of the saved file
+        """
+        range_request = offset is not None or length is not None
+        attempt = 0
+        while True:
+            start = (offset or 0) if range_request else PiverClient._get_resume_offset(save_path, resume)
+            try:
+                await receive_range(relative_server_path, save_path, start, length, not range_request)
+                return save_path
+            except (FileIntegrityError, ValueError, ConnectionError, TimeoutError, asyncio.TimeoutError) as error:
+                PiverClient._recover_download(error, save_path, range_request, start, attempt, retries)
+            attempt += 1
+
+    async def _receive_file(self, relative_server_path, save_path, offset, length, verify):
+        """
+        Downloads a range of a file through a file server
+        Args:
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes to download or None
+            verify: The boolean value of whether the digest of the file is to be checked, once it is complete
+
+        Returns:
+        The 'FileTransferTicket' of the download
+        """
+        ticket = await self.request("download_file", [relative_server_path, offset, length])
+        await self._download_range(ticket, save_path)
+        if verify:
+            await self._verify_download(ticket, save_path)
+        return ticket
+
+    async def _receive_file_stream(self, relative_server_path, save_path, offset, length, verify, progress=None):
+        """
+        Requests a range of a file to be streamed by the server and writes it to the same position within the file at
+        the given path
+        Args:
+            relative_server_path: The string path that specifies the file to download
+            save_path: The string path to where the file is supposed to the saved to
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes to download or None
+            verify: The boolean value of whether the digest of the file is to be checked, once it is complete
+            progress: The 'DownloadProgress' object, to which the received bytes are added, or None
+
+        Raises:
+            ConnectionAbortedError: In case the stream ended before the whole range was received
+
+        Returns:
+        The 'FileTransferTicket' of the download
+        """
+        request_transfer = RequestTransfer(self.authentication_code, "stream_file",
+                                           [relative_server_path, offset, length])
+        with open_download_file(save_path, offset) as file:
+            sink = file.write if progress is None else progress.create_sink(file.write)
+            response = await self.send(request_transfer, sink=sink)
+            ticket = response.get_response()
+            received_size = file.tell() - offset
+            if received_size != ticket.get_length():
+                raise ConnectionAbortedError("The stream ended after {} of {} bytes".format(received_size,
+                                                                                           ticket.get_length()))
+            if ticket.is_complete_file():
+                file.truncate()
+        if verify:
+            await self._verify_download(ticket, save_path)
+        return ticket
+
+    @staticmethod
+    async def _verify_download(ticket, save_path):
+        """
+        Compares the digest of the downloaded file with the one of the file on the server, in case the whole file was
+        downloaded. The digest is computed within the default executor of the event loop
+
+        Raises:
+            FileIntegrityError: In case the digests do not match
+
+        Args:
+            ticket: The 'FileTransferTicket' of the download
+            save_path: The string path of the downloaded file
+
+        Returns:
+        void
+        """
+        if not ticket.is_complete_file():
+            return
+        digest = await asyncio.get_running_loop().run_in_executor(None, compute_file_digest, save_path)
+        if digest != ticket.get_digest():
+            raise FileIntegrityError("The digest of the downloaded file '{}' does not match the digest of the file on "
+                                     "the server".format(save_path))
+
+    async def _download_range(self, ticket, save_path):
+        """
+        Receives the range of the file described by the ticket from the file server and writes it to the same position
+        within the file at the given path
+        Args:
+            ticket: The 'FileTransferTicket' object the server sent in response to the download request
+            save_path: The string path to where the file is supposed to the saved to
+
+        Returns:
+        void
+        """
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.server_ip, ticket.get_port()),
+                                                self.timeout)
+        try:
+            # The file server first announces the size of the range and then streams it
+            header = await asyncio.wait_for(reader.readexactly(FILE_SIZE_HEADER.size), self.timeout)
+            length, = FILE_SIZE_HEADER.unpack(header)
+            received_size = 0
+            with open_download_file(save_path, ticket.get_offset()) as file:
+                while received_size < length:
+                    data = await asyncio.wait_for(
+                        reader.read(min(length - received_size, SimpleClientFileDownloader.CHUNK_SIZE)),
+                        self.timeout
+                    )
+                    if not data:
+                        raise ConnectionAbortedError("The file server closed the connection after {} of {} "
+                                                     "bytes".format(received_size, length))
+                    file.write(data)
+                    received_size += len(data)
+                if ticket.is_complete_file():
+                    file.truncate()
+        except asyncio.IncompleteReadError:
+            raise ConnectionAbortedError("The file server closed the connection before announcing the file size")
+        finally:
+            writer.close()
+
+    async def close(self):
+        """
+        Closes the connection of the client. Requests, that are still waiting for their response fail with a
+        ConnectionAbortedError
+        Returns:
+        void
+        """
+        if self.writer is not None:
+            self.writer.close()
+        if self.reader_task is not None:
+            await asyncio.gather(self.reader_task, return_exceptions=True)
+
+    def check_login(self):
+        """
+        Raises a PermissionError in case the client is not logged in
+        Returns:
+        void
+        """
+        if not self.is_logged_in():
+            error_message = "The client does not have a authentication code. Log in first!"
+            raise PermissionError(error_message)
+
+    def is_logged_in(self):
+        """
+        Returns:
+        The boolean value of whether the client is logged into the server system, meaning the client posses an
+        authentication code
+        """
+        return self.authentication_code is not None
+
+    async def _connect(self):
+        """
+        Establishes the connection for the requests and starts the reader task, in case there is no open connection
+        Returns:
+        void
+        """
+        if self.connection_lock is None:
+            self.connection_lock = asyncio.Lock()
+            self.in_flight_semaphore = asyncio.Semaphore(self.max_in_flight)
+        if self.writer is not None and not self.writer.is_closing():
+            return
+        async with self.connection_lock:
+            if self.writer is not None and not self.writer.is_closing():
+                return
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.server_ip, self.server_port), self.timeout)
+            self.codec = PICKLE_CODEC
+            if self.codec_names or self.compression_names:
+                try:
+                    self.codec = await self._negotiate_codec(reader, writer)
+                except BaseException:
+                    writer.close()
+                    raise
+            self.reader, self.writer = reader, writer
+            self.reader_task = asyncio.ensure_future(self._read_responses(self.reader, self.writer))
+
+    async def _negotiate_codec(self, reader, writer):
+        """
+        Proposes the codecs of the client to the server through the freshly established connection
+        Args:
+            reader: The 'asyncio.StreamReader' of the connection
+            writer: The 'asyncio.StreamWriter' of the connection
+
+        Returns:
+        The codec object, the server chose for the connection
+        """
+        flags, parts = encode_object(CodecNegotiationTransfer(self.codec_names, self.compression_names))
+        try:
+            await send_frame_async(writer, parts, flags=flags)
+        except ConnectionError as error:
+            # A server refusing the connection closes it right after sending its error, which might still be read
+            try:
+                flags, payload = await asyncio.wait_for(receive_frame_async(reader), self.timeout)
+            except (OSError, EOFError, ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                raise error
+            return get_negotiated_codec(decode_object(flags, payload))
+        flags, payload = await asyncio.wait_for(receive_frame_async(reader), self.timeout)
+        return get_negotiated_codec(decode_object(flags, payload))
+
+    async def _read_responses(self, reader, writer):
+        """
+        The coroutine run by the reader task. Receives the responses and resolves the futures of the matching requests,
+        until the connection is closed, which lets all the requests, that are still waiting, fail
+        Args:
+            reader: The 'asyncio.StreamReader' of the connection
+            writer: The 'asyncio.StreamWriter' of the connection
+
+        Returns:
+        void
+        """
+        error = None
+        try:
+            while True:
+                flags, payload = await receive_frame_async(reader)
+                response = decode_object(flags, payload)
+                # Errors, that can not be assigned to a request make the connection unusable
+                if not isinstance(response, RequestTransfer):
+                    error = response
+                    return
+
+                future = self.pending_requests.get(response.get_request_id())
+                if future is None or future.done():
+                    continue
+                exception = response.get_exception()
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(response.get_response())
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, pickle.UnpicklingError) as reader_error:
+            error = ConnectionAbortedError(str(reader_error))
+        finally:
+            writer.close()
+            if error is None:
+                error = ConnectionAbortedError("The connection was closed before the response arrived")
+            for future in self.pending_requests.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+class AuthenticationGuard:
+    """
+    The AuthenticationGuard object is one of the main instances during the server runtime. It is created on server
+    startup and does not require/load any data from memory. The AuthenticationGuard stores and manages the
+    authentication code system.
+    Whenever a user wants to communicate/connect with the server system for the first time, the profile information
+    (username and password) have to be transmitted, the server then creates a individual authentication code for the
+    user, which the user side program has to use as a prefix to all requests, so that the user does not have to enter
+    his info all the time, and that the server knows for whose user profile the incoming request are supposed to be
+    processed.
+
     THE CODE
     The code itself consists of two separate parts, that are being separated by a double point ":".
     The first part simply is a random number in the range from 1 to 1000, turned into a hexadecimal value, to add
@@ -500,476 +3943,2858 @@ class AuthenticationGuard:
     in an attempt to save space. The timestamp functions as an expiration date, after which the code cannot be used
     anymore and the user has to login to get a new one.
 
-    Aside from providing the creation and storage of the existing codes, the AuthenticationGuard also manages, the
-    reference of which codes have been assigned to which users, that means that a RequestHandler has to consult the
-    Guard object, to obtain the username, from which the request came. The Guard object also contains the functionality
-    to counter check for the validity of those codes
+    Aside from providing the creation and storage of the existing codes, the AuthenticationGuard also manages, the
+    reference of which codes have been assigned to which users, that means that a RequestHandler has to consult the
+    Guard object, to obtain the username, from which the request came. The Guard object also contains the functionality
+    to counter check for the validity of those codes
+
+    INDEXES
+    All lookups of the guard are constant time, no matter how many users are logged in: the codes are kept in a set,
+    the usernames are indexed by code and the codes by username, and the expiration timestamp of every code is parsed
+    only once, when the code is created. Expired codes are removed lazily: a heap orders the codes by their expiration
+    and whenever the guard is used, the codes at the top of the heap, that have expired, are being removed. That way
+    every code is removed exactly once, without having to scan all codes and without a separate thread.
+    As the handler threads of the server use the guard concurrently, all access is secured by a lock.
+
+    Attributes:
+        existing_codes: The set, that contains the codes that are currently active
+        user_dictionary: The dictionary, that contains the reference of which user is in possession of which
+            authentication code, the codes being the keys and the usernames being the values to them
+        code_dictionary: The reverse of the user dictionary, the usernames being the keys and the most recent code of
+            the user being the values
+        expiration_dictionary: The dictionary, that maps the codes to their integer expiration timestamps
+        expiration_heap: The heap of tuples of the expiration timestamp and the code, used to remove expired codes
+        lock: The lock securing the access to the codes
+
+    """
+    # The amount of time a authentication code is considered to be valid, beginning from the moment of creation
+    CODE_LIFETIME_HOURS = 24
+
+    def __init__(self):
+        # The object will keep track of the already existing codes by storing all existing codes within this set
+        self.existing_codes = set()
+
+        # This dictionary will contain information about which code was distributed to which user. The keys will be the
+        # string versions of the given authentication code and the assigned value will be the username of the user,
+        # currently in possession of the code. The code dictionary is the reverse index, so that the code of a user can
+        # be found without iterating the whole dictionary
+        self.user_dictionary = {}
+        self.code_dictionary = {}
+
+        # The expiration timestamp of each code is stored, so it does not have to be parsed from the code with every
+        # request. The heap orders the codes by expiration, so that the expired ones can be removed in order
+        self.expiration_dictionary = {}
+        self.expiration_heap = []
+
+        self.lock = threading.RLock()
+
+    def create_authentication_code(self, username):
+        """
+        Creates a authentication code for the user, whose username was passed to the method. Authentication codes are
+        part of the authentication process of the PiLearn Server system. After the user submits username/password on a
+        one time occasion, the server sends a created authentication code in response, which the user side program
+        has to use as a prefix to all requests, so that the user does not have to enter his info all the time, and that
+        the server knows for whose user profile the incoming request are supposed to be processed.
+
+        THE CODE
+        The code itself consists of two separate parts, that are being separated by a double point ":".
+        The first part simply is a random number in the range from 1 to 1000, turned into a hexadecimal value, to add
+        a safety buffer, so that each code is individual.
+        The second part is a timestamp integer code, from the python "datetime" module, that describes the time exactly
+        24 hours into the future from the moment of creating the code. The timestamp is also turned into a hexadecimal
+        in an attempt to save space. The timestamp functions as an expiration date, after which the code cannot be used
+        anymore and the user has to login to get a new one.
+
+        EXAMPLE
+        authentication code: '0x21f:0x57e76895'
+
+        Args:
+            username: The username string, for which the authentication code is being created
+
+        Returns:
+        The string of the created authentication code
+        """
+        with self.lock:
+            self.remove_expired_codes()
+
+            is_valid = False
+            authentication_code = ""
+            future_datetime_timestamp = 0
+            while not is_valid:
+                # The authentication code consists of two separate parts. The first part is a randomly generated integer
+                # in the range from 1 to 1000 turned into a hexadecimal. The second part is a timestamp, that is created
+                # to reflect the time exactly 24 hours after the moment in which the code was created. The timestamp
+                # functions not only as a definite identifier, but also as an expire date for the authentication code.
+                # The timestamp is also being turned into a hexadecimal, in the attempt to save digits
+                random_number = hex(random.randint(1, 1000))
+
+                # Creating the current datetime object and adding a timedelta of 24 hours
+                current_datetime = datetime.datetime.now()
+                future_datetime = current_datetime + datetime.timedelta(hours=self.CODE_LIFETIME_HOURS)
+                # The timestamp is being concerted to integer before being converted to hex, because the timestamp is a
+                # float number and hex() doesnt convert floats. The information resolution of the timestamp after the
+                # int conversion still correctly reflects seconds
+                future_datetime_timestamp = int(future_datetime.timestamp())
+
+                authentication_code = "{}:{}".format(str(random_number), hex(future_datetime_timestamp))
+                if authentication_code not in self.existing_codes:
+                    is_valid = True
+
+            # Adding the authentication code to the set of already existing codes, so that users will not get the same
+            # code and adding the username reference to the dictionaries of users, currently possessing a code.
+            self.existing_codes.add(authentication_code)
+            self.user_dictionary[authentication_code] = username
+            self.code_dictionary[username] = authentication_code
+            self.expiration_dictionary[authentication_code] = future_datetime_timestamp
+            heapq.heappush(self.expiration_heap, (future_datetime_timestamp, authentication_code))
+
+        return authentication_code
+
+    def user_exists(self, username):
+        """
+        Args:
+            username: The string format of the username in question
+
+        Returns:
+        The boolean value of whether or not a user with the given username currently possesses a valid authentication
+        code
+        """
+        with self.lock:
+            self.remove_expired_codes()
+            return username in self.code_dictionary
+
+    def is_valid_authentication(self, authentication_code):
+        """
+        Checks whether or not the passed authentication code is still valid or not, by comparing the expiration
+        timestamp, that was stored at the creation of the code, with the current time. Codes, that were not created by
+        this guard, are never valid. In case the code has expired, it is deleted from the internal reference and False
+        is returned.
+        Args:
+            authentication_code: The string authentication code, that is to be checked
+
+        Returns:
+        The boolean value of whether or not the authentication code is still valid
+        """
+        # The code is sent by the client and might be any object, even one, that can not be looked up
+        if not isinstance(authentication_code, str):
+            return False
+        with self.lock:
+            expiration_timestamp = self.expiration_dictionary.get(authentication_code)
+            if expiration_timestamp is None:
+                return False
+
+            if expiration_timestamp > time.time():
+                return True
+            else:
+                self.remove_authentication_code(authentication_code)
+                return False
+
+    def remove_authentication_code(self, authentication_code):
+        """
+        Removes the given code from all internal references, so that it can not be used anymore. Codes, that do not
+        exist, are ignored
+        Args:
+            authentication_code: The string authentication code, that is to be removed
+
+        Returns:
+        void
+        """
+        with self.lock:
+            self.existing_codes.discard(authentication_code)
+            self.expiration_dictionary.pop(authentication_code, None)
+            username = self.user_dictionary.pop(authentication_code, None)
+            # The reverse index only points to the most recent code of the user, which is not necessarily this one
+            if username is not None and self.code_dictionary.get(username) == authentication_code:
+                del self.code_dictionary[username]
+
+    def remove_expired_codes(self):
+        """
+        Removes all codes, that have expired, by popping them off the top of the expiration heap. Entries of codes,
+        that have already been removed otherwise, are skipped
+        Returns:
+        The integer amount of codes, that have been removed
+        """
+        removed_count = 0
+        current_timestamp = time.time()
+        with self.lock:
+            while self.expiration_heap and self.expiration_heap[0][0] <= current_timestamp:
+                expiration_timestamp, authentication_code = heapq.heappop(self.expiration_heap)
+                if self.expiration_dictionary.get(authentication_code) == expiration_timestamp:
+                    self.remove_authentication_code(authentication_code)
+                    removed_count += 1
+        return removed_count
+
+    def get_username(self, authentication_code):
+        """
+        Gets the username, that was assigned to the given authentication code from the internal dictionary reference
+        Args:
+            authentication_code: The string authentication code for which the username is requested
+
+        Returns:
+        The username, to the user, which is currently in possession of the passed authentication code
+        """
+        # The method checks whether the code exists or not, but there is no consequence in case it doesnt, because
+        # there would not be a situation in which a unknown authentication code would have been used.
+        # TODO: add exception anyways
+        if not isinstance(authentication_code, str):
+            return None
+        return self.user_dictionary.get(authentication_code)
+
+    def get_authentication_code(self, username):
+        """
+        Looks up the most recent authentication code of the user in question within the reverse index
+        Args:
+            username: The string format of the username for which to return the authentication code for
+
+        Raises:
+            KeyError: In case the user does not possess an authentication code
+
+        Returns:
+        The string format of the authentication code
+        """
+        with self.lock:
+            if username not in self.code_dictionary:
+                raise KeyError("The user '{}' does not posses an authentication code!".format(username))
+            return self.code_dictionary[username]
+
+    @staticmethod
+    def get_timestamp_from_authentication_code(authentication_code):
+        """
+        Converts the given authentication code string into the datetime timestamp integer, that was being stored within
+        the code
+        Args:
+            authentication_code: The string of the authentication code, that is to be converted into a timestamp
+
+        Returns:
+        The integer timestamp, that was stored inside the code. The expiration date of the code
+        """
+        # Splitting the code by its separator to get the two segments individually, then first converting the second
+        # part from string to hex(base 16) and then to integer
+        code_segments = authentication_code.split(":")
+        code_timestamp = int(int(code_segments[1], 16))
+        return code_timestamp
+
+    @staticmethod
+    def get_datetime_from_authentication_code(authentication_code):
+        """
+        Converts the given authentication code string into the datetime object, that was being stored within
+        the codes timestamp
+        Args:
+            authentication_code: The string of the authentication code, that is to be converted into datetime object
+
+        Returns:
+        The datetime object, whose information was stored inside the code. The expiration date of the code
+        """
+        code_timestamp = AuthenticationGuard.get_timestamp_from_authentication_code(authentication_code)
+        code_datetime = datetime.datetime.fromtimestamp(code_timestamp)
+        return code_datetime
+
+
+class SignedAuthenticationGuard(AuthenticationGuard):
+    """
+    An authentication guard, that does not store the codes it creates at all. Instead the codes are tokens, that
+    carry the username and the expiration timestamp themselves and are signed with a HMAC of a secret key, so that they
+    can not be forged or altered by the clients. Verifying a token is pure CPU work without any lookup or lock, which
+    means, that multiple server processes, given the same secret key, all accept the tokens issued by any of them and
+    that the tokens stay valid across restarts of the server.
+
+    THE TOKEN
+    The token consists of three parts separated by double points ":". The first part is the hex encoded UTF-8 username,
+    the second part is the hexadecimal expiration timestamp, just like the second part of the codes of the
+    AuthenticationGuard, and the third part is the hex digest of the HMAC of the first two parts.
+
+    EXAMPLE
+    authentication code: '616c696365:0x57e76895:9f2c...'
+
+    Notes:
+        As no state is kept, a token can not be revoked before it expires and every login creates a new token. The
+        secret key has to be kept private, as anyone knowing it can issue tokens for any user. In case no key is given,
+        a random one is generated, which is only known to the current process
+
+    Attributes:
+        secret_key: The bytes secret key, with which the tokens are signed
+    """
+    # The hash function used for the HMAC of the tokens
+    SIGNATURE_ALGORITHM = "sha256"
+    # The length of randomly generated secret keys in bytes
+    SECRET_KEY_LENGTH = 32
+
+    def __init__(self, secret_key=None):
+        super(SignedAuthenticationGuard, self).__init__()
+        if secret_key is None:
+            secret_key = os.urandom(self.SECRET_KEY_LENGTH)
+        elif isinstance(secret_key, str):
+            secret_key = secret_key.encode("utf-8")
+        self.secret_key = secret_key
+
+    def create_authentication_code(self, username):
+        """
+        Creates a signed token for the user, whose username was passed, which expires CODE_LIFETIME_HOURS from now
+        Args:
+            username: The username string, for which the token is being created
+
+        Returns:
+        The string of the created token
+        """
+        expiration_timestamp = int(time.time() + self.CODE_LIFETIME_HOURS * 3600)
+        payload = "{}:{}".format(username.encode("utf-8").hex(), hex(expiration_timestamp))
+        return "{}:{}".format(payload, self._sign(payload))
+
+    def user_exists(self, username):
+        """
+        As the tokens are not stored, the guard never knows of existing ones, so every login creates a new token
+        Returns:
+        False
+        """
+        return False
+
+    def is_valid_authentication(self, authentication_code):
+        """
+        Checks whether the signature of the given token is correct and whether the token has not expired yet
+        Args:
+            authentication_code: The string token, that is to be checked
+
+        Returns:
+        The boolean value of whether or not the token is valid
+        """
+        return self._verify(authentication_code) is not None
+
+    def remove_authentication_code(self, authentication_code):
+        """
+        Tokens are not stored and thus can not be removed. They stay valid until they expire
+        Returns:
+        void
+        """
+        pass
+
+    def remove_expired_codes(self):
+        """
+        Returns:
+        0, as there are no stored codes, that could expire
+        """
+        return 0
+
+    def get_username(self, authentication_code):
+        """
+        Args:
+            authentication_code: The string token for which the username is requested
+
+        Returns:
+        The username, that is embedded into the token or None, in case the token is not valid
+        """
+        return self._verify(authentication_code)
+
+    def get_authentication_code(self, username):
+        """
+        Raises:
+            KeyError: Always, as the tokens are not stored
+        """
+        raise KeyError("The tokens of the user '{}' are not stored by the guard!".format(username))
+
+    def _sign(self, payload):
+        """
+        Args:
+            payload: The string of the username and expiration part of the token
+
+        Returns:
+        The hex string HMAC of the payload
+        """
+        # Tokens sent by clients might contain lone surrogates, which can not be encoded strictly
+        payload_bytes = payload.encode("utf-8", errors="surrogatepass")
+        return hmac.new(self.secret_key, payload_bytes, self.SIGNATURE_ALGORITHM).hexdigest()
+
+    def _verify(self, authentication_code):
+        """
+        Checks the signature and the expiration of the given token
+        Args:
+            authentication_code: The string token, that is to be checked
+
+        Returns:
+        The string username embedded into the token, in case the token is valid, None otherwise
+        """
+        if not isinstance(authentication_code, str):
+            return None
+        payload, separator, signature = authentication_code.rpartition(":")
+        # The signatures are compared as bytes, as the comparison of strings does not support non ASCII characters
+        signature_bytes = signature.encode("utf-8", errors="surrogatepass")
+        if not separator or not hmac.compare_digest(self._sign(payload).encode("ascii"), signature_bytes):
+            return None
+
+        # The payload can be trusted to be well formed from here on, as it was created by this guard
+        username_part, expiration_part = payload.split(":")
+        if int(expiration_part, 16) <= time.time():
+            return None
+        return bytes.fromhex(username_part).decode("utf-8")
+
+
+class PiverServerMixIn:
+    """
+    The configuration shared by the 'PiverServer', its subclasses and the 'AsyncPiverServer': the references to the
+    objects the handlers work with, the codecs and compressions, the limits of the downloads and uploads, the
+    statistics, the response cache, the rate limiter and the scheduler of the requests. The servers pass all of their
+    keyword arguments, that are not specific to them, on to the 'configure' method.
+
+    Attributes:
+        authentication_guard: The AuthenticationGuard object for the server, to manage the indivudual user codes
+        user_dict: The user dict, containing the profiles of the registered users
+        port_manager: The 'PortManager', from which the ports of the file servers of the downloads are leased
+        idle_timeout: The amount of seconds a connection may be idle between two requests, before it is closed
+        codec_names: The list of the string names of the codecs, the server agrees to use, in case a client proposes
+            them. By default all the codecs of this module
+        compression_names: The list of the string names of the compressions, the server agrees to use for the
+            responses, in case a client advertises them. By default all the compressions of this module
+        compression_threshold: The minimum amount of bytes of a serialized response to be compressed
+        compression_statistics: The 'CompressionStatistics' object, keeping track of the compression per method
+        download_slots: The semaphore limiting the amount of files, that are streamed at the same time
+        max_upload_size: The maximum amount of bytes of a file, that is uploaded to the server
+        server_statistics: The 'ServerStatistics' object, keeping track of the requests per method
+        statistics_path: The string path of the JSON file, to which the statistics are dumped periodically or None
+        statistics_interval: The amount of seconds between two dumps of the statistics
+        response_cache: The 'ResponseCache' of the serialized responses of the cacheable methods or None, in case
+            the 'response_cache_size' is 0
+        rate_limiter: The 'RateLimiter' limiting the requests per second of every user to 'rate_limit' (with bursts
+            of up to 'rate_limit_burst' requests) or None, in case no rate limit was given
+        login_rate_limiter: The 'RateLimiter' limiting the failed logins per second of every client address to the
+            same rate as the requests of the users or None, in case no rate limit was given. Failed logins do not count
+            against the rate limit of the user, as anybody could use up the requests of a user that way
+        request_scheduler: The 'FairScheduler' limiting the amount of requests processed at the same time to
+            'max_concurrent_requests' and sharing them fairly among the users, according to the 'user_weights'. None,
+            in case no maximum was given
+    """
+    # The default amount of seconds after which an idle client connection is being closed by the server
+    IDLE_TIMEOUT = 60
+    # The default minimum size of a serialized response in bytes, for it to be compressed
+    COMPRESSION_THRESHOLD = 16384
+    # The default maximum amount of files, that are streamed to the clients at the same time
+    MAX_CONCURRENT_DOWNLOADS = 32
+    # The default maximum size of an uploaded file in bytes
+    MAX_UPLOAD_SIZE = 256 * 1024 ** 2
+    # The default amount of seconds between two dumps of the server statistics
+    STATISTICS_INTERVAL = 60
+    # The default maximum amount of bytes of the cached responses
+    RESPONSE_CACHE_SIZE = ResponseCache.DEFAULT_MAX_SIZE
+    # The amount of seconds a request waits for a processing slot of the scheduler, before the server is considered busy
+    SCHEDULE_TIMEOUT = 30
+
+    def configure(self, authentication_guard, user_dict, port_manager, idle_timeout=IDLE_TIMEOUT, codec_names=None,
+                  compression_names=None, compression_threshold=COMPRESSION_THRESHOLD,
+                  max_concurrent_downloads=MAX_CONCURRENT_DOWNLOADS, max_upload_size=MAX_UPLOAD_SIZE,
+                  statistics_path=None, statistics_interval=STATISTICS_INTERVAL,
+                  response_cache_size=RESPONSE_CACHE_SIZE, rate_limit=None, rate_limit_burst=None,
+                  max_concurrent_requests=None, user_weights=None):
+        """
+        Sets up the shared configuration of the server and starts the periodic dumps of the statistics, in case a path
+        for them was given. See the attributes of the class for the meaning of the arguments
+        Returns:
+        void
+        """
+        self.authentication_guard = authentication_guard
+        self.user_dict = user_dict
+        self.port_manager = port_manager
+        self.idle_timeout = idle_timeout
+        self.codec_names = list(CODECS.keys()) if codec_names is None else list(codec_names)
+        self.compression_names = list(COMPRESSIONS.keys()) if compression_names is None else list(compression_names)
+        self.compression_threshold = compression_threshold
+        self.compression_statistics = CompressionStatistics()
+        self.download_slots = threading.BoundedSemaphore(max_concurrent_downloads)
+        self.max_upload_size = max_upload_size
+        self.server_statistics = ServerStatistics()
+        self.statistics_path = statistics_path
+        self.statistics_interval = statistics_interval
+        self.response_cache = ResponseCache(max_size=response_cache_size) if response_cache_size else None
+        self.rate_limiter = RateLimiter(rate_limit, burst=rate_limit_burst) if rate_limit else None
+        self.login_rate_limiter = RateLimiter(rate_limit, burst=rate_limit_burst) if rate_limit else None
+        self.request_scheduler = None
+        if max_concurrent_requests:
+            self.request_scheduler = FairScheduler(max_concurrent_requests, weights=user_weights)
+        if statistics_path is not None:
+            self.server_statistics.start_dumping(statistics_path, statistics_interval, extra=self.get_extra_statistics)
+
+    def get_extra_statistics(self):
+        """
+        Returns:
+        The dict of the statistics of the server, that are not part of the request statistics
+        """
+        extra_statistics = {"compression": self.compression_statistics.get_statistics()}
+        if self.response_cache is not None:
+            extra_statistics["response_cache"] = self.response_cache.get_statistics()
+        if self.rate_limiter is not None:
+            extra_statistics["rate_limiter"] = self.rate_limiter.get_statistics()
+            extra_statistics["login_rate_limiter"] = self.login_rate_limiter.get_statistics()
+        if self.request_scheduler is not None:
+            extra_statistics["request_scheduler"] = self.request_scheduler.get_statistics()
+        return extra_statistics
+
+
+class PiverServer(socketserver.ThreadingMixIn, PiverServerMixIn, socketserver.TCPServer):
+    """
+    The PiLearnServer class is a subclass of the socketserver.TCPServer class from the python 'socketserver' module.
+    The socketserver module wraps the functionality of python sockets into a slightly higher level server object/
+    application, that deals with TCP socket connections on its own and the developer using it just has to pass the
+    connection information (ip, port) and a HandlerClass to the server object.
+    The handler class then simply defines a 'handle()' method, that deals with all incoming connections to the server.
+
+    Because the PiLearnServer also inherits from the socketserver.ThreadingMixIn, it additionally has the
+    functionality that the server spawns a new handler Thread for each incoming request/connection. (The mixin has to
+    be the first base class, as otherwise the 'process_request' method of the TCPServer would shadow the threaded one)
+    A connection is not closed after the first request, but served until the client closes it or it has been idle
+    for longer than 'idle_timeout' seconds, after which the server reaps it. That way clients can reuse one connection
+    for many requests.
+
+    The PiLearnServer specifically also requires a reference to the instance of the AuthenticationGuard object, which
+    is used to assign individual authentication codes to the users login in. With those codes the requests of a user
+    can be identified and used to modifiy his profile information only. Codes are checked for validity, as they expire
+    after some time. Passing a SignedAuthenticationGuard instead, the codes are signed tokens, that are verified without
+    any shared state, so that multiple server processes sharing the secret key accept each others tokens
+
+    Notes:
+        To use the PiLearnServer it has to be created by passing it the server address a reference to what handler class
+        to use and the currently active AuthenticationGuard object.
+        The server is started by calling the 'server_forever' method and is terminated, by te the 'shutdown' method.
+        It also has to be closed by calling the 'server_close' method
+
+    Examples:
+        # Example on how to use the server
+        authentication_guard = AuthenticationGuard()
+        server = PiLearnServer(('localhost', 5000), PiLearnHandler, authentication_guard)
+        server.serve_forever()
+        # ...the server handles all the requests
+        server.shutdown()
+        server.server_close()
+
+    Attributes:
+        server_address: A tuple, whose first element is the string ip address of the server, mostly localhost, and the
+            second element being an integer, that dictates, to which port the server is supposed to bind
+        RequestHandlerClass: A reference to the class, that handles the incoming connections and the data
+        The attributes of the configuration, which are set up by the keyword arguments, are described by the
+        'PiverServerMixIn'
+    """
+    # The handler threads should not keep the server program alive, as they might be waiting for idle connections
+    daemon_threads = True
+
+    def __init__(self, server_address, RequestHandlerClass, authentication_guard, user_dict, port_manager,
+                 bind_and_activate=True, **options):
+        # Initializing the actual Server class from the python 'socketserver' module and also adding the attribute of
+        # the authentication guard, to make it available within the handling method later
+        super(PiverServer, self).__init__(server_address, RequestHandlerClass, bind_and_activate=bind_and_activate)
+        self.configure(authentication_guard, user_dict, port_manager, **options)
+
+    def server_close(self):
+        """
+        Closes the listening socket and stops the periodic dumps of the statistics
+        Returns:
+        void
+        """
+        super(PiverServer, self).server_close()
+        self.server_statistics.stop_dumping()
+
+
+class PooledPiverServer(PiverServer):
+    """
+    A PiverServer, that serves the connections with a fixed amount of worker threads instead of a new thread for every
+    connection. Accepted connections are being put into a bounded queue, from which the workers take them to serve
+    them. In case the queue is full the connection is refused right away by sending a 'ServerBusyError' to the client
+    and closing the connection. That way the amount of threads stays constant under high load and the clients get an
+    explicit answer instead of the server thrashing.
+
+    Notes:
+        As a worker serves a connection until it is closed or idle for longer than the idle timeout, persistent client
+        connections occupy a worker for their whole lifetime. With this server the idle timeout should thus be rather
+        short and the amount of workers high enough for the expected amount of persistent clients
+
+    Attributes:
+        max_workers: The amount of worker threads serving the connections
+        queue_size: The maximum amount of accepted connections waiting for a free worker
+        request_queue: The 'queue.Queue' of the tuples (request, client_address) of the accepted connections
+    """
+    DEFAULT_MAX_WORKERS = 16
+    DEFAULT_QUEUE_SIZE = 64
+
+    def __init__(self, server_address, RequestHandlerClass, authentication_guard, user_dict, port_manager,
+                 bind_and_activate=True, max_workers=DEFAULT_MAX_WORKERS, queue_size=DEFAULT_QUEUE_SIZE, **options):
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.request_queue = queue.Queue(maxsize=queue_size)
+        self.workers = []
+        PiverServer.__init__(self, server_address, RequestHandlerClass, authentication_guard, user_dict, port_manager,
+                             bind_and_activate=bind_and_activate, **options)
+
+    def server_activate(self):
+        """
+        Starts listening and starts the worker threads
+        Returns:
+        void
+        """
+        PiverServer.server_activate(self)
+        for index in range(self.max_workers):
+            worker = threading.Thread(target=self._work, name="PiverWorker-{}".format(index), daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def process_request(self, request, client_address):
+        """
+        Called by the server for every accepted connection. Puts the connection into the queue of the workers or
+        refuses it, in case the queue is full
+        Args:
+            request: The socket object of the accepted connection
+            client_address: The address of the client
+
+        Returns:
+        void
+        """
+        try:
+            self.request_queue.put_nowait((request, client_address))
+        except queue.Full:
+            self.refuse_request(request)
+
+    def refuse_request(self, request):
+        """
+        Sends a 'ServerBusyError' through the given connection and closes it
+        Args:
+            request: The socket object of the refused connection
+
+        Returns:
+        void
+        """
+        try:
+            request.settimeout(1)
+            send_object(request, ServerBusyError("The server is busy, try again later"))
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """
+        Closes the listening socket and stops the worker threads, after they finished the connections they are serving
+        Returns:
+        void
+        """
+        PiverServer.server_close(self)
+        # Refusing the connections, that are still waiting and then signaling the workers to stop
+        while True:
+            try:
+                request, client_address = self.request_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.refuse_request(request)
+        for worker in self.workers:
+            self.request_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
+    def _work(self):
+        """
+        The method run by the worker threads. Takes the connections from the queue and serves them, until it receives
+        None as the signal to stop
+        Returns:
+        void
+        """
+        while True:
+            item = self.request_queue.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+
+class PreforkPiverServer:
+    """
+    Serves the connections with multiple worker processes, each running its own PiverServer (or a subclass like the
+    PooledPiverServer), so that the CPU bound work of the handlers, like unpickling the requests and working on the
+    user profiles, is spread over all the cores instead of being limited to one by the GIL. This object is only the
+    supervisor: it creates the listening socket, forks the workers and restarts those, that crashed.
+
+    THE SOCKET
+    Where the platform supports SO_REUSEPORT, every worker binds a listening socket of its own to the same address and
+    the kernel distributes the incoming connections evenly among them. The supervisor only binds its socket, without
+    listening, to reserve the address (and resolve the port, in case port 0 was given). Otherwise the supervisor
+    listens itself and the workers inherit that socket and accept from the shared queue.
+
+    THE STATE
+    The workers are forked after the supervisor was created, so every worker starts with a copy-on-write copy of the
+    user dict, the authentication guard and everything else loaded up to that point, but from then on the state is
+    not shared. For the user dict, like a 'PiLearnUserDict', that means:
+    - Profiles are loaded once, before the server is created, and every worker serves all users from its own copy
+    - A change a worker makes to a profile, like 'set_learning_process', is only visible within that worker. It is
+      not partitioned by user, as the kernel assigns the connections to the workers regardless of the user. Handlers,
+      that change profiles, should thus save the profile right away ('save_profile') and the 'worker_initializer'
+      can be used to reload the profiles within a restarted worker, so that it does not serve an outdated copy
+    - The authentication codes of an 'AuthenticationGuard' would only be known to the worker, that created them,
+      which is why a 'SignedAuthenticationGuard' is required, whose tokens every worker can verify
+    The ports of the port manager are partitioned among the workers, so that their file servers never collide.
+
+    Notes:
+        Requires the 'fork' start method, which is not available on Windows. SIGTERM stops a worker gracefully
+
+    Examples:
+        server = PreforkPiverServer(('', 5000), PiLearnRequestHandler, SignedAuthenticationGuard(key), user_dict,
+                                    PortManager(range(5001, 5101)), worker_count=4)
+        server.serve_forever()
+
+    Attributes:
+        server_address: The tuple of the ip address and the port, the workers listen on
+        RequestHandlerClass: The handler class of the workers
+        authentication_guard: The 'SignedAuthenticationGuard' shared by the workers
+        user_dict: The user dict, of which every worker gets its own copy
+        port_manager: The PortManager, whose ports are partitioned among the workers or None
+        worker_count: The amount of worker processes
+        server_class: The PiverServer class, of which every worker creates an instance
+        server_kwargs: The dict of additional keyword arguments for the server class, like 'idle_timeout'
+        worker_initializer: A callable, which is called with the server object within every worker, before it starts
+            serving, or None
+        reuse_port: The boolean value of whether the workers bind their own sockets with SO_REUSEPORT
+        socket: The socket of the supervisor
+        workers: The list of the 'multiprocessing.Process' objects of the workers
+        restart_count: The integer amount of times a worker was restarted
+        started: The threading.Event, that is set once all workers were started and listen
+    """
+    # The minimum amount of seconds between the start of a worker and its restart, so that a worker crashing right
+    # away does not make the supervisor fork over and over again
+    RESTART_DELAY = 1
+    # The amount of seconds to wait for a worker to stop gracefully, before it is killed
+    STOP_TIMEOUT = 10
+
+    def __init__(self, server_address, RequestHandlerClass, authentication_guard, user_dict, port_manager,
+                 worker_count=None, server_class=PiverServer, worker_initializer=None, reuse_port=None,
+                 **server_kwargs):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise OSError("The pre-forking server requires the 'fork' start method, which is not supported here")
+        if not isinstance(authentication_guard, SignedAuthenticationGuard):
+            raise TypeError("The workers do not share the codes of an AuthenticationGuard, use a "
+                            "SignedAuthenticationGuard instead")
+
+        self.RequestHandlerClass = RequestHandlerClass
+        self.authentication_guard = authentication_guard
+        self.user_dict = user_dict
+        self.port_manager = port_manager
+        self.worker_count = (os.cpu_count() or 1) if worker_count is None else worker_count
+        self.server_class = server_class
+        self.server_kwargs = server_kwargs
+        self.worker_initializer = worker_initializer
+        self.reuse_port = hasattr(socket, "SO_REUSEPORT") if reuse_port is None else reuse_port
+
+        self.socket = socket.socket(server_class.address_family, server_class.socket_type)
+        try:
+            if self.reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            self.socket.bind(server_address)
+            self.server_address = self.socket.getsockname()
+            if not self.reuse_port:
+                self.socket.listen(server_class.request_queue_size)
+        except OSError:
+            self.socket.close()
+            raise
+
+        self.context = multiprocessing.get_context("fork")
+        self.workers = [None] * self.worker_count
+        self.start_times = [0.0] * self.worker_count
+        self.restart_count = 0
+        self.started = threading.Event()
+        self.shutdown_event = threading.Event()
+
+    def serve_forever(self, poll_interval=0.5):
+        """
+        Starts the workers and supervises them until 'shutdown' is called, restarting every worker, that stopped.
+        The workers are stopped before the method returns
+        Args:
+            poll_interval: The amount of seconds between two checks of the workers
+
+        Returns:
+        void
+        """
+        ready_events = [self._start_worker(index) for index in range(self.worker_count)]
+        # With SO_REUSEPORT the address only accepts connections once a worker listens on it
+        for index, ready_event in enumerate(ready_events):
+            while not ready_event.wait(poll_interval) and self.workers[index].is_alive():
+                pass
+        self.started.set()
+        try:
+            while not self.shutdown_event.wait(poll_interval):
+                for index, worker in enumerate(self.workers):
+                    if worker.is_alive() or time.monotonic() - self.start_times[index] < self.RESTART_DELAY:
+                        continue
+                    worker.join()
+                    self.restart_count += 1
+                    self._start_worker(index)
+        finally:
+            self._stop_workers()
+
+    def shutdown(self):
+        """
+        Stops the 'serve_forever' loop and thus all the workers. Has to be called from another thread
+        Returns:
+        void
+        """
+        self.shutdown_event.set()
+
+    def server_close(self):
+        """
+        Closes the socket of the supervisor
+        Returns:
+        void
+        """
+        self.socket.close()
+
+    def get_worker_pids(self):
+        """
+        Returns:
+        The list of the integer process ids of the workers, that are alive
+        """
+        return [worker.pid for worker in self.workers if worker is not None and worker.is_alive()]
+
+    def _start_worker(self, index):
+        """
+        Forks a new worker process for the given slot
+        Args:
+            index: The integer index of the worker
+
+        Returns:
+        The multiprocessing.Event, that the worker sets once it listens
+        """
+        port_manager = None
+        if self.port_manager is not None:
+            port_manager = self.port_manager.partition(self.worker_count)[index]
+        ready_event = self.context.Event()
+        worker = self.context.Process(target=self._run_worker, args=(index, port_manager, ready_event),
+                                      name="PiverWorker-{}".format(index), daemon=True)
+        worker.start()
+        self.workers[index] = worker
+        self.start_times[index] = time.monotonic()
+        return ready_event
+
+    def _stop_workers(self):
+        """
+        Sends SIGTERM to all the workers and waits for them to stop, killing those that do not stop in time
+        Returns:
+        void
+        """
+        for worker in self.workers:
+            if worker is not None and worker.is_alive():
+                worker.terminate()
+        for worker in self.workers:
+            if worker is None:
+                continue
+            worker.join(self.STOP_TIMEOUT)
+            if worker.is_alive():
+                worker.kill()
+                worker.join()
+
+    def _run_worker(self, index, port_manager, ready_event):
+        """
+        The main function of the worker processes. Creates the server on the shared address and serves until SIGTERM
+        is received. As every worker keeps statistics of its own, the index of the worker is appended to the path of the
+        statistics file
+        Args:
+            index: The integer index of the worker
+            port_manager: The PortManager with the ports of this worker or None
+            ready_event: The multiprocessing.Event to set once the worker listens
+
+        Returns:
+        void
+        """
+        # SIGTERM is turned into an exception, which ends 'serve_forever' within the main thread of the worker
+        signal.signal(signal.SIGTERM, self._raise_system_exit)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        server_kwargs = dict(self.server_kwargs)
+        if server_kwargs.get("statistics_path") is not None:
+            server_kwargs["statistics_path"] = "{}.{}".format(server_kwargs["statistics_path"], index)
+        server = self.server_class(self.server_address, self.RequestHandlerClass, self.authentication_guard,
+                                   self.user_dict, port_manager, bind_and_activate=False, **server_kwargs)
+        try:
+            if self.reuse_port:
+                server.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                server.server_bind()
+            else:
+                server.socket.close()
+                server.socket = self.socket
+                server.server_address = self.server_address
+            server.server_activate()
+            ready_event.set()
+
+            if self.worker_initializer is not None:
+                self.worker_initializer(server)
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+    @staticmethod
+    def _raise_system_exit(signal_number, frame):
+        raise SystemExit(0)
+
+
+class RemoteMethod:
+    """
+    Describes a method of a handler class, that can be called by the clients. The objects are created by the 'remote'
+    decorator and collected within the registry of the handler class, 'remote_methods', when the class is created, so
+    that dispatching a request is a single dictionary lookup.
+
+    Attributes:
+        name: The string name of the method
+        function: The function of the method, that is called with the handler object as the first parameter
+        idempotent: The boolean value of whether calling the method multiple times has the same effect as calling it
+            once, which means that it neither changes any state nor depends on the order of other requests. Only the
+            requests of idempotent methods within a batch are executed in parallel, so methods, that occupy limited
+            resources like the ports of the file servers, should not be marked as idempotent
+        mutating: The boolean value of whether the method changes the state of the user profiles
+        timeout: The amount of seconds a client should wait for the response or None for the default of the client
+        compress: Whether the response of the method is to be compressed. True to compress it regardless of the
+            compression threshold of the server, False to never compress it, for example because it is already
+            compressed, and None to compress it, in case it exceeds the threshold
+        cacheable: The boolean value of whether the serialized responses of the method may be kept within the
+            response cache of the server. Only idempotent methods, whose responses depend on nothing but the
+            parameters and the profile of the user, and which only change through mutating methods, may be cacheable
+    """
+    def __init__(self, name, function, idempotent=False, mutating=False, timeout=None, compress=None,
+                 cacheable=False):
+        if cacheable and not idempotent:
+            raise ValueError("The method '{}' can only be cacheable, in case it is idempotent".format(name))
+        self.name = name
+        self.function = function
+        self.idempotent = idempotent
+        self.mutating = mutating
+        self.timeout = timeout
+        self.compress = compress
+        self.cacheable = cacheable
+
+    def with_function(self, function):
+        """
+        Returns:
+        A copy of this description for the given function, used for methods, that override a remote method without
+        being decorated again
+        """
+        return RemoteMethod(self.name, function, idempotent=self.idempotent, mutating=self.mutating,
+                            timeout=self.timeout, compress=self.compress, cacheable=self.cacheable)
+
+    def get_description(self):
+        """
+        Returns:
+        The dict describing the method, as it is sent to the clients
+        """
+        return {
+            "name": self.name,
+            "idempotent": self.idempotent,
+            "mutating": self.mutating,
+            "timeout": self.timeout,
+            "compress": self.compress,
+            "cacheable": self.cacheable
+        }
+
+
+def remote(function=None, idempotent=False, mutating=False, timeout=None, compress=None, cacheable=False):
+    """
+    The decorator exposing a method of a handler class to the clients. Can be used with or without arguments, which
+    are described by the 'RemoteMethod' class
+
+    Examples:
+        @remote
+        def change_password(self, received_object, password):
+            ...
+
+        @remote(idempotent=True, timeout=30)
+        def stream_file(self, received_object, relative_server_path, offset=0, length=None, if_none_match=None):
+            ...
+
+    Returns:
+    The function itself, with the 'RemoteMethod' describing it added as the 'remote_method' attribute
+    """
+    def decorate(method_function):
+        method_function.remote_method = RemoteMethod(method_function.__name__, method_function, idempotent=idempotent,
+                                                     mutating=mutating, timeout=timeout, compress=compress,
+                                                     cacheable=cacheable)
+        return method_function
+
+    if function is not None:
+        return decorate(function)
+    return decorate
+
+
+class PiverRequestHandler(socketserver.BaseRequestHandler):
+    """
+    The base class of the handlers of the PiverServer. The handler serves a single connection and calls the methods,
+    that the requests specify, on itself. Only the methods decorated with 'remote' can be called, which are collected
+    within the 'remote_methods' registry of the class, whenever a subclass is created. A method overriding a remote
+    method without being decorated stays remote with the same description.
+
+    Attributes:
+        remote_methods: The class attribute dict with the string method names as keys and the 'RemoteMethod' objects
+            as values
+    """
+    # The maximum amount of threads, that execute the requests of a parallel batch
+    BATCH_WORKERS = 4
+    # The maximum amount of threads per connection, that process pipelined requests concurrently
+    PIPELINE_WORKERS = 8
+    # The amount of seconds a file stream waits for a free download slot, before the server is considered busy
+    DOWNLOAD_SLOT_TIMEOUT = 10
+
+    # The registry of the remote methods, which is built for every subclass by '__init_subclass__' and for this class
+    # right after its definition
+    remote_methods = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super(PiverRequestHandler, cls).__init_subclass__(**kwargs)
+        cls.remote_methods = cls.build_remote_methods()
+
+    @classmethod
+    def build_remote_methods(cls):
+        """
+        Collects the remote methods of the class and all its base classes. The classes are walked from the most basic
+        one to the class itself, so that subclasses override the methods of their bases
+        Returns:
+        The dict with the string method names as keys and the 'RemoteMethod' objects as values
+        """
+        remote_methods = {}
+        for klass in reversed(cls.__mro__):
+            for name, attribute in vars(klass).items():
+                remote_method = getattr(attribute, "remote_method", None)
+                if isinstance(remote_method, RemoteMethod):
+                    remote_methods[name] = remote_method
+                elif name in remote_methods:
+                    # An override without the decorator keeps the description, while replacing a remote method with
+                    # something, that can not be called, removes it
+                    if callable(attribute):
+                        remote_methods[name] = remote_methods[name].with_function(attribute)
+                    else:
+                        del remote_methods[name]
+        return remote_methods
+
+    def __init__(self, request, client_address, server):
+        # NOTE: The handler can also be created without a request (request being None). Such a detached handler does
+        # not serve a connection on its own, it is only used to process the received transfer objects by calling its
+        # 'process' method, which is how the AsyncPiverServer reuses the handler classes.
+
+        # Considering the object behind the server attribute is an instance of the PiLearnServer class, the
+        # authentication guard object could be accessed via the server object, but the reference to the authentication
+        # guard object is additionally being wrapped into an attribute of this very class, simplifying access.
+        # These attributes have to be assigned before the request is being handled, as the handling depends on them
+        self.authentication_guard = server.authentication_guard
+        self.user_dict = server.user_dict
+        self.port_manager = server.port_manager
+
+        # IMPORTANT INFO:
+        # The following code of this constructor method is the original code used within the  python 'socketserver'
+        # module to instantiate the a BaseRequestHandler. The system the actual TCP server finishes a request is by
+        # simply instantiating the Handler class and passing it the information of the request, the client_address
+        # and a instance of the server itself
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        # The codec, with which the responses are serialized. Every connection starts out with pickle and without
+        # compression, until the client negotiates another codec and a compression
+        self.codec = PICKLE_CODEC
+        self.compression = None
+        # The incoming stream of the request, that is currently being processed. As the detached handler of the
+        # AsyncPiverServer processes requests in multiple threads, the stream is stored per thread
+        self.incoming = threading.local()
+        # The generation of the response cache, that was obtained before a cacheable method was called, stored per
+        # thread just like the incoming stream
+        self.cache_state = threading.local()
+        if request is None:
+            return
+        self.setup()
+        try:
+            self.handle()
+        finally:
+            self.finish()
+
+    def handle(self):
+        # The connection is being served until the client closes it. While waiting for the next request the socket
+        # times out after the idle timeout of the server, so that abandoned connections do not occupy a handler thread
+        # forever
+        self.request.settimeout(self.server.idle_timeout)
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Pipelined requests are processed by a pool of threads, which send their responses through the connection
+        # as soon as they are done. Thus the sending has to be secured by a lock
+        self.send_lock = threading.Lock()
+        self.pipeline_executor = None
+        try:
+            self._serve_connection()
+        finally:
+            # Waiting for all pipelined requests to be finished, so that their responses can still be sent, before
+            # the connection is being closed
+            if self.pipeline_executor is not None:
+                self.pipeline_executor.shutdown(wait=True)
+
+    def _serve_connection(self):
+        """
+        Receives and processes the requests of the connection one after another, until the client closes the
+        connection or it times out. Pipelined requests are handed to the pipeline executor instead of being processed
+        right away
+        Returns:
+        void
+        """
+        while True:
+            # Waiting for the frame containing the pickled transfer object of any of the users clients to be
+            # received. As the protocol dictates everything that passes this socket connection has to be
+            # serialized/pickled object of some sort, the received payload is being loaded with the pickle module
+            try:
+                flags, payload = receive_frame(self.request, max_size=MAX_REQUEST_FRAME_SIZE)
+            except ValueError as error:
+                # The payload of the frame is too big to be received, so the connection can not be used anymore
+                self._try_send_response(error)
+                return
+            except (ConnectionError, socket.timeout):
+                # The client closed the connection, stopped sending before the frame was complete or the connection
+                # was idle for too long, in either case the connection is done
+                return
+            start_time = time.perf_counter()
+
+            # In case the client streams data after the request, the data has to be received completely before the
+            # next request can be read, even if the request fails
+            incoming_stream = IncomingStream(self.request) if flags & FRAME_STREAM_FLAG else None
+            try:
+                received_object = decode_object(flags, payload)
+            except (pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError) as error:
+                # The frame itself was received completely, so the connection can still be used after the error
+                # has been reported to the client
+                if not self._finish_incoming_stream(incoming_stream):
+                    return
+                if not self._try_send_response(error):
+                    return
+                continue
+
+            if incoming_stream is not None and (not isinstance(received_object, RequestTransfer) or
+                                                received_object.is_pipelined()):
+                if not self._finish_incoming_stream(incoming_stream):
+                    return
+                error_message = "Only requests, that are not pipelined, can be followed by streamed data"
+                if not self._try_send_response(TypeError(error_message)):
+                    return
+                continue
+
+            if isinstance(received_object, CodecNegotiationTransfer):
+                # The response to the negotiation is still sent with the previous codec, only the following objects
+                # are being serialized with the chosen one
+                if not self._try_send_response(self.negotiate_codec(received_object)):
+                    return
+                self.apply_negotiation(received_object)
+                continue
+
+            if isinstance(received_object, RequestTransfer) and received_object.is_pipelined():
+                if self.pipeline_executor is None:
+                    self.pipeline_executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.PIPELINE_WORKERS)
+                self.pipeline_executor.submit(self._process_pipelined, received_object, len(payload), start_time)
+                continue
+
+            response = self.process(received_object, incoming_stream=incoming_stream)
+            if not self._finish_incoming_stream(incoming_stream):
+                return
+            failed = isinstance(response, BaseException)
+            response, stream = self.detach_stream(response)
+
+            # sending the generated response back to the client
+            try:
+                sent_size = self._send_response(response, stream=stream)
+            except OSError:
+                # A stream, that broke off, leaves the connection in an unknown state, so it is being closed
+                return
+            except Exception as error:
+                # The response could not be serialized, which happens before anything is sent
+                failed = True
+                if not self._try_send_response(self.get_error_response(received_object, error)):
+                    return
+                sent_size = 0
+
+            received_size = len(payload)
+            if incoming_stream is not None:
+                received_size += incoming_stream.received_size
+            self.record_request(received_object, start_time, received_size, sent_size, failed)
+
+    def _finish_incoming_stream(self, incoming_stream):
+        """
+        Discards whatever is left of the incoming stream of a request, so that the next request can be read
+        Args:
+            incoming_stream: The 'IncomingStream' of the request or None
+
+        Returns:
+        The boolean value of whether the connection can still be used
+        """
+        if incoming_stream is None:
+            return True
+        try:
+            incoming_stream.drain()
+            return True
+        except (OSError, ValueError):
+            return False
+        finally:
+            incoming_stream.close()
+
+    def get_incoming_stream(self):
+        """
+        Returns the data, that the client streams after the request, which is currently being processed. Only to be
+        called by the handler methods
+        Raises:
+            TypeError: In case the request is not followed by streamed data
+
+        Returns:
+        The 'IncomingStream' object
+        """
+        incoming_stream = getattr(self.incoming, "stream", None)
+        if incoming_stream is None:
+            raise TypeError("The request is not followed by streamed data")
+        return incoming_stream
+
+    def _process_pipelined(self, received_object, received_size, start_time):
+        """
+        Processes a pipelined request and sends the response back through the connection. In case the processing
+        failed, the error is being added to the request object, so that the response still carries the request id.
+        The same goes for a response, that cannot be serialized, as the client would otherwise wait for it in vain
+        Args:
+            received_object: The pipelined 'RequestTransfer' object
+            received_size: The integer amount of bytes of the request
+            start_time: The performance counter time, at which the request was received
+
+        Returns:
+        void
+        """
+        response = self.process(received_object)
+        response, stream = self.detach_stream(response, streaming_allowed=False)
+        if response is not received_object:
+            received_object.add_exception(response)
+        try:
+            sent_size = self._send_response(received_object)
+        except OSError:
+            # The connection broke, which will also end the receiving loop of the handler
+            return
+        except Exception as error:
+            error_response = self.get_error_response(received_object, error)
+            try:
+                sent_size = self._send_response(error_response)
+            except Exception:
+                # Not even the error can be sent, closing the connection is the only way left to let the client know
+                try:
+                    self.request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+                return
+            received_object = error_response
+        self.record_request(received_object, start_time, received_size, sent_size,
+                            received_object.get_exception() is not None)
+
+    def get_error_response(self, received_object, error):
+        """
+        Creates the response, that reports an error, which occurred after the request was processed, like a response,
+        that could not be serialized. For pipelined requests that is a new transfer object carrying the request id, as
+        the received one still holds the response, that failed
+        Args:
+            received_object: The received transfer object
+            error: The exception, that occurred
+
+        Returns:
+        The response object
+        """
+        if isinstance(received_object, RequestTransfer) and received_object.is_pipelined():
+            error_response = RequestTransfer(None, received_object.get_method_name(), [],
+                                             request_id=received_object.get_request_id())
+            error_response.add_exception(error)
+            return error_response
+        return error
+
+    def _try_send_response(self, response):
+        """
+        Sends the response object back to the client, for the replies, which are sent outside of the regular processing
+        of a request, like errors and negotiations
+        Args:
+            response: The object to send
+
+        Returns:
+        The boolean value of whether the response was sent and the connection can still be used
+        """
+        try:
+            self._send_response(response)
+            return True
+        except OSError:
+            # The client disconnected while the response was being sent
+            return False
+
+    def _send_response(self, response, stream=None):
+        """
+        Sends the response object back to the client, followed by the data of the stream, if one is given
+        Args:
+            response: The object to send
+            stream: The 'StreamingResponse' object, whose data is to be sent after the response or None
+
+        Returns:
+        The integer amount of bytes sent, including the data of the stream
+        """
+        if stream is None:
+            flags, parts = self.encode_response(response)
+            with self.send_lock:
+                send_frame(self.request, parts, flags=flags)
+            return get_payload_length(parts)
+
+        try:
+            flags, parts = self.encode_response(response)
+            with self.send_lock:
+                send_frame(self.request, parts, flags=flags | FRAME_STREAM_FLAG)
+                return get_payload_length(parts) + stream.stream(self.request)
+        finally:
+            stream.close()
+
+    def record_request(self, received_object, start_time, received_size, sent_size, failed):
+        """
+        Records a processed request within the statistics of the server. Requests are recorded under the name of the
+        requested method, but only the remote methods get entries of their own, as the clients could otherwise fill
+        the statistics with arbitrary names. Logins and batches are recorded as 'login' and 'batch'
+        Args:
+            received_object: The received transfer object
+            start_time: The performance counter time, at which the request was received
+            received_size: The integer amount of bytes received for the request
+            sent_size: The integer amount of bytes sent as the response
+            failed: The boolean value of whether the request failed
+
+        Returns:
+        void
+        """
+        if isinstance(received_object, RequestTransfer):
+            method_name = received_object.get_method_name()
+            if not isinstance(method_name, str) or method_name not in self.remote_methods:
+                method_name = "unknown"
+        elif isinstance(received_object, LoginTransfer):
+            method_name = "login"
+        elif isinstance(received_object, BatchRequestTransfer):
+            method_name = "batch"
+        else:
+            method_name = "unknown"
+        duration = time.perf_counter() - start_time
+        self.server.server_statistics.record(method_name, duration, received_size, sent_size, failed=failed)
+
+    @staticmethod
+    def detach_stream(response, streaming_allowed=True):
+        """
+        Checks whether the response of a request is a 'StreamingResponse'. In that case the actual response object of
+        the stream replaces the streaming response within the request object and the stream is returned separately, so
+        that its data can be sent after the response
+        Args:
+            response: The response object returned by 'process'
+            streaming_allowed: The boolean value of whether the response may be streamed. If not, the stream is being
+                closed and an error is returned instead
+
+        Returns:
+        A tuple of the response object to send and the 'StreamingResponse' object or None
+        """
+        if not isinstance(response, RequestTransfer) or not isinstance(response.get_response(), StreamingResponse):
+            return response, None
+
+        stream = response.get_response()
+        if not streaming_allowed:
+            stream.close()
+            response.add_response(None)
+            error_message = "The response of the method '{}' is streamed, which is not possible for pipelined " \
+                            "requests".format(response.get_method_name())
+            return TypeError(error_message), None
+
+        response.add_response(stream.get_response())
+        return response, stream
+
+    def encode_response(self, response):
+        """
+        Serializes the response with the codec of the connection. In case the client supports a compression and the
+        serialized response is at least as big as the compression threshold of the server, it is being compressed,
+        unless the compression does not make it any smaller. The compression is recorded in the compression statistics
+        of the server
+        Args:
+            response: The response object
+
+        Returns:
+        A tuple of the integer flags byte and the list of bytes like objects, that make up the payload
+        """
+        if isinstance(response, CachedResponse):
+            return response.flags, [response.payload]
+
+        cache_key, cache_generation = self._get_cache_entry(response)
+        flags, parts = self._encode_response(response)
+        if cache_key is not None:
+            self.server.response_cache.store(cache_key, cache_generation, flags, parts)
+        return flags, parts
+
+    def _encode_response(self, response):
+        flags, parts = encode_object(response, self.codec)
+        if self.compression is None:
+            return flags, parts
+
+        # The remote method may overrule the compression threshold, for example because its responses are already
+        # compressed
+        compress = None
+        if isinstance(response, RequestTransfer):
+            remote_method = self.remote_methods.get(response.get_method_name())
+            compress = None if remote_method is None else remote_method.compress
+        if compress is False:
+            return flags, parts
+
+        original_size = get_payload_length(parts)
+        if original_size < self.server.compression_threshold and not compress:
+            return flags, parts
+
+        start_time = time.perf_counter()
+        compressed_flags, compressed_parts = compress_payload(flags, parts, self.compression)
+        duration = time.perf_counter() - start_time
+        compressed_size = get_payload_length(compressed_parts)
+        self.server.compression_statistics.record(self._get_response_name(response), original_size, compressed_size,
+                                                  duration)
+        if compressed_size >= original_size:
+            return flags, parts
+        return compressed_flags, compressed_parts
+
+    def _get_cache_entry(self, response):
+        """
+        Checks whether the response is to be stored within the response cache, which is the case, in case the method
+        is cacheable, it succeeded and the generation of the cache was obtained before calling the method
+        Args:
+            response: The response object, that is being serialized
+
+        Returns:
+        A tuple of the key and the generation of the cache entry or (None, None)
+        """
+        cache_generation = getattr(self.cache_state, "generation", None)
+        self.cache_state.generation = None
+        if cache_generation is None or not isinstance(response, RequestTransfer) or \
+                response.get_exception() is not None or isinstance(response.get_response(), BaseException):
+            return None, None
+        username = self.authentication_guard.get_username(response.get_authentication())
+        cache_key = ResponseCache.get_key(username, response, self.codec, self.compression)
+        return cache_key, cache_generation
+
+    def lookup_cached_response(self, received_object):
+        """
+        Looks up the response to the request within the response cache of the server. Only requests of cacheable
+        methods, that are not pipelined, are looked up, as the request id of pipelined requests is part of the response.
+        In case the response was not found, the generation of the cache is stored, so that the response can be stored
+        once it is serialized
+        Args:
+            received_object: The 'RequestTransfer' object with a valid authentication code
+
+        Returns:
+        The 'CachedResponse' or None
+        """
+        self.cache_state.generation = None
+        response_cache = self.server.response_cache
+        if response_cache is None or received_object.is_pipelined():
+            return None
+        remote_method = self._get_remote_method(received_object.get_method_name())
+        if remote_method is None or not remote_method.cacheable:
+            return None
+
+        username = self.authentication_guard.get_username(received_object.get_authentication())
+        cache_key = ResponseCache.get_key(username, received_object, self.codec, self.compression)
+        if cache_key is None:
+            return None
+        # The generation has to be obtained before the lookup, as an invalidation might happen in between
+        cache_generation = response_cache.get_generation(username)
+        cached_response = response_cache.lookup(cache_key)
+        if cached_response is None:
+            self.cache_state.generation = cache_generation
+        return cached_response
+
+    def negotiate_codec(self, negotiation_transfer):
+        """
+        Chooses the codec and the compression for the connection out of the ones proposed by the client and the ones
+        the server supports
+        Args:
+            negotiation_transfer: The received 'CodecNegotiationTransfer' object
+
+        Returns:
+        The same 'CodecNegotiationTransfer' object, with the names of the chosen codec and compression added
+        """
+        negotiation_transfer.choose_codec(self.server.codec_names)
+        negotiation_transfer.choose_compression(self.server.compression_names)
+        return negotiation_transfer
+
+    def apply_negotiation(self, negotiation_transfer):
+        """
+        Switches the connection to the codec and the compression, that were chosen by 'negotiate_codec'. Has to be
+        called after the response to the negotiation has been sent
+        Args:
+            negotiation_transfer: The 'CodecNegotiationTransfer' object returned by 'negotiate_codec'
+
+        Returns:
+        void
+        """
+        self.codec = CODECS[negotiation_transfer.get_codec_name()]
+        compression_name = negotiation_transfer.get_compression_name()
+        self.compression = COMPRESSIONS[compression_name] if compression_name is not None else None
+
+    def _get_response_name(self, response):
+        """
+        Returns:
+        The string name, under which the response is recorded in the statistics. The method name for the responses to
+        requests, otherwise the class name of the response. Just like with 'record_request', only the remote methods
+        get entries of their own, all other requests are recorded as 'unknown'
+        """
+        if isinstance(response, RequestTransfer):
+            method_name = response.get_method_name()
+            if not isinstance(method_name, str) or method_name not in self.remote_methods:
+                return "unknown"
+            return method_name
+        return type(response).__name__
+
+    def process(self, received_object, incoming_stream=None, scheduled=False):
+        """
+        Processes a single received transfer object and creates the response object, that is to be sent back to the
+        client. Checking whether or not the received request is a first time login attempt or an actual action request
+        of an already authenticated user and redirecting the object to the according sub-handling method
+        Args:
+            received_object: The unpickled transfer object, that was received from the client
+            incoming_stream: The 'IncomingStream' of data following the request or None
+            scheduled: The boolean value of whether the caller already acquired the slot of the request scheduler for
+                the request (see 'get_scheduling')
+
+        Returns:
+        The response object, that is to be sent back to the client
+        """
+        self.incoming.stream = incoming_stream
+        self.incoming.scheduled = scheduled
+        try:
+            return self._process(received_object)
+        finally:
+            self.incoming.stream = None
+            self.incoming.scheduled = False
+
+    def _process(self, received_object):
+        # In case the received object is indeed a login request calls the 'login' method, that processes the transfer
+        # object and generates the appropriate response object
+        if isinstance(received_object, LoginTransfer):
+            return self.login(received_object)
+
+        # The protocol dictates, that every object passing this socket connect has to inherit from the
+        # BaseTransferObject class and thus contain the information about the authentication code and methods to
+        # obtain this information
+        if not isinstance(received_object, BaseTransferObject):
+            error_message = "The received object of type '{}' is not a transfer object".format(type(received_object))
+            return TypeError(error_message)
+
+        # First getting the authentication of the sent object and checking if it is still valid
+        authentication_code = received_object.get_authentication()
+        is_valid = self.authentication_guard.is_valid_authentication(authentication_code)
+        if not is_valid:
+            error_message = "The authentication code is not valid (anymore). Log in again!"
+            return PermissionError(error_message)
+
+        # Once the user is known, the request is checked against the rate limit of the user and then waits for its
+        # turn to be processed. A batch costs as much as the requests it contains
+        username = self.authentication_guard.get_username(authentication_code)
+        cost = self._get_request_cost(received_object)
+        rate_limit_error = self.check_rate_limit(username, cost)
+        if rate_limit_error is not None:
+            return rate_limit_error
+
+        request_scheduler = self.server.request_scheduler
+        if request_scheduler is None or getattr(self.incoming, "scheduled", False):
+            return self._dispatch(received_object)
+        if not request_scheduler.acquire(username, cost=max(cost, 1), timeout=self.server.SCHEDULE_TIMEOUT):
+            return ServerBusyError("The server is busy processing the requests of other users. Try again later!")
+        try:
+            return self._dispatch(received_object)
+        finally:
+            request_scheduler.release()
+
+    def get_scheduling(self, received_object):
+        """
+        Returns the user and the cost, with which a received request waits for a slot of the request scheduler. Used
+        by the 'AsyncPiverServer', which waits for the slot on the event loop, before the request is handed to a thread
+        Args:
+            received_object: The received transfer object
+
+        Returns:
+        A tuple of the string username and the cost of the request or None, in case the request does not wait for a
+        slot, as the server has no scheduler, it is no request or its authentication code is not valid
+        """
+        if self.server.request_scheduler is None or not isinstance(received_object, BaseTransferObject):
+            return None
+        authentication_code = received_object.get_authentication()
+        if not self.authentication_guard.is_valid_authentication(authentication_code):
+            return None
+        username = self.authentication_guard.get_username(authentication_code)
+        return username, max(self._get_request_cost(received_object), 1)
+
+    @staticmethod
+    def _get_request_cost(received_object):
+        """
+        Returns:
+        The cost of a request for the rate limit and the scheduler. A batch costs as much as the requests it contains
+        """
+        if isinstance(received_object, BatchRequestTransfer):
+            return len(received_object.get_requests())
+        return 1
+
+    def check_rate_limit(self, username, cost=1):
+        """
+        Takes the tokens for a request from the bucket of the user, in case the server has a rate limit
+        Args:
+            username: The string username of the user
+            cost: The amount of tokens the request costs
+
+        Returns:
+        None in case the request is allowed, otherwise the 'RateLimitError' to respond with
+        """
+        rate_limiter = self.server.rate_limiter
+        if rate_limiter is None:
+            return None
+        wait_time = rate_limiter.acquire(username, cost)
+        if not wait_time:
+            return None
+        error_message = "The user '{}' sent too many requests. Try again in {:.2f} seconds!".format(username, wait_time)
+        return RateLimitError(error_message)
+
+    def check_login_rate_limit(self):
+        """
+        Checks whether the client address of the connection failed to log in too often, in case the server has a rate
+        limit. No tokens are taken, only failed logins do that
+        Returns:
+        None in case the login is allowed, otherwise the 'RateLimitError' to respond with
+        """
+        login_rate_limiter = self.server.login_rate_limiter
+        if login_rate_limiter is None:
+            return None
+        wait_time = login_rate_limiter.get_wait_time(self._get_client_host())
+        if not wait_time:
+            return None
+        error_message = "Too many failed logins. Try again in {:.2f} seconds!".format(wait_time)
+        return RateLimitError(error_message)
+
+    def record_failed_login(self):
+        """
+        Takes a token from the bucket of the client address of the connection for a failed login, in case the server
+        has a rate limit
+        Returns:
+        void
+        """
+        login_rate_limiter = self.server.login_rate_limiter
+        if login_rate_limiter is not None:
+            login_rate_limiter.acquire(self._get_client_host())
+
+    def _get_client_host(self):
+        """
+        Returns:
+        The host part of the client address, so that all connections of a client share the same limit
+        """
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return self.client_address
+
+    def _dispatch(self, received_object):
+        # Now checking for the object type to determine to which sub-handling method to redirect the object to
+        if isinstance(received_object, RequestTransfer):
+            # Repeated requests of cacheable methods are answered with the already serialized response
+            cached_response = self.lookup_cached_response(received_object)
+            if cached_response is not None:
+                return cached_response
+            # In case the object is a request object, the handler object will redirect the processing of the
+            # received object to the designated method
+            return self.handle_request(received_object)
+
+        if isinstance(received_object, BatchRequestTransfer):
+            return self.handle_batch_request(received_object)
+
+        error_message = "The server does not support transfer objects of type '{}'".format(type(received_object))
+        return TypeError(error_message)
+
+    def login(self, login_transfer):
+        """
+        The method which processes the received requests from the socket connection, that turn out to be login requests
+        from the sending clients. Login requests are represented by the 'LoginTransfer' objects. They contain the
+        information about the username and the password, that the user had entered on the client side of the
+        connection, after verifying, that both the username and password exist and are correct, the method creates a
+        authentication code by calling the AuthenticationGuard, creates the reference from this individual code to the
+        username, adds the fresh authentication code to the LoginTransfer object and returns that object, so it can
+        be sent back to the client side as a response
+
+        Notes:
+            Could return:
+
+            ConnectionRefusedError: In case the method gets passed a LoginTransfer object with a username, that is not
+                registered in the servers system
+            PermissionError: In case the method gets passed a LoginTransfer object, whose username exists, but whose
+                password is not correct (The password doesnt match with the password, that was stored in the servers
+                memory)
+
+        Args:
+            login_transfer: The 'LoginTransfer' object, that was received and now is to be processed
+
+        Returns:
+        The same 'LoginTransfer' object, that was passed, but having added the created, individual authentication code
+        to it, that the user can use
+        """
+        username = login_transfer.get_username()
+        password = login_transfer.get_password()
+        # The login data is sent by the client and might be any object, even one, that can not be looked up
+        if not isinstance(username, str) or not isinstance(password, str):
+            return TypeError("The username and the password have to be strings")
+
+        # Clients, that failed to log in too often, have to wait before they may try again, which slows down guessing
+        # passwords. The failed attempts are counted per client address and not per user, as anybody could otherwise
+        # use up the requests of another user by failing to log in as that user
+        rate_limit_error = self.check_login_rate_limit()
+        if rate_limit_error is not None:
+            return rate_limit_error
+
+        # First checks whether the user actually exists or not by calling the user dict object.
+        # The user dict object stores the reference to all existing user profiles with them being the values to the
+        # usernames as keys.
+        # In case the user does not exists, returns a ConnectionRefusedError to send back as an response to who ever
+        # attempted to login with an non existent username
+        user_exists = self.user_dict.user_exists(username)
+        if not user_exists:
+            self.record_failed_login()
+            error_message = "The username '{}' does not exist!".format(username)
+            return ConnectionRefusedError(error_message)
+
+        # In case the username existed, the validity of the password to the username is now being checked.
+        # In case the password is not correct, returns a PermissionError to send back as an response to the user,
+        # to whom the username belongs
+        password_valid = self.user_dict.password_valid(username, password)
+        if not password_valid:
+            self.record_failed_login()
+            error_message = "The password for the given username '{}' is not correct".format(username)
+            return PermissionError(error_message)
+
+        # Only the successful logins count against the rate limit of the user
+        rate_limit_error = self.check_rate_limit(username)
+        if rate_limit_error is not None:
+            return rate_limit_error
+
+        # If the login request came from a user, that already posses an authentication code, that is valid simply
+        # sending the stored one to the user again, instead of creating a new one. Both is done while holding the lock
+        # of the guard, as the code could expire in between otherwise
+        with self.authentication_guard.lock:
+            if self.authentication_guard.user_exists(username):
+                authentication_code = self.authentication_guard.get_authentication_code(username)
+                login_transfer.add_authentication_code(authentication_code)
+
+            else:
+                # Creating the code authentication code and adding it to the LoginTransfer object before returning that
+                # object to be sent back to the client side program fro the user to utilize.
+                authentication_code = self.authentication_guard.create_authentication_code(username)
+                login_transfer.add_authentication_code(authentication_code)
+
+        return login_transfer
+
+    def handle_request(self, received_object):
+        """
+        This method is the first instance of handling the incoming requests. Those 'RequestTransfer' objects, that are
+        passed to this method, contain a authentication code, so the following processes know which user to assign the
+        action, they contain the string name of a method of handler object and a list with parameters to pass to this
+        method.
+        This method uses the method name string and the parameter list to actually call the requested method and return
+        the response, that has been returned by this specific method
+        Args:
+            received_object: The 'RequestTransfer' object specifying, which method to call
+
+        Returns:
+        The response, that has been generated by the method, that was requested
+        """
+        # Getting the string method name of the method that is supposed to be called and the parameters for it and
+        # calling the method. In case the method does not exist or raises an error, the error is being returned
+        method_name = received_object.get_method_name()
+        parameter_list = received_object.get_parameter_list()
+        try:
+            response = self.call_method(received_object, method_name, parameter_list)
+            received_object.add_response(response)
+        except Exception as error:
+            return error
+
+        # Returning the response, that was generated by the method, that was called through the request
+        return received_object
+
+    def handle_batch_request(self, received_object):
+        """
+        Handles a 'BatchRequestTransfer' object, by calling the requested method for each request of the batch. The
+        requests are being executed in order, or by a pool of threads in case the batch was marked as parallel and all
+        of its methods are idempotent. The list of responses is being added to the batch object, with the response of a
+        failed request being the error, that it raised.
+        Args:
+            received_object: The 'BatchRequestTransfer' object specifying the requests
+
+        Returns:
+        The batch object with the list of responses added to it
+        """
+        requests = received_object.get_requests()
+        if received_object.is_parallel() and len(requests) > 1 and self.is_idempotent_batch(requests):
+            max_workers = min(self.BATCH_WORKERS, len(requests))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._call_batch_method, received_object, method_name, parameter_list)
+                           for method_name, parameter_list in requests]
+                responses = [future.result() for future in futures]
+        else:
+            responses = [self._call_batch_method(received_object, method_name, parameter_list)
+                         for method_name, parameter_list in requests]
+
+        received_object.add_responses(responses)
+        return received_object
+
+    def is_idempotent_batch(self, requests):
+        """
+        Args:
+            requests: The list of tuples (method_name, parameter_list) of a batch
+
+        Returns:
+        The boolean value of whether all the requested methods are idempotent remote methods, so that the requests may
+        be executed in parallel
+        """
+        for method_name, parameter_list in requests:
+            remote_method = self.remote_methods.get(method_name)
+            if remote_method is None or not remote_method.idempotent:
+                return False
+        return True
+
+    def call_method(self, received_object, method_name, parameter_list):
+        """
+        Calls the remote method of this handler object, that is specified by its string name, with the received object
+        as the first parameter, followed by the positional parameters of the parameter list.
+
+        Raises:
+            AttributeError: In case the handler does not have a remote method with the given name
+            Exception: Whatever error the called method raised
+
+        Args:
+            received_object: The transfer object, that triggered the method call
+            method_name: The string name of the method to call
+            parameter_list: The list of positional parameters for the method
 
-    Attributes:
-        existing_codes: The list, that contains the codes that are currently active
-        user_dictionary: The dictionary, that contains the reference of which user is in possession of which
-            authentication code, the codes being the keys and the usernames being the values to them
+        Returns:
+        The response, that was returned by the method
+        """
+        # Looking the method up within the registry of the class, which only contains the methods exposed to the
+        # clients
+        remote_method = self._get_remote_method(method_name)
+        if remote_method is None:
+            error_message = "The server RequestHandler does not support a method named '{}'".format(method_name)
+            raise AttributeError(error_message)
 
-    """
-    # The amount of time a authentication code is considered to be valid, beginning from the moment of creation
-    CODE_LIFETIME_HOURS = 24
+        # Calling the specified method of the this handler object with the parameters from the parameter list.
+        # The cached responses of the user are dropped before and after calling a mutating method, the latter
+        # for the responses of cacheable methods, that were running at the same time
+        response_cache = self.server.response_cache
+        if not remote_method.mutating or response_cache is None:
+            return remote_method.function(self, received_object, *parameter_list)
+        username = self.authentication_guard.get_username(received_object.get_authentication())
+        response_cache.invalidate(username)
+        try:
+            return remote_method.function(self, received_object, *parameter_list)
+        finally:
+            response_cache.invalidate(username)
 
-    def __init__(self):
-        # The object will keep track of the already existing codes by storing all existing codes within this list
-        self.existing_codes = []
+    def _get_remote_method(self, method_name):
+        """
+        Args:
+            method_name: The name of the method as it was sent by the client, which might be of any type
 
-        # This dictionary will contain information about which code was distributed to which user. The keys will be the
-        # string versions of the given authentication code and the assigned value will be the username of the user,
-        # currently in possession of the code
-        self.user_dictionary = {}
+        Returns:
+        The 'RemoteMethod' object of the given name or None, in case there is none
+        """
+        try:
+            return self.remote_methods.get(method_name)
+        except TypeError:
+            return None
 
-    def create_authentication_code(self, username):
+    def _call_batch_method(self, received_object, method_name, parameter_list):
         """
-        Creates a authentication code for the user, whose username was passed to the method. Authentication codes are
-        part of the authentication process of the PiLearn Server system. After the user submits username/password on a
-        one time occasion, the server sends a created authentication code in response, which the user side program
-        has to use as a prefix to all requests, so that the user does not have to enter his info all the time, and that
-        the server knows for whose user profile the incoming request are supposed to be processed.
+        Calls the specified method for a single request of a batch, returning the error instead of raising it
+        Args:
+            received_object: The 'BatchRequestTransfer' object, that contained the request
+            method_name: The string name of the method to call
+            parameter_list: The list of positional parameters for the method
 
-        THE CODE
-        The code itself consists of two separate parts, that are being separated by a double point ":".
-        The first part simply is a random number in the range from 1 to 1000, turned into a hexadecimal value, to add
-        a safety buffer, so that each code is individual.
-        The second part is a timestamp integer code, from the python "datetime" module, that describes the time exactly
-        24 hours into the future from the moment of creating the code. The timestamp is also turned into a hexadecimal
-        in an attempt to save space. The timestamp functions as an expiration date, after which the code cannot be used
-        anymore and the user has to login to get a new one.
+        Returns:
+        The response, that was returned by the method or the error, that it raised
+        """
+        try:
+            response = self.call_method(received_object, method_name, parameter_list)
+        except Exception as error:
+            return error
 
-        EXAMPLE
-        authentication code: '0x21f:0x57e76895'
+        if isinstance(response, StreamingResponse):
+            # The data of the stream cannot be sent within a batch response
+            response.close()
+            error_message = "The response of the method '{}' is streamed, which is not possible within a " \
+                            "batch".format(method_name)
+            return TypeError(error_message)
+        return response
 
+    @remote(idempotent=True)
+    def get_remote_methods(self, received_object):
+        """
+        Describes the methods, that the clients can call
         Args:
-            username: The username string, for which the authentication code is being created
+            received_object: -
 
         Returns:
-        The string of the created authentication code
+        The dict with the string method names as keys and the dicts describing the methods as values
         """
-        is_valid = False
-        authentication_code = ""
-        while not is_valid:
-            # The authentication code consists of two separate parts. The first part is a randomly generated integer in
-            # the in the range from 1 to 1000 turned into a hexadecimal. The second part is a timestamp, that is created
-            # to reflect the time exactly 24 hours after the moment in which the code was created. The timestamp
-            # functions not only as a definite identifier, but also as an expire date for the authentication code.
-            # The timestamp is also being turned into a hexadecimal, in the attempt to save digits
-            random_number = hex(random.randint(1, 1000))
-
-            # Creating the current datetime object and adding a timedelta of 24 hours
-            current_datetime = datetime.datetime.now()
-            future_datetime = current_datetime + datetime.timedelta(hours=self.CODE_LIFETIME_HOURS)
-            # The timestamp is being concerted to integer before being converted to hex, because the timestamp is a
-            # float number and hex() doesnt convert floats. The information resolution of the timestamp after the
-            # int conversion still correctly reflects seconds
-            future_datetime_timestamp = hex(int(future_datetime.timestamp()))
-
-            authentication_code = "{}:{}".format(str(random_number), str(future_datetime_timestamp))
-            if authentication_code not in self.existing_codes:
-                is_valid = True
-
-        # Adding the authentication code to the list of already existing codes, so that users will not get the same
-        # code and adding the username reference to the dictionary of users, currently possessing a authentication code.
-        self.existing_codes.append(authentication_code)
-        self.user_dictionary[authentication_code] = username
+        return {name: remote_method.get_description() for name, remote_method in self.remote_methods.items()}
 
-        return authentication_code
+    @remote(idempotent=True)
+    def get_server_stats(self, received_object):
+        """
+        Returns the statistics of the requests, that the server processed so far, to find the methods, that are slow or
+        requested most
+        Args:
+            received_object: -
 
-    def user_exists(self, username):
+        Returns:
+        The dict of the statistics, as it is returned by 'ServerStatistics.get_statistics', with the statistics of the
+        compression added as 'compression'
+        """
+        statistics = self.server.server_statistics.get_statistics()
+        statistics.update(self.server.get_extra_statistics())
+        return statistics
+
+    @remote(mutating=True)
+    def change_password(self, received_object, password):
         """
+        Changes the password of the user to the new password
         Args:
-            username: The string format of the username in question
+            received_object:
+            password: The new password string
 
         Returns:
-        The boolean value of whether or not a user with the given username currently possesses am authentication code
+        The new password string
         """
-        if username in self.user_dictionary:
-            return True
-        else:
-            return False
+        user_profile = self.get_user_profile(received_object)
+        user_profile.set_password(password)
+        return password
 
-    def is_valid_authentication(self, authentication_code):
+    # Not idempotent, as every call leases a port and starts a file server, so that a parallel batch of downloads
+    # could exhaust the ports of the port manager
+    @remote
+    def download_file(self, received_object, relative_server_path, offset=0, length=None, if_none_match=None):
         """
-        Checks whether or not the passed authentication code is still valid or not, by converting it back into the
-        datetime object, that was stored within the code (which was created to last for 24 hours, back at the point of
-        creation). If the code's datetime is still bigger than the current datetime, returns True, otherwise deletes
-        the code from internal reference and returns False.
+        The method being called, when a user request to download a file, specified by the path 'relative_server_path'.
+        The method checks whether the requested file exists (raises an error in case it doesnt) acquires an open port
+        from the port manager, starts a FileSendServer with the file and the port and sends a 'FileTransferTicket'
+        with the port of the server, the range, that is going to be sent, and the digest of the whole file back to the
+        user as a response
         Args:
-            authentication_code: The string authentication code, that is to be checked
+            received_object: -
+            relative_server_path: The string path that specifies the file to download. The path is supposed to be
+                relative to the servers main folder, meaning that files, that dont belong to the server cannot be
+                downloaded.
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes requested. None for everything up to the end of the file. A range
+                reaching beyond the end of the file is cut off
+            if_none_match: The hex string digest of the copy of the file the client already has. In case the file
+                still has this digest, no file server is started and a ticket marked as not modified is returned
+
+        Raises:
+            ValueError: In case the offset is not within the file or the length is negative
 
         Returns:
-        The boolean value of whether or not the authentication code is still valid
+        The 'FileTransferTicket' of the download
         """
-        # Converting the given code into the datetime object, that was stored within the code and then comparing it to
-        # the current datetime object. In case it is bigger, the code is not expired yet and the method returns True.
-        # Otherwise the code will be deleted from the list and the dictionary and the method will return False
-        code_datetime = self.get_datetime_from_authentication_code(authentication_code)
-        current_datetime = datetime.datetime.now()
+        # Getting the user profile of the user, which sent the request
+        user_profile = self.get_user_profile(received_object)
 
-        if code_datetime > current_datetime:
-            return True
-        else:
-            self.existing_codes.remove(authentication_code)
-            del self.user_dictionary[authentication_code]
-            return False
+        file_path, offset, length, file_size, digest = self._get_download_range(relative_server_path, offset, length)
+        if if_none_match is not None and if_none_match == digest:
+            return FileTransferTicket(None, offset, 0, file_size, digest, not_modified=True)
 
-    def get_username(self, authentication_code):
+        # Acquiring an open port from the port manager and starting an open FileSendServer, to wait for an incoming
+        # socket connection from the client. The file server releases the port on its own, once it stopped listening
+        port = self.port_manager.acquire()
+        try:
+            file_server = SimpleFileSendServer(port, file_path, offset=offset, length=length,
+                                               port_manager=self.port_manager)
+        except BaseException:
+            self.port_manager.release(port)
+            raise
+        file_server.start()
+
+        # Sending the port of the file server back to the client, so that the client can start a downloader thread,
+        # connecting to the file server, that downloads the file
+        return FileTransferTicket(port, offset, length, file_size, digest)
+
+    @remote(idempotent=True, timeout=30)
+    def stream_file(self, received_object, relative_server_path, offset=0, length=None, if_none_match=None):
         """
-        Gets the username, that was assigned to the given authentication code from the internal dictionary reference
+        The method being called, when a user requests a file to be streamed over the request connection. Just like
+        'download_file' it checks the file and the requested range, but instead of starting a file server the range
+        of the file is sent as a stream right after the response, which is a 'FileTransferTicket' without a port.
+        Every stream occupies a download slot of the server for as long as it is being sent. In case no slot becomes
+        free within DOWNLOAD_SLOT_TIMEOUT seconds, the server is considered busy
         Args:
-            authentication_code: The string authentication code for which the username is requested
+            received_object: -
+            relative_server_path: The string path that specifies the file to download. The path is supposed to be
+                relative to the servers main folder, meaning that files, that dont belong to the server cannot be
+                downloaded.
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes requested. None for everything up to the end of the file
+            if_none_match: The hex string digest of the copy of the file the client already has. In case the file
+                still has this digest, nothing is streamed and a ticket marked as not modified is returned
+
+        Raises:
+            ServerBusyError: In case the maximum amount of concurrent downloads is reached
+            ValueError: In case the offset is not within the file or the length is negative
 
         Returns:
-        The username, to the user, which is currently in possession of the passed authentication code
+        The 'FileStreamResponse' of the file or the 'FileTransferTicket' in case the file was not modified
         """
-        # The method checks whether the code exists or not, but there is no consequence in case it doesnt, because
-        # there would not be a situation in which a unknown authentication code would have been used.
-        # TODO: add exception anyways
-        if authentication_code in self.user_dictionary.keys():
-            return self.user_dictionary[authentication_code]
+        file_path, offset, length, file_size, digest = self._get_download_range(relative_server_path, offset, length)
+        if if_none_match is not None and if_none_match == digest:
+            return FileTransferTicket(None, offset, 0, file_size, digest, not_modified=True)
+        ticket = FileTransferTicket(None, offset, length, file_size, digest)
+
+        download_slots = self.server.download_slots
+        if not download_slots.acquire(timeout=self.DOWNLOAD_SLOT_TIMEOUT):
+            raise ServerBusyError("The server is already sending the maximum amount of files. Try again later!")
+        try:
+            return FileStreamResponse(ticket, file_path, download_slot=download_slots)
+        except BaseException:
+            download_slots.release()
+            raise
 
-    def get_authentication_code(self, username):
+    @remote(mutating=True, timeout=30)
+    def upload_file(self, received_object, relative_server_path, size, digest, overwrite=False):
         """
-        Searches for the username in question to be part of the internal dictionaries values and returnes the according
-        key (authentication code) once found.
+        The method being called, when a user uploads a file. The content of the file follows the request as an
+        incoming stream, which is written chunk by chunk to a temporary file within the target folder. Only once the
+        size and the digest of the received data match the announced ones, the temporary file replaces the target
+        file, so that a broken upload never leaves a partial file behind
         Args:
-            username: The string format of the username for which to return the authentication code for
+            received_object: -
+            relative_server_path: The string path, under which the file is to be saved, relative to the servers main
+                folder. Paths outside of that folder are not allowed
+            size: The integer size of the file in bytes, as announced by the client
+            digest: The hex string digest of the file, as announced by the client
+            overwrite: The boolean value of whether an existing file may be replaced
+
+        Raises:
+            ValueError: In case the file is bigger than the maximum upload size of the server or the received data
+                does not have the announced size
+            PermissionError: In case the path lies outside of the servers main folder
+            FileExistsError: In case the file already exists and may not be replaced
+            FileIntegrityError: In case the received data does not have the announced digest
 
         Returns:
-        The string format of the authentication code
+        The 'FileTransferTicket' describing the uploaded file
         """
-        # Simply iterates through the dictionary values, which are the user names and if the given username is the same
-        # as a username of the dictionary, the key (code) belonging to that user will be returned.
-        for authentication_code in self.user_dictionary.keys():
-            current_username = self.user_dictionary[authentication_code]
-            if current_username == username:
-                return authentication_code
-        # If the loop terminating, without anything being returned raising a KeyError to be handled
-        raise KeyError("The user '{}' does not posses an authentication code!")
+        incoming_stream = self.get_incoming_stream()
+        if size > self.server.max_upload_size:
+            raise ValueError("The file of {} bytes exceeds the maximum upload size of {} bytes".format(
+                size, self.server.max_upload_size
+            ))
+
+        file_path = self._get_upload_path(relative_server_path)
+        if not overwrite and os.path.exists(file_path):
+            raise FileExistsError("The file at '{}' already exists".format(relative_server_path))
+
+        folder_path = os.path.dirname(file_path)
+        os.makedirs(folder_path, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=folder_path, suffix=".upload")
+        try:
+            received_digest = hashlib.new(FILE_DIGEST_ALGORITHM)
+            with os.fdopen(file_descriptor, "wb") as file:
+                for chunk in incoming_stream.iter_chunks():
+                    if incoming_stream.received_size > size:
+                        raise ValueError("The upload contains more data than the announced {} bytes".format(size))
+                    received_digest.update(chunk)
+                    file.write(chunk)
+            if incoming_stream.received_size != size:
+                raise ValueError("The upload contains {} bytes instead of the announced {} bytes".format(
+                    incoming_stream.received_size, size
+                ))
+            if received_digest.hexdigest() != digest:
+                raise FileIntegrityError("The digest of the uploaded file does not match the announced digest")
+            os.replace(temporary_path, file_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+        return FileTransferTicket(None, 0, size, size, digest)
 
+    @staticmethod
+    def _get_upload_path(relative_server_path):
+        """
+        Raises:
+            PermissionError: In case the path lies outside of the servers main folder
 
+        Returns:
+        The absolute string path of the file, that is to be uploaded
+        """
+        return PiverRequestHandler._get_server_path(relative_server_path)
 
     @staticmethod
-    def get_timestamp_from_authentication_code(authentication_code):
+    def _get_server_path(relative_server_path):
         """
-        Converts the given authentication code string into the datetime timestamp integer, that was being stored within
-        the code
+        Resolves a path sent by a client, which is supposed to be relative to the servers main folder. Symbolic links
+        and '..' components are resolved first, so that neither they nor absolute paths lead out of the folder
         Args:
-            authentication_code: The string of the authentication code, that is to be converted into a timestamp
+            relative_server_path: The string path relative to the servers main folder
+
+        Raises:
+            PermissionError: In case the path lies outside of the servers main folder
 
         Returns:
-        The integer timestamp, that was stored inside the code. The expiration date of the code
+        The absolute string path
         """
-        # Splitting the code by its separator to get the two segments individually, then first converting the second
-        # part from string to hex(base 16) and then to integer
-        code_segments = authentication_code.split(":")
-        code_timestamp = int(int(code_segments[1], 16))
-        return code_timestamp
+        project_path = os.path.realpath(PROJECT_PATH)
+        file_path = os.path.realpath(os.path.join(project_path, relative_server_path))
+        if os.path.commonpath([project_path, file_path]) != project_path or file_path == project_path:
+            raise PermissionError("The path '{}' lies outside of the folder of the server".format(relative_server_path))
+        return file_path
 
     @staticmethod
-    def get_datetime_from_authentication_code(authentication_code):
+    def _get_download_range(relative_server_path, offset, length):
         """
-        Converts the given authentication code string into the datetime object, that was being stored within
-        the codes timestamp
+        Checks whether the requested file exists and the requested range is valid
         Args:
-            authentication_code: The string of the authentication code, that is to be converted into datetime object
+            relative_server_path: The string path of the file relative to the servers main folder
+            offset: The integer position within the file, at which the requested range starts
+            length: The integer amount of bytes requested or None. A range reaching beyond the end of the file is cut
+                off
+
+        Raises:
+            PermissionError: In case the path lies outside of the servers main folder
+            FileNotFoundError: In case the file does not exist
+            ValueError: In case the offset is not an integer within the file or the length is not an integer, that is
+                not negative
 
         Returns:
-        The datetime object, whose information was stored inside the code. The expiration date of the code
+        A tuple of the absolute string path of the file, the integer offset and length of the range, the integer size of
+        the file and the hex string digest of the file
         """
-        code_timestamp = AuthenticationGuard.get_timestamp_from_authentication_code(authentication_code)
-        code_datetime = datetime.datetime.fromtimestamp(code_timestamp)
-        return code_datetime
+        # The 'relative_server_path' parameter is supposed to contain the string path of the file which is meant to be
+        # downloaded by the client, the path being relative to the server programs main directory though.
+        # Creating the absolute path of the requested file, by joining the project path with the relative server path
+        file_path = PiverRequestHandler._get_server_path(relative_server_path)
+        file_exists = os.path.isfile(file_path)
+        if not file_exists:
+            raise FileNotFoundError("The requested file at '{}' does not exist".format(file_path))
 
+        # Checking the requested range. An offset at the very end of the file is valid, as that is what a client
+        # resuming an already complete download asks for
+        file_size = os.path.getsize(file_path)
+        if not isinstance(offset, int) or isinstance(offset, bool):
+            raise ValueError("The offset of the requested range has to be an integer, not {!r}".format(offset))
+        if length is not None and (not isinstance(length, int) or isinstance(length, bool)):
+            raise ValueError("The length of the requested range has to be an integer, not {!r}".format(length))
+        if not 0 <= offset <= file_size:
+            raise ValueError("The offset {} is not within the file of {} bytes".format(offset, file_size))
+        if length is not None and length < 0:
+            raise ValueError("The length of the requested range must not be negative")
+        length = file_size - offset if length is None else min(length, file_size - offset)
+        return file_path, offset, length, file_size, get_file_digest(file_path)
 
-class PiverServer(socketserver.TCPServer, socketserver.ThreadingMixIn):
-    """
-    The PiLearnServer class is a subclass of the socketserver.TCPServer class from the python 'socketserver' module.
-    The socketserver module wraps the functionality of python sockets into a slightly higher level server object/
-    application, that deals with TCP socket connections on its own and the developer using it just has to pass the
-    connection information (ip, port) and a HandlerClass to the server object.
-    The handler class then simply defines a 'handle()' method, that deals with all incoming connections to the server.
+    def get_username(self, received_object):
+        """
+        First gets the authentication code from the received object and then passes the code to the authentication
+        guard to get and return the username associated with the authentication code/request
+        Args:
+            received_object:
 
-    Because the PiLearnServer also inherits from the socketserver.ThreadingMixIn, it additionally has the
-    functionality that the server spawns a new handler Thread for each incoming request/connection
+        Returns:
+        The string username of the user, from which the request object was sent
+        """
+        authentication_code = received_object.get_authentication()
+        username = self.authentication_guard.get_username(authentication_code)
+        return username
 
-    The PiLearnServer specifically also requires a reference to the instance of the AuthenticationGuard object, which
-    is used to assign individual authentication codes to the users login in. With those codes the requests of a user
-    can be identified and used to modifiy his profile information only. Codes are checked for validity, as they expire
-    after some time
+    def get_user_profile(self, received_object):
+        """
+        Gets the authentication code from the received object, then passes the code the the authentication guard to get
+        the username and then passes the username to the user dictionary to get the actual 'UserProfile' object, which
+        is then returned
+        Args:
+            received_object:
+
+        Returns:
+        The 'UserProfile' object, that belongs to the user, that sent the request
+        """
+        username = self.get_username(received_object)
+        user_profile = self.user_dict[username]
+        return user_profile
+
+
+# The subclasses build their registries on their own, when they are created
+PiverRequestHandler.remote_methods = PiverRequestHandler.build_remote_methods()
+
+
+class AsyncPiverServer(PiverServerMixIn):
+    """
+    A PiverServer, that is based on an asyncio event loop instead of a thread per connection. All connections are
+    served by a single event loop, so that thousands of idle or slow connections cost no more than their socket
+    buffers. The handling of the requests though is still done by the very same handler classes as for the
+    'PiverServer': For every connection a detached handler object is being created and each received transfer object is
+    passed to its 'process' method, which runs within a pool of threads, so that the blocking handler methods do not
+    block the event loop. Pipelined requests of a connection are being processed concurrently.
 
     Notes:
-        To use the PiLearnServer it has to be created by passing it the server address a reference to what handler class
-        to use and the currently active AuthenticationGuard object.
-        The server is started by calling the 'server_forever' method and is terminated, by te the 'shutdown' method.
-        It also has to be closed by calling the 'server_close' method
+        The server is started by calling the 'serve_forever' method, which blocks until another thread calls the
+        'shutdown' method. Just like the 'PiverServer' it has to be closed by calling the 'server_close' method.
+        Within an already running event loop the server can be started by awaiting the 'start' method instead.
 
     Examples:
-        # Example on how to use the server
         authentication_guard = AuthenticationGuard()
-        server = PiLearnServer(('localhost', 5000), PiLearnHandler, authentication_guard)
+        server = AsyncPiverServer(('localhost', 5000), PiLearnRequestHandler, authentication_guard, user_dict,
+                                  port_manager)
         server.serve_forever()
-        # ...the server handles all the requests
+        # ...from another thread
         server.shutdown()
         server.server_close()
 
     Attributes:
-        server_address: A tuple, whose first element is the string ip address of the server, mostly localhost, and the
-            second element being an integer, that dictates, to which port the server is supposed to bind
-        RequestHandlerClass: A reference to the class, that handles the incoming connections and the data
-        authentication_guard: The AuthenticationGuard object for the server, to manage the indivudual user codes
+        server_address: The tuple of the string ip address and the integer port of the server. After the server has
+            been started it contains the actual port, even if the port 0 was given
+        RequestHandlerClass: A reference to the class, whose objects process the received transfer objects
+        executor: The 'ThreadPoolExecutor', within which the handler methods are being executed
+        The attributes of the configuration, which are set up by the keyword arguments, are described by the
+        'PiverServerMixIn'
     """
+    # The default maximum amount of threads, executing handler methods at the same time
+    MAX_WORKERS = 32
+
     def __init__(self, server_address, RequestHandlerClass, authentication_guard, user_dict, port_manager,
-                 bind_and_activate=True):
-        # Initializing the actual Server class from the python 'socketserver' module and also adding the attribute of
-        # the authentication guard, to make it available within the handling method later
-        super(PiverServer, self).__init__(server_address, RequestHandlerClass, bind_and_activate=bind_and_activate)
-        self.authentication_guard = authentication_guard
-        self.user_dict = user_dict
-        self.port_manager = port_manager
+                 max_workers=MAX_WORKERS, **options):
+        self.server_address = server_address
+        self.RequestHandlerClass = RequestHandlerClass
+        self.configure(authentication_guard, user_dict, port_manager, **options)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+        self.loop = None
+        self.server = None
+        self.shutdown_event = None
+        # The dictionary of the tasks serving the currently open connections as keys and their stream writers as
+        # values, so that the connections can be closed once the server stops
+        self.connections = {}
+        # Set once the server is listening, so that other threads can wait for the server to be ready
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    async def start(self):
+        """
+        Starts listening for connections on the server address within the currently running event loop
+        Returns:
+        void
+        """
+        self.loop = asyncio.get_running_loop()
+        self.shutdown_event = asyncio.Event()
+        host, port = self.server_address
+        self.server = await asyncio.start_server(self._serve_connection, host, port)
+        self.server_address = self.server.sockets[0].getsockname()[:2]
+        self.started.set()
+
+    async def stop(self):
+        """
+        Stops listening for new connections, closes all open connections and waits for them to be finished
+        Returns:
+        void
+        """
+        self.server.close()
+        for writer in self.connections.values():
+            writer.close()
+        if self.connections:
+            await asyncio.gather(*self.connections.keys(), return_exceptions=True)
+        await self.server.wait_closed()
+
+    def serve_forever(self):
+        """
+        Runs a new event loop, which serves the connections until 'shutdown' is being called
+        Returns:
+        void
+        """
+        self.stopped.clear()
+        try:
+            asyncio.run(self._serve_until_shutdown())
+        finally:
+            self.stopped.set()
 
+    def shutdown(self):
+        """
+        Stops the 'serve_forever' loop and waits until it has stopped. Has to be called from another thread than the one
+        running the server
+        Returns:
+        void
+        """
+        self.started.wait()
+        self.loop.call_soon_threadsafe(self.shutdown_event.set)
+        self.stopped.wait()
 
-class PiverRequestHandler(socketserver.BaseRequestHandler):
+    def server_close(self):
+        """
+        Shuts down the pool of threads, that execute the handler methods, and stops the periodic dumps of the statistics
+        Returns:
+        void
+        """
+        self.executor.shutdown(wait=True)
+        self.server_statistics.stop_dumping()
 
-    def __init__(self, request, client_address, server):
-        # IMPORTANT INFO:
-        # The following code of this constructor method is the original code used within the  python 'socketserver'
-        # module to instantiate the a BaseRequestHandler. The system the actual TCP server finishes a request is by
-        # simply instantiating the Handler class and passing it the information of the request, the client_address
-        # and a instance of the server itself
-        self.request = request
-        self.client_address = client_address
-        self.server = server
-        self.setup()
+    async def _serve_until_shutdown(self):
+        await self.start()
+        await self.shutdown_event.wait()
+        await self.stop()
+
+    async def _serve_connection(self, reader, writer):
+        """
+        The coroutine serving a single client connection. Receives the frames with the transfer objects and processes
+        them until the client closes the connection or it was idle for longer than the idle timeout
+        Args:
+            reader: The 'asyncio.StreamReader' of the connection
+            writer: The 'asyncio.StreamWriter' of the connection
+
+        Returns:
+        void
+        """
+        client_address = writer.get_extra_info("peername")
+        handler = self.RequestHandlerClass(None, client_address, self)
+        connection_task = asyncio.current_task()
+        self.connections[connection_task] = writer
+        # Pipelined requests are processed concurrently, each of them writing its response as soon as it is done
+        send_lock = asyncio.Lock()
+        pipelined_tasks = set()
+        try:
+            while True:
+                try:
+                    flags, payload = await asyncio.wait_for(
+                        receive_frame_async(reader, max_size=MAX_REQUEST_FRAME_SIZE), self.idle_timeout
+                    )
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except ValueError as error:
+                    await self._send_response(writer, send_lock, error, handler.codec)
+                    return
+                start_time = time.perf_counter()
+                received_size = len(payload)
+
+                incoming_stream = None
+                if flags & FRAME_STREAM_FLAG:
+                    # The data following the request is received completely before the request is processed, as the
+                    # handler methods run in threads, which cannot read from the connection
+                    try:
+                        incoming_stream = await self._spool_incoming_stream(reader)
+                    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                        return
+                    except ValueError as error:
+                        await self._send_response(writer, send_lock, error, handler.codec)
+                        return
+
+                try:
+                    received_object = decode_object(flags, payload)
+                except (pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError) as error:
+                    if incoming_stream is not None:
+                        incoming_stream.close()
+                    await self._send_response(writer, send_lock, error, handler.codec)
+                    continue
+
+                if incoming_stream is not None:
+                    try:
+                        if isinstance(received_object, RequestTransfer) and not received_object.is_pipelined():
+                            await self._process(handler, received_object, writer, send_lock, start_time,
+                                                received_size, incoming_stream=incoming_stream)
+                        else:
+                            error_message = "Only requests, that are not pipelined, can be followed by streamed data"
+                            await self._send_response(writer, send_lock, TypeError(error_message), handler.codec)
+                    finally:
+                        incoming_stream.close()
+                    continue
+
+                if isinstance(received_object, CodecNegotiationTransfer):
+                    response = handler.negotiate_codec(received_object)
+                    await self._send_response(writer, send_lock, response, handler.codec)
+                    handler.apply_negotiation(received_object)
+                    continue
+
+                if isinstance(received_object, RequestTransfer) and received_object.is_pipelined():
+                    task = asyncio.ensure_future(self._process(handler, received_object, writer, send_lock, start_time,
+                                                               received_size))
+                    pipelined_tasks.add(task)
+                    task.add_done_callback(pipelined_tasks.discard)
+                    continue
+
+                await self._process(handler, received_object, writer, send_lock, start_time, received_size)
+        except ConnectionError:
+            pass
+        finally:
+            if pipelined_tasks:
+                await asyncio.gather(*pipelined_tasks, return_exceptions=True)
+            writer.close()
+            del self.connections[connection_task]
+
+    async def _spool_incoming_stream(self, reader):
+        """
+        Receives the data streamed after a request into a temporary file. Data beyond the maximum upload size of the
+        server is received, but discarded, in which case the handler method fails due to the missing data
+        Args:
+            reader: The 'asyncio.StreamReader' of the connection
+
+        Raises:
+            ValueError: In case a data frame is bigger than MAX_STREAM_FRAME_SIZE
+            ConnectionAbortedError: In case a frame, that is not a data frame, was received
+
+        Returns:
+        The 'SpooledIncomingStream' with the received data
+        """
+        file = tempfile.TemporaryFile()
+        try:
+            spooled_size = 0
+            while True:
+                flags, payload = await asyncio.wait_for(
+                    receive_frame_async(reader, max_size=MAX_STREAM_FRAME_SIZE), self.idle_timeout
+                )
+                if not flags & FRAME_DATA_FLAG:
+                    raise ConnectionAbortedError("Received a request frame in the middle of a streamed request")
+                if not payload:
+                    break
+                spooled_size += len(payload)
+                if spooled_size <= self.max_upload_size:
+                    await self.loop.run_in_executor(self.executor, file.write, payload)
+            file.seek(0)
+        except BaseException:
+            file.close()
+            raise
+        return SpooledIncomingStream(file)
+
+    async def _process(self, handler, received_object, writer, send_lock, start_time, received_size,
+                       incoming_stream=None):
+        """
+        Lets the handler process the received object within the thread pool, sends the response back and records the
+        request within the statistics
+        Args:
+            handler: The detached handler object of the connection
+            received_object: The received transfer object
+            writer: The 'asyncio.StreamWriter' of the connection
+            send_lock: The 'asyncio.Lock' securing the writing of responses to the connection
+            start_time: The performance counter time, at which the request was received
+            received_size: The integer amount of bytes of the request frame
+            incoming_stream: The 'SpooledIncomingStream' of data following the request or None
+
+        Returns:
+        void
+        """
+        # Waiting for the slot of the scheduler on the event loop, as the threads of the executor would otherwise be
+        # occupied by waiting requests, so that the requests of the other users would queue up in the executor in the
+        # order of their arrival, without the scheduler even seeing them
+        scheduling = handler.get_scheduling(received_object)
+        if scheduling is not None:
+            username, cost = scheduling
+            if not await self.request_scheduler.acquire_async(username, cost=cost, timeout=self.SCHEDULE_TIMEOUT):
+                if incoming_stream is not None:
+                    incoming_stream.close()
+                error = ServerBusyError("The server is busy processing the requests of other users. Try again later!")
+                flags, parts = handler.encode_response(handler.get_error_response(received_object, error))
+                async with send_lock:
+                    await send_frame_async(writer, parts, flags=flags)
+                handler.record_request(received_object, start_time, received_size, get_payload_length(parts), True)
+                return
         try:
-            self.handle()
+            flags, parts, stream, failed = await self.loop.run_in_executor(
+                self.executor, self._process_and_encode, handler, received_object, incoming_stream,
+                scheduling is not None
+            )
         finally:
-            self.finish()
-
-        # Now begins the new code:
-        # Considering the object behind the server attribute is an instance of the PiLearnServer class, the
-        # authentication guard object could be accessed via the server object, but the reference to the authentication
-        # guard object is additionally being wrapped into an attribute of this very class, simplifying access
-        self.authentication_guard = self.server.authentication_guard
-        self.user_dict = self.server.user_dict
-        self.port_manager = self.server.port_manager
+            if scheduling is not None:
+                self.request_scheduler.release()
+        sent_size = get_payload_length(parts)
+        if stream is None:
+            async with send_lock:
+                await send_frame_async(writer, parts, flags=flags)
+        else:
+            # The data of a streamed response is read within the thread pool chunk by chunk and written to the
+            # connection right after the response
+            try:
+                async with send_lock:
+                    await send_frame_async(writer, parts, flags=flags | FRAME_STREAM_FLAG)
+                    chunks = stream.iter_chunks()
+                    while True:
+                        chunk = await self.loop.run_in_executor(self.executor, next, chunks, None)
+                        if chunk is None:
+                            break
+                        await send_frame_async(writer, chunk, flags=FRAME_DATA_FLAG)
+                        sent_size += len(chunk)
+                    await send_frame_async(writer, b"", flags=FRAME_DATA_FLAG)
+            finally:
+                stream.close()
+
+        if incoming_stream is not None:
+            received_size += incoming_stream.received_size
+        handler.record_request(received_object, start_time, received_size, sent_size, failed)
 
-    def handle(self):
-        # Waiting for the data of any of the users clients to be received
-        data = self.request.recv(4096)
+    @staticmethod
+    def _process_and_encode(handler, received_object, incoming_stream=None, scheduled=False):
+        """
+        Lets the handler process the received object and serialize (and compress) the response. Runs within the thread
+        pool, as both is CPU bound and might be blocking
+        Args:
+            handler: The detached handler object of the connection
+            received_object: The received transfer object
+            incoming_stream: The 'SpooledIncomingStream' of data following the request or None
+            scheduled: The boolean value of whether the slot of the request scheduler was already acquired
 
-        # As the protocol dictates everything that passes this socket connection has to be serialized/pickled object
-        # of some sort, the received data is being loaded with the pickle module
+        Returns:
+        A tuple of the integer flags byte, the list of bytes like objects, that make up the payload of the response,
+        the 'StreamingResponse', whose data is to be sent after the response, or None and the boolean value of whether
+        the request failed
+        """
+        response = handler.process(received_object, incoming_stream=incoming_stream, scheduled=scheduled)
+        failed = isinstance(response, BaseException)
+        pipelined = isinstance(received_object, RequestTransfer) and received_object.is_pipelined()
+        # Streaming the data of pipelined responses would block all other responses on the connection
+        response, stream = handler.detach_stream(response, streaming_allowed=not pipelined)
+        if pipelined:
+            if response is not received_object:
+                received_object.add_exception(response)
+            response = received_object
         try:
-            received_object = pickle.loads(data)
-        except pickle.UnpicklingError as error:
-            # TODO: add behaviour for unpinklling error
-            pass
+            flags, parts = handler.encode_response(response)
+        except Exception as error:
+            # The client would otherwise wait for the response in vain
+            if stream is not None:
+                stream.close()
+            flags, parts = handler.encode_response(handler.get_error_response(received_object, error))
+            return flags, parts, None, True
+        return flags, parts, stream, failed
 
-        # Checking whether or not the received request is a first time login attempt or an actual action request
-        # of an already authenticated user.
-        # In case the received object is indeed a login request calls the 'login' method, that processes the transfer
-        # object and generates the appropriate response object
-        if isinstance(received_object, LoginTransfer):
-            response = self.login(received_object)
+    @staticmethod
+    async def _send_response(writer, send_lock, response, codec):
+        flags, parts = encode_object(response, codec)
+        async with send_lock:
+            await send_frame_async(writer, parts, flags=flags)
 
-        else:
-            # First getting the authentication of the sent object (the protocol dictates, that every object passing this
-            # socket connect has to inherit from the BaseTransferObject class and thus contain the information about the
-            # authentication code and methods to obtain this information
-            authentication_code = received_object.get_authentication()
-            is_valid = self.authentication_guard.is_valid_authentication(authentication_code)
-            if not is_valid:
-                # TODO: What to to in case the authentication code is not valid anymore
-                pass
 
-            # Now checking for the object type to determine to which sub-handling method to redirect the object to
-            if isinstance(received_object, RequestTransfer):
-                # In case the object is a request object, the handler object will redirect the processing of the
-                # received object to the designated method
-                response = self.handle_request(received_object)
+def compute_file_digest(file_path):
+    """
+    Computes the digest of a file with the FILE_DIGEST_ALGORITHM
+    Args:
+        file_path: The string path of the file
 
-        # sending the generated response back to the client
-        pickled_response = pickle.dumps(response)
-        self.request.sendall(pickled_response)
+    Returns:
+    The hex string digest of the file
+    """
+    digest = hashlib.new(FILE_DIGEST_ALGORITHM)
+    with open(file_path, "rb") as file:
+        for chunk in iter(functools.partial(file.read, SimpleClientFileDownloader.CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-    def login(self, login_transfer):
-        """
-        The method which processes the received requests from the socket connection, that turn out to be login requests
-        from the sending clients. Login requests are represented by the 'LoginTransfer' objects. They contain the
-        information about the username and the password, that the user had entered on the client side of the
-        connection, after verifying, that both the username and password exist and are correct, the method creates a
-        authentication code by calling the AuthenticationGuard, creates the reference from this individual code to the
-        username, adds the fresh authentication code to the LoginTransfer object and returns that object, so it can
-        be sent back to the client side as a response
 
-        Notes:
-            Could return:
+@functools.lru_cache(maxsize=256)
+def _get_cached_file_digest(file_path, file_size, modification_time):
+    return compute_file_digest(file_path)
 
-            ConnectionRefusedError: In case the method gets passed a LoginTransfer object with a username, that is not
-                registered in the servers system
-            PermissionError: In case the method gets passed a LoginTransfer object, whose username exists, but whose
-                password is not correct (The password doesnt match with the password, that was stored in the servers
-                memory)
 
-        Args:
-            login_transfer: The 'LoginTransfer' object, that was received and now is to be processed
+def get_file_digest(file_path):
+    """
+    Returns the digest of a file, that is being offered for download. As the digest is sent with every download
+    request, it is cached for as long as neither the size nor the modification time of the file changes
+    Args:
+        file_path: The string path of the file
 
-        Returns:
-        The same 'LoginTransfer' object, that was passed, but having added the created, individual authentication code
-        to it, that the user can use
-        """
-        username = login_transfer.get_username()
-        password = login_transfer.get_password()
-        # First checks whether the user actually exists or not by calling the user dict object.
-        # The user dict object stores the reference to all existing user profiles with them being the values to the
-        # usernames as keys.
-        # In case the user does not exists, returns a ConnectionRefusedError to send back as an response to who ever
-        # attempted to login with an non existent username
-        user_exists = self.user_dict.user_exists(username)
-        if not user_exists:
-            error_message = "The username '{}' does not exist!".format(username)
-            return ConnectionRefusedError(error_message)
+    Returns:
+    The hex string digest of the file
+    """
+    file_stat = os.stat(file_path)
+    return _get_cached_file_digest(file_path, file_stat.st_size, file_stat.st_mtime_ns)
 
-        # In case the username existed, the validity of the password to the username is now being checked.
-        # In case the password is not correct, returns a PermissionError to send back as an response to the user,
-        # to whom the username belongs
-        password_valid = self.user_dict.password_valid(username, password)
-        if not password_valid:
-            error_message = "The password for the given username '{}' is not correct".format(username)
-            return PermissionError(error_message)
 
-        # If the login request came from a user, that already posses an authentication code, that is valid simply
-        # sending the stored one to the user again, instead of creating a new one
-        if self.authentication_guard.user_exists(username):
-            authentication_code = self.authentication_guard.get_authentication_code(username)
-            login_transfer.add_authentication_code(authentication_code)
+def open_download_file(file_path, offset):
+    """
+    Opens the file, into which a downloaded range of a file is to be written, and moves to the position of the range.
+    The existing content of the file is kept, as it might be the already downloaded part of the file
+    Args:
+        file_path: The string path of the file. If the path does not refer to an already existing file, a file will be
+            created (in case the folder structure exists)
+        offset: The integer position within the file, at which the range starts
 
-        else:
-            # Creating the code authentication code and adding it to the LoginTransfer object before returning that
-            # object to be sent back to the client side program fro the user to utilize.
-            authentication_code = self.authentication_guard.create_authentication_code(username)
-            login_transfer.add_authentication_code(authentication_code)
+    Returns:
+    The writable open() object in byte mode
+    """
+    mode = "r+b" if os.path.isfile(file_path) else "w+b"
+    file = open(file_path, mode=mode, buffering=SimpleClientFileDownloader.BUFFER_SIZE)
+    file.seek(offset)
+    return file
 
-        return login_transfer
 
-    def handle_request(self, received_object):
+class DownloadProgress:
+    """
+    Keeps track of the progress of multiple downloads running at the same time: How many of the files are finished or
+    failed and how many bytes were received in total, from which the throughput is derived. The downloads add to the
+    progress from multiple threads, so all access is secured by a lock.
+    In case a callback is given, it is called with the progress object every time a file is finished
+
+    Attributes:
+        total_files: The integer amount of files to download
+        finished_files: The integer amount of files, that were downloaded successfully
+        failed_files: The list of tuples (save_path, error) of the downloads, that failed
+        received_bytes: The integer amount of bytes received by all downloads
+        start_time: The monotonic time, at which the downloads were started
+        end_time: The monotonic time, at which the last download was finished or None
+        callback: The callable, that is called with the progress object every time a file is finished, or None
+        lock: The threading.Lock securing the counters
+
+    Args:
+        callback: The callable, that is called with the progress object every time a file is finished
+    """
+    def __init__(self, callback=None):
+        self.total_files = 0
+        self.finished_files = 0
+        self.failed_files = []
+        self.received_bytes = 0
+        self.start_time = time.monotonic()
+        self.end_time = None
+        self.callback = callback
+        self.lock = threading.Lock()
+
+    def start(self, total_files):
         """
-        This method is the first instance of handling the incoming requests. Those 'RequestTransfer' objects, that are
-        passed to this method, contain a authentication code, so the following processes know which user to assign the
-        action, they contain the string name of a method of handler object and a list with parameters to pass to this
-        method.
-        This method uses the method name string and the parameter list to actually call the requested method and return
-        the response, that has been returned by this specific method
+        Resets the progress for a new set of downloads
         Args:
-            received_object: The 'RequestTransfer' object specifying, which method to call
+            total_files: The integer amount of files to download
 
         Returns:
-        The response, that has been generated by the method, that was requested
+        void
         """
-        # Getting the string method name of the method that is supposed to be called and checking whether such a method
-        # even exists or not. In case the method does not exists, this method will return
-        method_name = received_object.get_method_name()
-        method_exists = hasattr(self, method_name)
-        if not method_exists:
-            error_message = "The server RequestHandler does not support a method named '{}'".format(method_name)
-            return AttributeError(error_message)
-
-        parameter_list = received_object.get_parameter_list()
-        # Calling the specified method of the this handler object with the parameters from the parameter list.
-        # Excepting a TypeError due to a possibly wrong amount or wrong type of passed parameters
-        method = getattr(self, method_name)
-        try:
-            response = method(received_object, *parameter_list)
-            received_object.add_response(response)
-        except Exception as error:
-            return error
+        with self.lock:
+            self.total_files = total_files
+            self.finished_files = 0
+            self.failed_files = []
+            self.received_bytes = 0
+            self.start_time = time.monotonic()
+            self.end_time = None if total_files else self.start_time
+
+    def add_bytes(self, amount):
+        """
+        Args:
+            amount: The integer amount of bytes, that were received
 
-        # Returning the response, that was generated by the method, that was called through the request
-        return received_object
+        Returns:
+        void
+        """
+        with self.lock:
+            self.received_bytes += amount
 
-    def change_password(self, received_object, password):
+    def create_sink(self, write):
         """
-        Changes the password of the user to the new password
         Args:
-            received_object:
-            password: The new password string
+            write: The callable, that writes a chunk of received data
 
         Returns:
-        The new password string
+        A callable, that writes a chunk of received data with the given callable and adds its size to the progress
         """
-        user_profile = self.get_user_profile(received_object)
-        user_profile.set_password(password)
-        return password
+        def sink(data):
+            write(data)
+            self.add_bytes(len(data))
+        return sink
 
-    def download_file(self, received_object, relative_server_path):
+    def finish_file(self, save_path, error=None):
         """
-        The method being called, when a user request to download a file, specified by the path 'relative_server_path'.
-        The method checks whether the requested file exists (raises an error in case it doesnt) acquires an open port
-        from the port manager, starts a FileSendServer with the file and the port and sends the port of the server
-        back to the user as a response
+        Marks one of the downloads as finished and calls the callback
         Args:
-            received_object: -
-            relative_server_path: The string path that specifies the file to download. The path is supposed to be
-                relative to the servers main folder, meaning that files, that dont belong to the server cannot be
-                downloaded.
+            save_path: The string path of the downloaded file
+            error: The exception, that made the download fail, or None in case it was successful
 
         Returns:
-        The integer port number on which the file server is listening for an incoming connection of a downloader
+        void
         """
-        # Getting the user profile of the user, which sent the request
-        user_profile = self.get_user_profile(received_object)
+        with self.lock:
+            if error is None:
+                self.finished_files += 1
+            else:
+                self.failed_files.append((save_path, error))
+            if self.finished_files + len(self.failed_files) >= self.total_files:
+                self.end_time = time.monotonic()
+        if self.callback is not None:
+            self.callback(self)
+
+    def is_done(self):
+        """
+        Returns:
+        The boolean value of whether all the downloads are finished, successfully or not
+        """
+        with self.lock:
+            return self.end_time is not None
 
-        # This method is in charge of initializing the download of a file from the server to the client. The
-        # 'relative_server_path' parameter is supposed to contain the string path of the file which is meant to be
-        # downloaded by the client, the path being relative to the server programs main directory though.
-        # Creating the absolute path of the requested file, by joining the project path with the relative server path
-        file_path = os.path.join(PROJECT_PATH, relative_server_path)
-        file_exists = os.path.isfile(file_path)
-        if not file_exists:
-            raise FileNotFoundError("The requested file at '{}' does not exist".format(file_path))
+    def get_elapsed_time(self):
+        """
+        Returns:
+        The float amount of seconds since the downloads were started, up to the end of the last download
+        """
+        with self.lock:
+            end_time = time.monotonic() if self.end_time is None else self.end_time
+            return end_time - self.start_time
 
-        # Acquiring an open port from the port manager and starting an open FileSendServer, to wait for an incoming
-        # socket connection from the client
-        port = self.port_manager.acquire()
-        file_server = SimpleFileSendServer(port, file_path)
-        file_server.start()
+    def get_throughput(self):
+        """
+        Returns:
+        The float amount of bytes received per second, over all downloads
+        """
+        elapsed_time = self.get_elapsed_time()
+        with self.lock:
+            return self.received_bytes / elapsed_time if elapsed_time > 0 else 0.0
 
-        # Sending the port of the file server back to the client, so that the client can start a downloader thread,
-        # connecting to the file server, that downloads the file
-        return port
+    def get_statistics(self):
+        """
+        Returns:
+        A dictionary with the keys 'total_files', 'finished_files', 'failed_files', 'received_bytes',
+        'elapsed_time' and 'throughput'
+        """
+        elapsed_time = self.get_elapsed_time()
+        with self.lock:
+            return {
+                "total_files": self.total_files,
+                "finished_files": self.finished_files,
+                "failed_files": len(self.failed_files),
+                "received_bytes": self.received_bytes,
+                "elapsed_time": elapsed_time,
+                "throughput": self.received_bytes / elapsed_time if elapsed_time > 0 else 0.0
+            }
+
+
+class DownloadCache:
+    """
+    A cache on the disk of the client for downloaded files. The files are stored content addressed, under the digest
+    the server computed for them, so that the same file is stored only once, even if it is downloaded from different
+    paths. An index maps the files of a server (server address and path) to the digest of the version last downloaded.
+    With that digest the download can be made conditional: In case the file did not change on the server, it does not
+    have to be sent again and is copied from the cache instead.
+    The total size of the cached files is limited to 'max_size' bytes. Whenever a new file is added, the least recently
+    used files are evicted until the limit is met again. The modification time of a cached file serves as the time of
+    its last use, so it is updated every time the file is restored from the cache.
 
-    def get_username(self, received_object):
+    Attributes:
+        cache_dir: The string path of the folder containing the cached files and the index
+        max_size: The integer maximum amount of bytes of all cached files
+        index: The dictionary with the string cache keys as keys and the hex string digests as values
+        lock: The threading.Lock securing the index and the cached files
+
+    Args:
+        cache_dir: The string path of the folder for the cache. Is being created in case it does not exist
+        max_size: The integer maximum amount of bytes of all cached files
+    """
+    # The default maximum size of all cached files in bytes
+    DEFAULT_MAX_SIZE = 512 * 1024 ** 2
+    # The name of the file within the cache folder, in which the index is saved
+    INDEX_FILE_NAME = "index.json"
+
+    def __init__(self, cache_dir, max_size=DEFAULT_MAX_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def lookup(self, key):
         """
-        First gets the authentication code from the received object and then passes the code to the authentication
-        guard to get and return the username associated with the authentication code/request
         Args:
-            received_object:
+            key: The string cache key of the file
 
         Returns:
-        The string username of the user, from which the request object was sent
+        The hex string digest of the cached version of the file or None, in case the file is not cached (anymore)
         """
-        authentication_code = received_object.get_authentication()
-        username = self.authentication_guard[authentication_code]
-        return username
+        with self.lock:
+            digest = self.index.get(key)
+            if digest is None or not os.path.isfile(self._get_content_path(digest)):
+                return None
+            return digest
 
-    def get_user_profile(self, received_object):
+    def restore(self, digest, save_path):
         """
-        Gets the authentication code from the received object, then passes the code the the authentication guard to get
-        the username and then passes the username to the user dictionary to get the actual 'UserProfile' object, which
-        is then returned
+        Copies the cached file with the given digest to the given path and marks it as recently used
         Args:
-            received_object:
+            digest: The hex string digest of the file
+            save_path: The string path to where the file is supposed to the saved to
 
         Returns:
-        The 'UserProfile' object, that belongs to the user, that sent the request
+        The boolean value of whether the file was in the cache
         """
-        username = self.get_username(received_object)
-        user_profile = self.user_dict[username]
-        return user_profile
+        content_path = self._get_content_path(digest)
+        with self.lock:
+            try:
+                shutil.copyfile(content_path, save_path)
+                os.utime(content_path)
+            except FileNotFoundError:
+                return False
+        return True
+
+    def store(self, key, digest, file_path):
+        """
+        Adds the downloaded file to the cache, in case it is not already cached, remembers its digest for the given
+        key and evicts the least recently used files, if the cache got too big
+        Args:
+            key: The string cache key of the file
+            digest: The hex string digest of the file, as the server announced it
+            file_path: The string path of the downloaded file
+
+        Returns:
+        void
+        """
+        # Files bigger than the whole cache would only evict everything else. The digest is used as a file name, so
+        # it must not contain anything but hex digits
+        if os.path.getsize(file_path) > self.max_size or not digest or not set(digest) <= set("0123456789abcdef"):
+            return
+
+        content_path = self._get_content_path(digest)
+        with self.lock:
+            if os.path.isfile(content_path):
+                os.utime(content_path)
+            else:
+                # Copying into a temporary file first, so that an interrupted copy never leaves a broken file under the
+                # name of the digest
+                temporary_path = "{}.{}.tmp".format(content_path, threading.get_ident())
+                shutil.copyfile(file_path, temporary_path)
+                os.replace(temporary_path, content_path)
+            self.index[key] = digest
+            self._evict()
+            self._save_index()
+
+    def get_size(self):
+        """
+        Returns:
+        The integer amount of bytes of all cached files
+        """
+        with self.lock:
+            return sum(size for path, size, last_used in self._list_content())
+
+    def _evict(self):
+        # Has to be called while holding the lock
+        content = sorted(self._list_content(), key=lambda entry: entry[2])
+        total_size = sum(size for path, size, last_used in content)
+        for path, size, last_used in content:
+            if total_size <= self.max_size:
+                break
+            os.remove(path)
+            total_size -= size
+
+        # Removing the index entries of the evicted files
+        cached_digests = {os.path.basename(path) for path, size, last_used in self._list_content()}
+        self.index = {key: digest for key, digest in self.index.items() if digest in cached_digests}
+
+    def _list_content(self):
+        """
+        Returns:
+        A list of tuples of the string path, the integer size and the float time of the last use of every cached file
+        """
+        content = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name == self.INDEX_FILE_NAME or entry.name.endswith(".tmp") or not entry.is_file():
+                    continue
+                entry_stat = entry.stat()
+                content.append((entry.path, entry_stat.st_size, entry_stat.st_mtime))
+        return content
+
+    def _get_content_path(self, digest):
+        return os.path.join(self.cache_dir, digest)
+
+    def _load_index(self):
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE_NAME)
+        try:
+            with open(index_path, "r") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_index(self):
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE_NAME)
+        temporary_path = index_path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(self.index, file)
+        os.replace(temporary_path, index_path)
 
 
 class SimpleClientFileDownloader(threading.Thread):
@@ -977,63 +6802,135 @@ class SimpleClientFileDownloader(threading.Thread):
     This object enables the download of file from a server to a client. The clients ip does not have to be know to the
     server, only the servers public host address and the used port have to be known to the client. Also on the server
     side there has to be running a 'SimpleFileSendServer' (more specifically one for every downloading client), that
-    listens on the specified port. The client will go on and establish a connection to the server and repeatedly send
-    little ping packages, to which the server responds with chunks of ~1KB of the files data until all the data
-    has been transferred to the client.
+    listens on the specified port. The client will go on and establish a connection to the server, which first
+    announces the size of the range of the file it sends and then streams the range without waiting for any
+    acknowledgement. The received data is written to the position of the range within the file through a big write
+    buffer, so that the disk is not accessed for every chunk.
+    In case the digest of the whole file is given and the range reaches up to the end of the file, the complete file
+    is checked against the digest after the download. A download, that failed for any reason, leaves the already
+    received part of the file in place, so that it can be resumed.
 
     Attributes:
         server_ip: The string, containing the servers IP address or hostname
         server_port: The port on which the "SimpleFileSendServer" is running on the server
+        file_path: The string path of the file, into which the data is written
         file: The file open() object in byte mode
+        offset: The integer position within the file, at which the received range starts
+        length: The integer amount of bytes within the range, as announced by the server. None until the transfer
+            started, in case it was not known beforehand
+        digest: The hex string digest of the whole file or None
+        file_size: The integer size of the whole file or None
         receiving: The boolean value of whether or not the client is currently receiving data
+        received_size: The integer amount of bytes already received
+        finished: The threading.Event, that is being set once the download is over, successful or not
+        exception: The exception, that made the download fail or None
 
     Args:
         server_ip: The string, containing the servers IP address or hostname
         server_port: The port on which the "SimpleFileSendServer" is running on the server
         file_path: The string path to the file, into which the received data is to be saved in. If the path does not
             refer to an already existing file, a file will be created (in case the folder structure exists)
+        timeout: The amount of seconds to wait for data from the server, before the download is cancelled
+        offset: The integer position within the file, at which the received range starts
+        length: The integer amount of bytes of the range, if known beforehand
+        digest: The hex string digest of the whole file, to check the file against, once it is complete
+        file_size: The integer size of the whole file, needed to tell whether the file is complete
     """
-    def __init__(self, server_ip, server_port, file_path):
+    # The maximum amount of bytes, that is being received with a single call to the socket
+    CHUNK_SIZE = 262144
+    # The size of the write buffer of the file in bytes
+    BUFFER_SIZE = 1024 ** 2
+
+    def __init__(self, server_ip, server_port, file_path, timeout=30, offset=0, length=None, digest=None,
+                 file_size=None):
         threading.Thread.__init__(self)
         self.server_ip = server_ip
         self.server_port = server_port
+        self.timeout = timeout
 
-        # Creating the file object in byte mode and with the permission to create a new file if none already exists
-        self.file = open(file_path, mode="wb+")
+        # Opening the file at the position of the range, keeping the part of the file, that was already downloaded
+        self.file_path = file_path
+        self.file = open_download_file(file_path, offset)
+        self.offset = offset
+        self.length = length
+        self.digest = digest
+        self.file_size = file_size
 
         self.receiving = False
+        self.received_size = 0
+        self.finished = threading.Event()
+        self.exception = None
 
     def run(self):
         address_tuple = (self.server_ip, self.server_port)
         self.receiving = True
 
-        # Creating the socket object and connecting it it the server
-        sock = socket.socket()
-        sock.connect(address_tuple)
-
+        sock = None
         try:
-            while self.receiving:
-                # Sending a short message through the socket, so the server side program knows when a new cycle begins
-                sock.sendall(b"ok")
-                # receiving the actual data chunk of the file and writing it to the file object
-                data = sock.recv(1024)
-                self.file.write(data)
+            # Creating the socket object and connecting it it the server
+            sock = socket.create_connection(address_tuple, timeout=self.timeout)
+            # The server starts by announcing the size of the range, so that the end of the transfer can be told apart
+            # from a broken connection
+            self.length, = FILE_SIZE_HEADER.unpack(receive_exactly(sock, FILE_SIZE_HEADER.size))
+
+            # Receiving the data into one reused buffer and writing it to the buffered file object
+            buffer = bytearray(self.CHUNK_SIZE)
+            view = memoryview(buffer)
+            while self.received_size < self.length:
+                chunk_size = sock.recv_into(view, min(self.length - self.received_size, self.CHUNK_SIZE))
+                if not chunk_size:
+                    raise ConnectionAbortedError("The file server closed the connection after {} of {} bytes".format(
+                        self.received_size, self.length
+                    ))
+                self.file.write(view[:chunk_size])
+                self.received_size += chunk_size
+
+            if self.file_size is not None and self.offset + self.length == self.file_size:
+                # The file is complete, so anything left behind the end of the file (from an earlier, bigger version
+                # of the file) is removed and the file is checked against the digest of the server
+                self.file.truncate()
+                self.file.close()
+                self.verify()
         except Exception as e:
-            pass
+            self.exception = e
         finally:
-            # Closing the socket and the file
-            sock.close()
-            self.receiving = False
+            # Closing the socket and the file, which also flushes the write buffer
+            if sock is not None:
+                sock.close()
             self.file.close()
+            self.receiving = False
+            self.finished.set()
+
+    def verify(self):
+        """
+        Compares the digest of the complete file with the digest of the file on the server, if it was given
+        Raises:
+            FileIntegrityError: In case the digests do not match
+
+        Returns:
+        void
+        """
+        if self.digest is not None and compute_file_digest(self.file_path) != self.digest:
+            raise FileIntegrityError("The digest of the downloaded file '{}' does not match the digest of the file "
+                                     "on the server".format(self.file_path))
 
-    def wait(self):
+    def wait(self, timeout=None):
         """
         Upon being called simply blocks the program flow until the full file has been received
+        Args:
+            timeout: The maximum amount of seconds to wait. None to wait until the download is over
+
+        Raises:
+            TimeoutError: In case the download did not finish within the timeout
+            The exception, that made the download fail
+
         Returns:
         void
         """
-        while self.receiving:
-            time.sleep(0.01)
+        if not self.finished.wait(timeout):
+            raise TimeoutError("The download did not finish within {} seconds".format(timeout))
+        if self.exception is not None:
+            raise self.exception
 
 
 class SimpleFileSendServer(threading.Thread):
@@ -1041,65 +6938,235 @@ class SimpleFileSendServer(threading.Thread):
     This object enables the download of a file from the server to a client.The clients ip does not have to be know to
     the server, only the servers public host address and the used port have to be known to the client. This object has
     to be created and running on the server side. If a "SimpleClientFileDownloader" is then created and started within
-    a client and connects to this server by addressing the correct port, a connection is being established. The client
-    will then send little ping messages, to which this server responds with chunks (~1KB) of the files data.
+    a client and connects to this server by addressing the correct port, a connection is being established. The server
+    then announces the size of the range of the file, that it sends, and streams the range with 'socket.sendfile',
+    which lets the operating system copy the file to the socket directly without passing the data through python
+    (where supported).
+    In case no client connects within 'accept_timeout' seconds, the server gives up, so that abandoned downloads do not
+    keep a thread and a port forever. As soon as the server stopped listening, the port is released to the port
+    manager, if one was given, even if the transfer of the file is still going on.
 
     Attributes:
         ip: The localhost address string
         port: The integer port on which this server is listening
         file: The byte reading open()-fileobject of the file to be sent
+        offset: The integer position within the file, at which the sent range starts
+        length: The integer amount of bytes to send
+        sock: The listening socket object
+        port_manager: The 'PortManager', from which the port was acquired or None
+        accept_timeout: The amount of seconds to wait for the client to connect
+        send_timeout: The amount of seconds a single send operation may block, before the client is given up on
         sending: The boolean value of whether or not the server is currently sending data
 
     Args:
         port: The port, on which the server is supposed to listen on
         file_path: The string path to the file that is supposed to be sent
+        offset: The integer position within the file, at which the range to send starts
+        length: The integer amount of bytes to send. None for everything up to the end of the file
+        port_manager: The 'PortManager', to which the port is to be released, once the server stopped listening
+        accept_timeout: The amount of seconds to wait for the client to connect
+        send_timeout: The amount of seconds a single send operation may block
     """
-    def __init__(self, port, file_path):
+    # The default amount of seconds the server waits for the client to connect. Has to be shorter than the lease time
+    # of the port manager, so that the port is released by the server before its lease expires
+    ACCEPT_TIMEOUT = 30
+    # The default amount of seconds a single send operation may block, in case the client stops receiving
+    SEND_TIMEOUT = 30
+
+    def __init__(self, port, file_path, offset=0, length=None, port_manager=None, accept_timeout=ACCEPT_TIMEOUT,
+                 send_timeout=SEND_TIMEOUT):
         threading.Thread.__init__(self)
         self.ip = "localhost"
         self.port = port
+        self.port_manager = port_manager
+        self.accept_timeout = accept_timeout
+        self.send_timeout = send_timeout
 
         self.file = open(file_path, "rb")
+        file_size = os.fstat(self.file.fileno()).st_size
+        self.offset = offset
+        self.length = file_size - offset if length is None else length
+
+        # Creating a socket object and setting it up to act as a server on the local host ip and the given port. This
+        # is already done here and not within the thread, so that the server is guaranteed to be listening once the
+        # port is sent to the client. Only one connection is accepted, as this whole objects purpose is only to
+        # transfer one single file and for that only one connection/socket is needed
+        self.sock = socket.socket()
+        try:
+            # The ports of the port manager are reused for many downloads, so they have to be bindable again while the
+            # connections of previous downloads are still in the TIME_WAIT state
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.sock.bind((self.ip, self.port))
+            self.sock.listen(1)
+            self.sock.settimeout(self.accept_timeout)
+        except OSError:
+            self.sock.close()
+            self.file.close()
+            raise
 
         self.sending = False
 
     def run(self):
-        # Creating a socket object and setting it up to act as a server on the local host ip and the given port,
-        # accepting only the first incoming connection request as this whole objects purpose is only to transfer one
-        # single file and for that only one connection/socket is needed
-        address_tuple = (self.ip, self.port)
-        sock = socket.socket()
-        sock.bind(address_tuple)
-        sock.listen(5)
-
-        connection, address = sock.accept()
-        self.sending = True
-
+        connection = None
+        sock = self.sock
         try:
-            while self.sending:
-                # first waiting to receive something from the client to know when it is ready and then reading and
-                # sending the next chunk of the file
-                connection.recv(1024)
-                data = self.file.read(1024)
-                if not data:
-                    self.sending = False
-                connection.send(data)
+            try:
+                connection, address = sock.accept()
+            finally:
+                # Once the connection was accepted (or the client did not show up) the port is not needed anymore, as
+                # the accepted connection keeps working without the listening socket
+                self._stop_listening()
+            connection.settimeout(self.send_timeout)
+            self.sending = True
+
+            # Announcing the size of the range and then streaming the whole range at once
+            connection.sendall(FILE_SIZE_HEADER.pack(self.length))
+            if self.length:
+                connection.sendfile(self.file, self.offset, self.length)
         except Exception as e:
             pass
         finally:
-            # closing the file and the socket
+            # closing the file and the sockets
             self.sending = False
-            connection.close()
+            if connection is not None:
+                connection.close()
+            self._stop_listening()
             self.file.close()
 
+    def _stop_listening(self):
+        """
+        Closes the listening socket and releases the port to the port manager. Can be called multiple times
+        Returns:
+        void
+        """
+        if self.sock is None:
+            return
+        self.sock.close()
+        self.sock = None
+        if self.port_manager is not None:
+            self.port_manager.release(self.port)
+
 
 class PortManager(list):
+    """
+    Manages the ports, on which 'SimpleFileSendServer' objects may listen. The list itself contains the ports, that
+    are currently available. Acquiring a port leases it for 'lease_time' seconds. A lease ends, when the port is being
+    released, which the file servers do on their own as soon as they stopped listening. In case a port is not released
+    before its lease expired, because the file server never started or crashed, it is reclaimed and becomes available
+    again. Expired leases are reclaimed whenever a port is being acquired, as well as by calling 'reclaim'.
+    The ports are acquired and released from multiple handler threads, which is why all access is secured by a lock.
 
-    def __init__(self, port_range):
+    Attributes:
+        lease_time: The default amount of seconds a port is leased for
+        leases: The dictionary with the leased integer ports as keys and the monotonic times, at which the leases
+            expire, as values
+        reclaimed_count: The integer amount of leases, that expired and were reclaimed
+        lock: The threading.Lock securing the ports and leases
+
+    Args:
+        port_range: The iterable of the integer ports, that may be used
+        lease_time: The default amount of seconds a port is leased for
+    """
+    # The default amount of seconds, after which an acquired port, that was not released, is reclaimed
+    DEFAULT_LEASE_TIME = 60
+
+    def __init__(self, port_range, lease_time=DEFAULT_LEASE_TIME):
         list.__init__(self, port_range)
+        self.lease_time = lease_time
+        self.leases = {}
+        self.reclaimed_count = 0
+        self.lock = threading.Lock()
 
-    def acquire(self):
-        self.pop(0)
+    def partition(self, count):
+        """
+        Splits the ports of the manager into the given amount of new managers with the same lease time, for example
+        one for each process of a 'PreforkPiverServer'. Leased ports are included, as their leases belong to this
+        manager only
+        Args:
+            count: The integer amount of managers to create
+
+        Returns:
+        The list of the new PortManager objects
+        """
+        with self.lock:
+            ports = sorted(itertools.chain(self, self.leases))
+        return [PortManager(ports[index::count], lease_time=self.lease_time) for index in range(count)]
+
+    def acquire(self, lease_time=None):
+        """
+        Leases an available port
+        Args:
+            lease_time: The amount of seconds the port is leased for. By default the lease time of the manager
+
+        Raises:
+            ServerBusyError: In case all ports are leased
+
+        Returns:
+        The integer port
+        """
+        lease_time = self.lease_time if lease_time is None else lease_time
+        with self.lock:
+            self._reclaim_expired_leases()
+            if not self:
+                raise ServerBusyError("All the ports for file downloads are in use. Try again later!")
+            port = self.pop(0)
+            self.leases[port] = time.monotonic() + lease_time
+            return port
 
     def release(self, port):
-        self.append(port)
+        """
+        Ends the lease of the given port and makes it available again. Releasing a port, that is not leased (anymore),
+        has no effect
+        Args:
+            port: The integer port to release
+
+        Returns:
+        void
+        """
+        with self.lock:
+            if self.leases.pop(port, None) is not None:
+                self.append(port)
+
+    def reclaim(self):
+        """
+        Makes the ports, whose leases have expired, available again
+        Returns:
+        The integer amount of reclaimed ports
+        """
+        with self.lock:
+            return self._reclaim_expired_leases()
+
+    def _reclaim_expired_leases(self):
+        # Has to be called while holding the lock
+        now = time.monotonic()
+        expired_ports = [port for port, expiry_time in self.leases.items() if expiry_time <= now]
+        for port in expired_ports:
+            del self.leases[port]
+            self.append(port)
+        self.reclaimed_count += len(expired_ports)
+        return len(expired_ports)
+
+    def ports_in_use(self):
+        """
+        Returns:
+        The integer amount of ports, that are currently leased
+        """
+        with self.lock:
+            return len(self.leases)
+
+    def ports_available(self):
+        """
+        Returns:
+        The integer amount of ports, that are currently available
+        """
+        with self.lock:
+            return len(self)
+
+    def get_statistics(self):
+        """
+        Returns:
+        A dictionary with the keys 'in_use', 'available' and 'reclaimed', containing the amount of leased ports, the
+        amount of available ports and the amount of leases, that were reclaimed after they expired
+        """
+        with self.lock:
+            return {"in_use": len(self.leases), "available": len(self), "reclaimed": self.reclaimed_count}
@@ -0,0 +1,175 @@
+"""
+Compares the codecs of the piver module by the time it takes to encode and decode typical transfer objects and by
+the amount of bytes, that are sent over the wire for them.
+
+USAGE:
+python piver_benchmark.py [--repeat 2000]
+
+The payloads are modeled after the actual traffic of the PiLearn server: 'LearningProcess' objects being sent with
+'set_learning_process' requests and received as the responses of 'get_learning_process' requests, the list of all
+learning processes of a user, login requests and big binary responses, like chunks of exam files.
+"""
+import argparse
+import datetime
+import pickle
+import random
+import time
+
+import piver
+
+
+class LearningProcessPayload:
+    """
+    Stands in for the 'LearningProcess' objects within the payloads. It carries the same attributes, so that it is
+    pickled to the same structure, but the 'learncoach' module is not imported, as it depends on the exam creation
+    (ImageMagick) and the benchmarks are supposed to run wherever the piver module runs.
+
+    Attributes:
+        subject: The string subject of the learning process
+        subsubject: The string subsubject of the learning process
+        user_reminded: The boolean value of whether the user was reminded of the next exam
+        schedule: The list of the lists [timestamp, max points] of the planned exams
+        progress: The list of the lists [timestamp, points] of the exams done
+        history: The dict with the string timestamps of the exams done as keys and lists [max points, points, length]
+            as values
+        exams_already_done: The integer amount of exams done
+    """
+    # The time intervals in days in between the exams and the max points of the exams of the three learning stages,
+    # like the 'LearningProcess' uses them
+    INTERVAL_DAYS = (3, 12, 30)
+    INTERVAL_MAX_POINTS = (20, 28, 18)
+
+    def __init__(self, subject, subsubject):
+        self.subject = subject
+        self.subsubject = subsubject
+        self.user_reminded = False
+        self.schedule = []
+        self.progress = []
+        self.history = {}
+        self.exams_already_done = 0
+
+    def create_schedule(self, exam_count=20):
+        """
+        Creates a schedule, whose exams are split about evenly among the three learning stages
+        Args:
+            exam_count: The amount of exams within the schedule
+
+        Returns:
+        void
+        """
+        self.schedule = []
+        current_time = datetime.datetime.today()
+        for index in range(exam_count):
+            stage = min(index * 3 // exam_count, 2)
+            current_time += datetime.timedelta(days=self.INTERVAL_DAYS[stage])
+            max_points = random.randint(self.INTERVAL_MAX_POINTS[stage] - 2, self.INTERVAL_MAX_POINTS[stage] + 2)
+            self.schedule.append([current_time.timestamp(), max_points])
+
+
+def create_learning_process(subject, subsubject, exam_count=20):
+    """
+    Creates a learning process with a full schedule and half of the exams done, the way it would be stored on the
+    server. The exam history is filled with generated entries
+    Args:
+        subject: The string subject of the learning process
+        subsubject: The string subsubject of the learning process
+        exam_count: The amount of exams within the schedule
+
+    Returns:
+    The 'LearningProcessPayload' object
+    """
+    learning_process = LearningProcessPayload(subject, subsubject)
+    learning_process.create_schedule(exam_count=exam_count)
+
+    for timestamp, max_points in learning_process.schedule[:exam_count // 2]:
+        learning_process.progress.append([timestamp, max_points - 2])
+        learning_process.history[str(timestamp)] = [max_points, max_points - 2, 45]
+    learning_process.exams_already_done = len(learning_process.progress)
+    return learning_process
+
+
+def create_payloads():
+    """
+    Returns:
+    A list of tuples, whose first element is the string name of the payload and the second the transfer object
+    """
+    authentication_code = "0x21f:0x57e76895"
+    learning_process = create_learning_process("Elektronik", "Halbleiterphysik")
+    learning_processes = [create_learning_process("Subject{}".format(index), "Subsubject{}".format(index))
+                          for index in range(10)]
+
+    get_response = piver.RequestTransfer(authentication_code, "get_learning_process",
+                                         ["Elektronik", "Halbleiterphysik"])
+    get_response.add_response(learning_process)
+
+    set_request = piver.RequestTransfer(authentication_code, "set_learning_process", [learning_process])
+
+    list_response = piver.RequestTransfer(authentication_code, "get_learning_processes", [])
+    list_response.add_response(learning_processes)
+
+    chunk_response = piver.RequestTransfer(authentication_code, "read_file", ["exams/exam.pdf", 0, 1024 ** 2])
+    chunk_response.add_response(bytearray(1024 ** 2))
+
+    # Only buffers wrapped into a 'PickleBuffer' are passed out of band by the pickle protocol 5
+    buffer_chunk_response = piver.RequestTransfer(authentication_code, "read_file", ["exams/exam.pdf", 0, 1024 ** 2])
+    buffer_chunk_response.add_response(pickle.PickleBuffer(bytearray(1024 ** 2)))
+
+    login_request = piver.LoginTransfer("username", "password")
+
+    return [
+        ("login request", login_request),
+        ("get_learning_process response", get_response),
+        ("set_learning_process request", set_request),
+        ("10 learning processes response", list_response),
+        ("1MB chunk response", chunk_response),
+        ("1MB PickleBuffer response", buffer_chunk_response)
+    ]
+
+
+def benchmark_codec(codec, obj, repeat):
+    """
+    Encodes and decodes the given object with the given codec the given amount of times
+    Args:
+        codec: The codec object to benchmark
+        obj: The transfer object to encode and decode
+        repeat: The amount of repetitions
+
+    Returns:
+    A tuple of the average encoding time in microseconds, the average decoding time in microseconds and the amount
+    of bytes of the payload
+    """
+    start_time = time.perf_counter()
+    for index in range(repeat):
+        parts = codec.encode(obj)
+    encode_time = (time.perf_counter() - start_time) / repeat
+
+    # The receiving side gets the payload as a single buffer
+    payload = bytearray().join(parts)
+    start_time = time.perf_counter()
+    for index in range(repeat):
+        codec.decode(payload)
+    decode_time = (time.perf_counter() - start_time) / repeat
+
+    return encode_time * 10 ** 6, decode_time * 10 ** 6, len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the codecs of the piver module")
+    parser.add_argument("--repeat", type=int, default=2000, help="The amount of repetitions per measurement")
+    arguments = parser.parse_args()
+
+    row_format = "{:<32}{:<10}{:>14}{:>14}{:>12}"
+    print(row_format.format("payload", "codec", "encode [us]", "decode [us]", "bytes"))
+    for payload_name, obj in create_payloads():
+        for codec in piver.CODECS.values():
+            try:
+                encode_time, decode_time, size = benchmark_codec(codec, obj, arguments.repeat)
+            except pickle.PicklingError:
+                print(row_format.format(payload_name, codec.name, "-", "-", "unsupported"))
+                continue
+            print(row_format.format(payload_name, codec.name, "{:.1f}".format(encode_time),
+                                    "{:.1f}".format(decode_time), size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""
+Measures the capacity of the piver server by starting a local server with the 'PiLearnRequestHandler' and a user dict
+of generated users and driving a mix of requests from many simulated clients against it. At the end the throughput
+and the latency percentiles per request type are printed as JSON, so that different server modes can be compared and
+regressions can be caught.
+
+USAGE:
+python piver_loadtest.py [--server threaded] [--clients 16] [--duration 10]
+                         [--mix login=1,get_learning_process=70,set_learning_process=20,download_file=9]
+
+The simulated clients are threads within the same process as the server (except for the 'prefork' mode, whose workers
+are processes of their own), so that the measured capacity is a lower bound: the clients compete with the server for
+the interpreter. The traffic is modeled after the PiLearn clients: every user has a couple of learning processes,
+which are being fetched and stored again, once in a while the user logs in again and downloads an exam file.
+"""
+from server import PiLearnRequestHandler
+from server import PiLearnUserProfile
+from server import PiLearnUserDict
+
+from piver_benchmark import create_learning_process
+
+import concurrent.futures
+import argparse
+import tempfile
+import shutil
+import random
+import json
+import time
+import os
+
+import piver
+
+
+# The request types, that can be part of the traffic mix, and their default weights
+DEFAULT_MIX = "login=1,get_learning_process=70,set_learning_process=20,download_file=9"
+REQUEST_TYPES = ("login", "get_learning_process", "set_learning_process", "download_file")
+SERVER_MODES = ("threaded", "pooled", "async", "prefork")
+
+PASSWORD = "password"
+DOWNLOAD_PATH = "loadtest/exam.pdf"
+# The secret key of the signed tokens, which the prefork mode needs, as its workers do not share a guard
+SECRET_KEY = b"piver-loadtest"
+
+
+def parse_mix(mix_string):
+    """
+    Args:
+        mix_string: The string of comma separated 'type=weight' pairs
+
+    Raises:
+        ValueError: In case the string contains an unknown request type or no positive weight
+
+    Returns:
+    A dict with the request types as keys and their float weights as values
+    """
+    mix = {}
+    for item in mix_string.split(","):
+        request_type, separator, weight = item.partition("=")
+        request_type = request_type.strip()
+        if request_type not in REQUEST_TYPES:
+            raise ValueError("Unknown request type '{}', choose from {}".format(request_type, REQUEST_TYPES))
+        mix[request_type] = float(weight) if separator else 1.0
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The mix has to contain at least one request type with a positive weight")
+    return mix
+
+
+def get_subjects(process_count):
+    """
+    Returns:
+    The list of the tuples (subject, subsubject) of the learning processes every user has
+    """
+    return [("Subject{}".format(index), "Subsubject{}".format(index)) for index in range(process_count)]
+
+
+def create_user_dict(user_count, process_count):
+    """
+    Creates a 'PiLearnUserDict' of generated users, that is not backed by the filesystem
+    Args:
+        user_count: The amount of users
+        process_count: The amount of learning processes of every user
+
+    Returns:
+    The 'PiLearnUserDict' object
+    """
+    user_dict = PiLearnUserDict()
+    subjects = get_subjects(process_count)
+    for index in range(user_count):
+        username = "user{}".format(index)
+        learning_processes = [create_learning_process(subject, subsubject) for subject, subsubject in subjects]
+        user_dict[username] = PiLearnUserProfile(username, PASSWORD, learning_processes)
+    return user_dict
+
+
+def create_server(mode, user_dict, port_range, workers):
+    """
+    Creates the server of the given mode on a free port of localhost
+    Args:
+        mode: The string server mode, one of SERVER_MODES
+        user_dict: The user dict of the server
+        port_range: The range of the ports for the file servers of 'download_file'
+        workers: The amount of worker threads (pooled, async) or processes (prefork)
+
+    Returns:
+    The server object
+    """
+    port_manager = piver.PortManager(port_range)
+    address = ("localhost", 0)
+    if mode == "threaded":
+        return piver.PiverServer(address, PiLearnRequestHandler, piver.AuthenticationGuard(), user_dict, port_manager)
+    if mode == "pooled":
+        return piver.PooledPiverServer(address, PiLearnRequestHandler, piver.AuthenticationGuard(), user_dict,
+                                       port_manager, max_workers=workers)
+    if mode == "async":
+        return piver.AsyncPiverServer(address, PiLearnRequestHandler, piver.AuthenticationGuard(), user_dict,
+                                      port_manager, max_workers=workers)
+    return piver.PreforkPiverServer(address, PiLearnRequestHandler, piver.SignedAuthenticationGuard(SECRET_KEY),
+                                    user_dict, port_manager, worker_count=workers)
+
+
+def wait_until_started(server):
+    """
+    Waits for the servers, that start up asynchronously, to be ready
+    Returns:
+    void
+    """
+    started = getattr(server, "started", None)
+    if started is not None:
+        started.wait()
+
+
+class SimulatedClient:
+    """
+    A client of a single user, that sends randomly chosen requests of the traffic mix until the deadline and records
+    the latency of every request.
+
+    Attributes:
+        client: The 'PiverClient' object
+        username: The string username of the user
+        subjects: The list of the tuples (subject, subsubject) of the learning processes of the user
+        save_path: The string path, to which the downloads of the client are saved
+        random: The 'random.Random' object choosing the requests
+        latencies: The dict with the request types as keys and the lists of the float latencies in seconds as values
+        errors: The dict with the request types as keys and dicts of the error class names and their counts as values
+    """
+    def __init__(self, server_address, username, subjects, save_path, seed, persistent=True):
+        self.client = piver.PiverClient(server_address[0], server_address[1], persistent=persistent)
+        self.username = username
+        self.subjects = subjects
+        self.save_path = save_path
+        self.random = random.Random(seed)
+        self.learning_processes = {}
+        self.latencies = {request_type: [] for request_type in REQUEST_TYPES}
+        self.errors = {request_type: {} for request_type in REQUEST_TYPES}
+
+    def run(self, mix, deadline):
+        """
+        Logs in and sends requests until the deadline
+        Args:
+            mix: The dict of the request types and their weights
+            deadline: The time.perf_counter time, at which to stop
+
+        Returns:
+        The client itself, holding the results
+        """
+        request_types = list(mix.keys())
+        weights = list(mix.values())
+        try:
+            # A client, whose first login fails (for example as the server is busy), keeps trying until the deadline
+            while time.perf_counter() < deadline:
+                start_time = time.perf_counter()
+                try:
+                    self.send_login()
+                except Exception as error:
+                    self.record_error("login", error)
+                    continue
+                self.latencies["login"].append(time.perf_counter() - start_time)
+                break
+
+            while time.perf_counter() < deadline:
+                request_type = self.random.choices(request_types, weights)[0]
+                start_time = time.perf_counter()
+                try:
+                    getattr(self, "send_{}".format(request_type))()
+                except Exception as error:
+                    self.record_error(request_type, error)
+                    continue
+                self.latencies[request_type].append(time.perf_counter() - start_time)
+        finally:
+            self.client.close()
+        return self
+
+    def record_error(self, request_type, error):
+        """
+        Counts the error, with which a request of the given type failed
+        Returns:
+        void
+        """
+        error_counts = self.errors[request_type]
+        error_name = type(error).__name__
+        error_counts[error_name] = error_counts.get(error_name, 0) + 1
+
+    def send_login(self):
+        self.client.login(self.username, PASSWORD)
+
+    def send_get_learning_process(self):
+        subject, subsubject = self.random.choice(self.subjects)
+        learning_process = self.client.request("get_learning_process", [subject, subsubject])
+        self.learning_processes[(subject, subsubject)] = learning_process
+
+    def send_set_learning_process(self):
+        # Storing a learning process, that was fetched before, like the PiLearn client does after an exam
+        subject, subsubject = self.random.choice(self.subjects)
+        learning_process = self.learning_processes.get((subject, subsubject))
+        if learning_process is None:
+            learning_process = create_learning_process(subject, subsubject)
+            self.learning_processes[(subject, subsubject)] = learning_process
+        self.client.request("set_learning_process", [learning_process])
+
+    def send_download_file(self):
+        self.client.download_file(DOWNLOAD_PATH, self.save_path, blocking=True, resume=False)
+
+
+def get_percentile(sorted_latencies, percentile):
+    """
+    Args:
+        sorted_latencies: The sorted list of latencies
+        percentile: The percentile from 0 to 100
+
+    Returns:
+    The latency, below which the given percentile of the latencies lies
+    """
+    index = min(len(sorted_latencies) - 1, int(len(sorted_latencies) * percentile / 100))
+    return sorted_latencies[index]
+
+
+def summarize(clients, duration):
+    """
+    Merges the results of all clients
+    Args:
+        clients: The list of the 'SimulatedClient' objects after they ran
+        duration: The float amount of seconds the load was generated
+
+    Returns:
+    A dict with the keys 'requests', 'errors', 'throughput' (requests per second) and 'requests_by_type', the latter
+    being a dict with the request types as keys and dicts with the keys 'count', 'errors', 'throughput', 'mean',
+    'p50', 'p95', 'p99' and 'max' (latencies in seconds) as values
+    """
+    requests_by_type = {}
+    total_count = 0
+    total_errors = 0
+    for request_type in REQUEST_TYPES:
+        latencies = sorted(latency for client in clients for latency in client.latencies[request_type])
+        errors = {}
+        for client in clients:
+            for error_name, count in client.errors[request_type].items():
+                errors[error_name] = errors.get(error_name, 0) + count
+        if not latencies and not errors:
+            continue
+
+        error_count = sum(errors.values())
+        total_count += len(latencies)
+        total_errors += error_count
+        summary = {
+            "count": len(latencies),
+            "errors": error_count,
+            "error_types": errors,
+            "throughput": len(latencies) / duration
+        }
+        if latencies:
+            summary.update({
+                "mean": sum(latencies) / len(latencies),
+                "p50": get_percentile(latencies, 50),
+                "p95": get_percentile(latencies, 95),
+                "p99": get_percentile(latencies, 99),
+                "max": latencies[-1]
+            })
+        requests_by_type[request_type] = summary
+
+    return {
+        "requests": total_count,
+        "errors": total_errors,
+        "throughput": total_count / duration,
+        "requests_by_type": requests_by_type
+    }
+
+
+def get_server_stats(server_address):
+    """
+    Requests the statistics of the server with a client of the first user. In the prefork mode they only cover the
+    worker, that accepted the connection
+    Args:
+        server_address: The tuple (host, port) of the server
+
+    Returns:
+    The dict of the statistics, as returned by the 'get_server_stats' request
+    """
+    client = piver.PiverClient(server_address[0], server_address[1])
+    try:
+        client.login("user0", PASSWORD)
+        return client.request("get_server_stats", [])
+    finally:
+        client.close()
+
+
+def run_load_test(arguments):
+    """
+    Starts the server, runs the simulated clients against it and stops the server again
+    Args:
+        arguments: The parsed command line arguments
+
+    Returns:
+    The dict of the results
+    """
+    mix = parse_mix(arguments.mix)
+    project_path = tempfile.mkdtemp(prefix="piver_loadtest_")
+    # The downloads are served from the temporary folder, instead of the folder of the config file
+    piver.PROJECT_PATH = project_path
+    os.makedirs(os.path.join(project_path, os.path.dirname(DOWNLOAD_PATH)))
+    with open(os.path.join(project_path, DOWNLOAD_PATH), "wb") as file:
+        file.write(os.urandom(arguments.file_size))
+
+    user_dict = create_user_dict(arguments.users, arguments.processes)
+    port_range = range(arguments.port_start, arguments.port_start + arguments.ports)
+    server = create_server(arguments.server, user_dict, port_range, arguments.workers)
+    server_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    server_executor.submit(server.serve_forever)
+    wait_until_started(server)
+
+    subjects = get_subjects(arguments.processes)
+    clients = []
+    for index in range(arguments.clients):
+        username = "user{}".format(index % arguments.users)
+        save_path = os.path.join(project_path, "download{}.bin".format(index))
+        clients.append(SimulatedClient(server.server_address, username, subjects, save_path,
+                                       seed=arguments.seed + index, persistent=not arguments.non_persistent))
+
+    try:
+        start_time = time.perf_counter()
+        deadline = start_time + arguments.duration
+        with concurrent.futures.ThreadPoolExecutor(max_workers=arguments.clients) as executor:
+            futures = [executor.submit(client.run, mix, deadline) for client in clients]
+            for future in futures:
+                future.result()
+        duration = time.perf_counter() - start_time
+
+        results = {
+            "config": {
+                "server": arguments.server,
+                "workers": arguments.workers,
+                "clients": arguments.clients,
+                "users": arguments.users,
+                "persistent": not arguments.non_persistent,
+                "duration": arguments.duration,
+                "file_size": arguments.file_size,
+                "mix": mix
+            },
+            "duration": duration
+        }
+        results.update(summarize(clients, duration))
+        results["server_stats"] = get_server_stats(server.server_address)
+        return results
+    finally:
+        server.shutdown()
+        server.server_close()
+        server_executor.shutdown(wait=True)
+        shutil.rmtree(project_path, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates load against a local piver server")
+    parser.add_argument("--server", choices=SERVER_MODES, default="threaded", help="The server mode to measure")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="The amount of worker threads (pooled, async) or processes (prefork)")
+    parser.add_argument("--clients", type=int, default=16, help="The amount of simulated clients")
+    parser.add_argument("--users", type=int, default=8, help="The amount of users the clients log in as")
+    parser.add_argument("--processes", type=int, default=5, help="The amount of learning processes per user")
+    parser.add_argument("--duration", type=float, default=10, help="The amount of seconds to generate load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="The weights of the request types as 'type=weight,...'")
+    parser.add_argument("--file-size", type=int, default=1024 ** 2, help="The size of the downloaded file in bytes")
+    parser.add_argument("--non-persistent", action="store_true",
+                        help="Open a new connection for every request instead of keeping one per client")
+    parser.add_argument("--port-start", type=int, default=20000, help="The first port for the file servers")
+    parser.add_argument("--ports", type=int, default=200, help="The amount of ports for the file servers")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random choice of the requests")
+    parser.add_argument("--output", help="The path of the file to write the JSON results to instead of stdout")
+    arguments = parser.parse_args()
+
+    results = run_load_test(arguments)
+    output = json.dumps(results, indent=4)
+    if arguments.output is None:
+        print(output)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from piver import get_project_path
 
 from piver import PiverRequestHandler
+from piver import remote
 from piver import BaseUserProfile
 from piver import UserDict
 
@@ -244,7 +245,15 @@ class PiLearnUserProfile(BaseUserProfile):
 
 
 class PiLearnUserDict(UserDict):
+    """
+    The dictionary of all the user profiles of the PiLearn server, loaded from the filesystem.
 
+    Notes:
+        When served by a 'PreforkPiverServer' every worker process owns a copy of the dictionary, as it was at the time
+        the workers were forked. The copies are not synchronized: a learning process set through one worker is not
+        visible to the others, until it was saved with 'save_profile' and the others reloaded the profiles, for example
+        through the 'worker_initializer' of the server
+    """
     def __init__(self):
         UserDict.__init__(self)
 
@@ -289,6 +298,7 @@ class PiLearnRequestHandler(PiverRequestHandler):
     def __init__(self, request, client_address, server):
         PiverRequestHandler.__init__(self, request, client_address, server)
 
+    @remote(mutating=True)
     def set_learning_process(self, received_object, learning_process):
         """
         If there already exists a learning process with the same subject and subsubject as the given 'learning_process',
@@ -307,6 +317,7 @@ class PiLearnRequestHandler(PiverRequestHandler):
         user_profile.set_learning_process(learning_process)
         return True
 
+    @remote(idempotent=True, cacheable=True)
     def get_learning_process(self, received_object, subject, subsubject):
         """
         Gets the learning process object for the given subject and subsubject from the requesting users
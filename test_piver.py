@@ -0,0 +1,1331 @@
+"""
+Tests of the piver module. Every test case starts its servers on free ports of localhost and stops them again.
+
+USAGE (from within the project folder, as the piver module reads the 'config.ini' on import):
+python -m pytest test_piver.py
+python -m unittest test_piver
+"""
+import concurrent.futures
+import threading
+import tempfile
+import unittest
+import asyncio
+import shutil
+import pickle
+import socket
+import json
+import time
+import os
+
+import piver
+
+
+PASSWORD = "password"
+
+
+class EchoRequestHandler(piver.PiverRequestHandler):
+
+    @piver.remote(idempotent=True)
+    def echo(self, received_object, value):
+        return value
+
+
+def create_user_dict():
+    """
+    Returns:
+    A 'UserDict' with the users 'alice' and 'bob'
+    """
+    user_dict = piver.UserDict()
+    for username in ("alice", "bob"):
+        user_dict[username] = piver.BaseUserProfile(username, PASSWORD)
+    return user_dict
+
+
+def start_server(server_class=piver.PiverServer, authentication_guard=None, handler_class=EchoRequestHandler,
+                 port_manager=None, **options):
+    """
+    Creates a server of the given class on a free port of localhost and serves it within a daemon thread
+    Args:
+        server_class: The class of the server
+        authentication_guard: The guard of the server, a new 'AuthenticationGuard' by default
+        handler_class: The request handler class of the server
+        port_manager: The 'PortManager' of the server or None
+        options: The additional keyword arguments of the server
+
+    Returns:
+    The server object, that is ready to accept connections
+    """
+    if authentication_guard is None:
+        authentication_guard = piver.AuthenticationGuard()
+    server = server_class(("localhost", 0), handler_class, authentication_guard, create_user_dict(), port_manager,
+                          **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    started = getattr(server, "started", None)
+    if started is not None:
+        started.wait()
+    return server
+
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+
+
+class FrameTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sender, self.receiver = socket.socketpair()
+
+    def tearDown(self):
+        self.sender.close()
+        self.receiver.close()
+
+    def test_frame_round_trip(self):
+        for payload in (b"", b"piver", os.urandom(3 * piver.FRAME_CHUNK_SIZE)):
+            thread = threading.Thread(target=piver.send_frame, args=(self.sender, payload, 0x05))
+            thread.start()
+            flags, received_payload = piver.receive_frame(self.receiver)
+            thread.join()
+            self.assertEqual(flags, 0x05)
+            self.assertEqual(bytes(received_payload), payload)
+
+    def test_frame_of_multiple_parts(self):
+        piver.send_frame(self.sender, [b"pi", bytearray(b"ver"), memoryview(b"!")])
+        flags, payload = piver.receive_frame(self.receiver)
+        self.assertEqual(bytes(payload), b"piver!")
+
+    def test_oversized_frame_is_rejected(self):
+        self.sender.sendall(piver.FRAME_HEADER.pack(0, 1024))
+        with self.assertRaises(ValueError):
+            piver.receive_frame(self.receiver, max_size=1023)
+
+    def test_closed_connection_within_frame(self):
+        self.sender.sendall(piver.FRAME_HEADER.pack(0, 1024) + b"incomplete")
+        self.sender.close()
+        with self.assertRaises(ConnectionAbortedError):
+            piver.receive_frame(self.receiver)
+
+    def test_object_round_trip(self):
+        piver.send_object(self.sender, piver.LoginTransfer("alice", PASSWORD))
+        received_object = piver.receive_object(self.receiver)
+        self.assertEqual(received_object.get_username(), "alice")
+
+
+class RequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server()
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_login_and_request(self):
+        client = piver.PiverClient(*self.server.server_address)
+        client.login("alice", PASSWORD)
+        self.assertEqual(client.request("echo", ["piver"]), "piver")
+        with self.assertRaises(PermissionError):
+            piver.PiverClient(*self.server.server_address).login("alice", "wrong")
+
+    def test_oversized_request_frame(self):
+        with socket.create_connection(self.server.server_address) as sock:
+            sock.sendall(piver.FRAME_HEADER.pack(0, piver.MAX_REQUEST_FRAME_SIZE + 1))
+            self.assertIsInstance(piver.receive_object(sock), ValueError)
+
+
+class DroppingRequestHandler(EchoRequestHandler):
+    # The amount of calls of 'drop_once'. The first call closes the connection after the request was processed
+    drop_calls = 0
+
+    @piver.remote
+    def drop_once(self, received_object):
+        DroppingRequestHandler.drop_calls += 1
+        if DroppingRequestHandler.drop_calls == 1:
+            self.request.shutdown(socket.SHUT_RDWR)
+        return DroppingRequestHandler.drop_calls
+
+
+class PersistentConnectionTest(unittest.TestCase):
+
+    def setUp(self):
+        DroppingRequestHandler.drop_calls = 0
+        self.server = start_server(handler_class=DroppingRequestHandler, idle_timeout=0.3)
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_connection_is_reused(self):
+        client = piver.PiverClient(*self.server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            sock = client.connection.sock
+            for index in range(5):
+                self.assertEqual(client.request("echo", [index]), index)
+            self.assertIs(client.connection.sock, sock)
+        finally:
+            client.close()
+
+    def test_reconnect_after_idle_timeout(self):
+        client = piver.PiverClient(*self.server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            time.sleep(0.6)
+            self.assertEqual(client.request("echo", [1]), 1)
+        finally:
+            client.close()
+
+    def test_unsafe_request_is_not_resent(self):
+        client = piver.PiverClient(*self.server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            with self.assertRaises((ConnectionError, EOFError)):
+                client.request("drop_once", [])
+            self.assertEqual(DroppingRequestHandler.drop_calls, 1)
+        finally:
+            client.close()
+
+    def test_idempotent_request_is_resent(self):
+        client = piver.PiverClient(*self.server.server_address, persistent=True, idempotent_methods=["drop_once"])
+        try:
+            client.login("alice", PASSWORD)
+            self.assertEqual(client.request("drop_once", []), 2)
+        finally:
+            client.close()
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server()
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_concurrent_requests_share_the_pool(self):
+        client = piver.PooledPiverClient(*self.server.server_address, max_size=2)
+        try:
+            client.login("alice", PASSWORD)
+            with concurrent.futures.ThreadPoolExecutor(4) as executor:
+                responses = list(executor.map(lambda value: client.request("echo", [value]), range(20)))
+            self.assertEqual(responses, list(range(20)))
+            self.assertLessEqual(client.pool.size, 2)
+        finally:
+            client.close()
+
+    def test_checkout_timeout(self):
+        pool = piver.PiverConnectionPool(*self.server.server_address, max_size=1, checkout_timeout=0.1)
+        try:
+            connection = pool.acquire()
+            with self.assertRaises(TimeoutError):
+                pool.acquire()
+            # The returned connection can be checked out again
+            pool.release(connection)
+            pool.release(pool.acquire())
+        finally:
+            pool.close()
+
+
+class BatchRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server()
+        self.client = piver.PiverClient(*self.server.server_address)
+        self.client.login("alice", PASSWORD)
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_batch_round_trip(self):
+        for parallel in (False, True):
+            responses = self.client.request_batch([("echo", [index]) for index in range(5)], parallel=parallel)
+            self.assertEqual(responses, list(range(5)))
+
+    def test_failing_request_within_batch(self):
+        responses = self.client.request_batch([("echo", [1]), ("missing", []), ("echo", [3])])
+        self.assertEqual(responses[0], 1)
+        self.assertIsInstance(responses[1], Exception)
+        self.assertEqual(responses[2], 3)
+
+
+class SlowRequestHandler(EchoRequestHandler):
+
+    @piver.remote(idempotent=True)
+    def sleep(self, received_object, duration):
+        time.sleep(duration)
+        return duration
+
+
+class PipelinedRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server(handler_class=SlowRequestHandler)
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_responses_arrive_out_of_order(self):
+        client = piver.PipelinedPiverClient(*self.server.server_address)
+        try:
+            client.login("alice", PASSWORD)
+            slow_future = client.submit("sleep", [0.5])
+            fast_futures = [client.submit("echo", [index]) for index in range(5)]
+            self.assertEqual([future.result(0.4) for future in fast_futures], list(range(5)))
+            self.assertFalse(slow_future.done())
+            self.assertEqual(slow_future.result(2), 0.5)
+        finally:
+            client.close()
+
+    def test_send_failure_releases_the_slot(self):
+        client = piver.PipelinedPiverClient(*self.server.server_address, max_in_flight=2)
+        try:
+            client.login("alice", PASSWORD)
+            # The parameters can not be pickled, every failed request has to give back its slot
+            for index in range(4):
+                future = client.submit("echo", [threading.Lock()])
+                with self.assertRaises((TypeError, pickle.PicklingError)):
+                    future.result(1)
+            self.assertFalse(client.pending_requests)
+            self.assertEqual(client.request("echo", [5]), 5)
+        finally:
+            client.close()
+
+    def test_timeout_releases_the_slot(self):
+        client = piver.PipelinedPiverClient(*self.server.server_address, max_in_flight=1, timeout=0.1)
+        try:
+            client.login("alice", PASSWORD)
+            with self.assertRaises(TimeoutError):
+                client.request("sleep", [0.3])
+            self.assertFalse(client.pending_requests)
+            client.timeout = 2
+            self.assertEqual(client.request("echo", [6]), 6)
+        finally:
+            client.close()
+
+
+class AsyncServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server(piver.AsyncPiverServer, handler_class=SlowRequestHandler, max_workers=4)
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_login_and_request(self):
+        for persistent in (False, True):
+            client = piver.PiverClient(*self.server.server_address, persistent=persistent)
+            try:
+                client.login("alice", PASSWORD)
+                self.assertEqual(client.request("echo", ["piver"]), "piver")
+                self.assertEqual(client.request_batch([("echo", [1]), ("echo", [2])], parallel=True), [1, 2])
+                with self.assertRaises(AttributeError):
+                    client.request("missing", [])
+                self.assertEqual(client.request("echo", [3]), 3)
+            finally:
+                client.close()
+
+    def test_pipelined_requests(self):
+        client = piver.PipelinedPiverClient(*self.server.server_address)
+        try:
+            client.login("alice", PASSWORD)
+            slow_future = client.submit("sleep", [0.5])
+            self.assertEqual(client.request("echo", [1]), 1)
+            self.assertFalse(slow_future.done())
+            self.assertEqual(slow_future.result(2), 0.5)
+        finally:
+            client.close()
+
+    def test_wrong_password(self):
+        with self.assertRaises(PermissionError):
+            piver.PiverClient(*self.server.server_address).login("alice", "wrong")
+
+
+class PooledServerTest(unittest.TestCase):
+
+    def test_login_and_request(self):
+        server = start_server(piver.PooledPiverServer, max_workers=2)
+        client = piver.PiverClient(*server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            self.assertEqual(client.request("echo", ["piver"]), "piver")
+            self.assertEqual(client.request_batch([("echo", [1]), ("echo", [2])]), [1, 2])
+        finally:
+            client.close()
+            stop_server(server)
+
+    def test_busy_server_refuses_negotiation(self):
+        server = start_server(piver.PooledPiverServer, max_workers=1, queue_size=1)
+        client = piver.PiverClient(*server.server_address, persistent=True)
+        idle_socket = None
+        try:
+            # One connection occupies the worker, the other one the only place within the queue
+            client.login("alice", PASSWORD)
+            idle_socket = socket.create_connection(server.server_address)
+            time.sleep(0.2)
+            connection = piver.PiverConnection(*server.server_address, codec_names=["pickle"])
+            with self.assertRaises(piver.ServerBusyError):
+                connection.connect()
+        finally:
+            client.close()
+            if idle_socket is not None:
+                idle_socket.close()
+            stop_server(server)
+
+    def test_busy_negotiation_response(self):
+        self.assertIs(piver.get_negotiated_codec(TypeError("no negotiation")), piver.PICKLE_CODEC)
+        with self.assertRaises(piver.ServerBusyError):
+            piver.get_negotiated_codec(piver.ServerBusyError("busy"))
+
+
+class AsyncClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server(handler_class=SlowRequestHandler)
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_concurrent_requests(self):
+        async def run():
+            client = piver.AsyncPiverClient(*self.server.server_address)
+            try:
+                await client.login("alice", PASSWORD)
+                # The slow request must not hold back the others, as all of them are pipelined
+                slow_request = asyncio.ensure_future(client.request("sleep", [0.3]))
+                responses = await asyncio.gather(*(client.request("echo", [index]) for index in range(10)))
+                self.assertFalse(slow_request.done())
+                return responses, await slow_request
+            finally:
+                await client.close()
+        self.assertEqual(asyncio.run(run()), (list(range(10)), 0.3))
+
+    def test_failures(self):
+        async def run():
+            client = piver.AsyncPiverClient(*self.server.server_address)
+            try:
+                with self.assertRaises(PermissionError):
+                    await client.login("alice", "wrong")
+                await client.login("alice", PASSWORD)
+                with self.assertRaises(AttributeError):
+                    await client.request("missing", [])
+                return await client.request("echo", [1])
+            finally:
+                await client.close()
+        self.assertEqual(asyncio.run(run()), 1)
+
+
+# Truncated and otherwise malformed payloads of the codecs with their own payload layout, which have to be rejected
+# with a ValueError instead of the errors of the struct module or of indexing
+MALFORMED_PAYLOADS = [
+    ("pickle5", b"\x00"),
+    ("pickle5", b"\x00\x00\x00\x00" + bytes(7)),
+    ("pickle5", b"\x00\x00\x00\x00" + bytes(7) + b"\x09pickle"),
+    ("schema", b""),
+    ("schema", b"\x02\x09"),
+    ("schema", b"\x01\xff\xff"),
+    ("schema", b"\x02\x05\x00\x00\x00\x09piver")
+]
+
+
+class CodecTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = start_server()
+        cls.async_server = start_server(piver.AsyncPiverServer)
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_server(cls.server)
+        stop_server(cls.async_server)
+
+    def round_trip(self, obj, codec):
+        flags, parts = piver.encode_object(obj, codec)
+        return piver.decode_object(flags, bytearray().join(parts))
+
+    def test_request_round_trip(self):
+        parameters = [None, True, False, 0, -2 ** 70, 1.5, "über", b"\x00\xff", [1, (2, "3")], {"key": 4}]
+        for codec in piver.CODECS.values():
+            request_transfer = piver.RequestTransfer("0x1:0x2", "echo", parameters, request_id=7)
+            request_transfer.add_response(bytearray(b"response"))
+            decoded_request = self.round_trip(request_transfer, codec)
+            self.assertEqual(decoded_request.get_authentication(), "0x1:0x2")
+            self.assertEqual(decoded_request.get_method_name(), "echo")
+            self.assertEqual(decoded_request.get_request_id(), 7)
+            self.assertEqual(list(decoded_request.get_parameter_list()), parameters)
+            self.assertEqual(bytes(decoded_request.get_response()), b"response")
+
+    def test_login_round_trip(self):
+        for codec in piver.CODECS.values():
+            decoded_login = self.round_trip(piver.LoginTransfer("bob", PASSWORD), codec)
+            self.assertEqual(decoded_login.get_username(), "bob")
+            self.assertEqual(decoded_login.get_password(), PASSWORD)
+
+    def test_exception_round_trip(self):
+        for codec in piver.CODECS.values():
+            decoded_error = self.round_trip(piver.ServerBusyError("busy"), codec)
+            self.assertIsInstance(decoded_error, piver.ServerBusyError)
+
+    def test_out_of_band_buffers(self):
+        request_transfer = piver.RequestTransfer("0x1:0x2", "echo", [pickle.PickleBuffer(bytearray(1024))])
+        flags, parts = piver.encode_object(request_transfer, piver.CODECS["pickle5"])
+        self.assertGreater(len(parts), 2)
+        decoded_request = piver.decode_object(flags, bytearray().join(parts))
+        self.assertEqual(bytes(decoded_request.get_parameter_list()[0]), bytes(1024))
+
+    def test_malformed_payloads(self):
+        for codec_name, payload in MALFORMED_PAYLOADS:
+            with self.assertRaises(ValueError):
+                piver.decode_object(piver.CODECS[codec_name].codec_id, payload)
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            piver.decode_object(piver.FRAME_CODEC_MASK, b"")
+
+    def test_negotiated_codec(self):
+        for codec_name in piver.CODECS:
+            client = piver.PiverClient(*self.server.server_address, persistent=True, codec_names=[codec_name])
+            try:
+                client.login("alice", PASSWORD)
+                self.assertEqual(client.request("echo", [b"piver"]), b"piver")
+                self.assertIs(client.connection.codec, piver.CODECS[codec_name])
+            finally:
+                client.close()
+
+    def test_malformed_frames_get_an_error_reply(self):
+        for server in (self.server, self.async_server):
+            with socket.create_connection(server.server_address) as sock:
+                for codec_name, payload in MALFORMED_PAYLOADS:
+                    piver.send_frame(sock, payload, flags=piver.CODECS[codec_name].codec_id)
+                    self.assertIsInstance(piver.receive_object(sock), ValueError)
+                # The connection can still be used afterwards
+                piver.send_object(sock, piver.LoginTransfer("alice", PASSWORD))
+                self.assertIsInstance(piver.receive_object(sock), piver.LoginTransfer)
+
+
+class CompressionTest(unittest.TestCase):
+
+    def test_compression_round_trip(self):
+        request_transfer = piver.RequestTransfer("0x1:0x2", "echo", [b"piver" * 10000])
+        for compression in piver.COMPRESSIONS.values():
+            for codec in piver.CODECS.values():
+                flags, parts = piver.encode_object(request_transfer, codec)
+                flags, parts = piver.compress_payload(flags, parts, compression)
+                self.assertLess(piver.get_payload_length(parts), 10000)
+                decoded_request = piver.decode_object(flags, bytearray().join(parts))
+                self.assertEqual(bytes(decoded_request.get_parameter_list()[0]), b"piver" * 10000)
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            piver.decode_object(piver.FRAME_COMPRESSION_MASK, b"")
+
+    def test_compressed_responses(self):
+        server = start_server(compression_threshold=1024)
+        client = piver.PiverClient(*server.server_address, persistent=True, compression_names=["zlib"])
+        try:
+            client.login("alice", PASSWORD)
+            self.assertEqual(client.request("echo", [b"piver" * 10000]), b"piver" * 10000)
+            self.assertEqual(client.request("echo", [b"small"]), b"small")
+            # Requests of unknown methods must not add entries to the statistics
+            for index in range(3):
+                with self.assertRaises(AttributeError):
+                    client.request("missing{}".format(index), [b"piver" * 10000])
+            self.assertEqual(set(server.compression_statistics.get_statistics()), {"echo"})
+        finally:
+            client.close()
+            stop_server(server)
+
+
+class FileTestCase(unittest.TestCase):
+    """
+    Serves a temporary folder as the main folder of the server, which contains the file 'files/data.bin', and logs in
+    a client. The downloads are saved to another temporary folder
+    """
+    FILE_SIZE = 300000
+
+    def setUp(self):
+        self.project_path = tempfile.mkdtemp()
+        self.save_folder = tempfile.mkdtemp()
+        self.original_project_path = piver.PROJECT_PATH
+        piver.PROJECT_PATH = self.project_path
+        self.content = os.urandom(self.FILE_SIZE)
+        self.write_server_file("files/data.bin", self.content)
+
+        self.port_manager = piver.PortManager(range(21500, 21600))
+        self.server = start_server(port_manager=self.port_manager)
+        self.client = piver.PiverClient(*self.server.server_address)
+        self.client.login("alice", PASSWORD)
+
+    def tearDown(self):
+        self.client.close()
+        stop_server(self.server)
+        piver.PROJECT_PATH = self.original_project_path
+        shutil.rmtree(self.project_path, ignore_errors=True)
+        shutil.rmtree(self.save_folder, ignore_errors=True)
+
+    def write_server_file(self, relative_server_path, content):
+        file_path = os.path.join(self.project_path, relative_server_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file:
+            file.write(content)
+
+    def get_save_path(self, name="data.bin"):
+        return os.path.join(self.save_folder, name)
+
+    def read_file(self, file_path):
+        with open(file_path, "rb") as file:
+            return file.read()
+
+
+class FileTransferTest(FileTestCase):
+
+    def test_blocking_download(self):
+        save_path = self.client.download_file("files/data.bin", self.get_save_path(), blocking=True)
+        self.assertEqual(self.read_file(save_path), self.content)
+
+    def test_download_in_the_background(self):
+        save_path = self.client.download_file("files/data.bin", self.get_save_path())
+        self.client.downloader.wait(10)
+        self.assertEqual(self.read_file(save_path), self.content)
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            self.client.download_file("files/missing.bin", self.get_save_path(), blocking=True)
+        self.assertFalse(os.path.exists(self.get_save_path()))
+
+
+class RangeDownloadTest(FileTestCase):
+
+    def test_range_download(self):
+        save_path = self.client.download_file("files/data.bin", self.get_save_path(), blocking=True, offset=1000,
+                                              length=500)
+        self.assertEqual(self.read_file(save_path)[1000:], self.content[1000:1500])
+
+    def test_range_of_only_a_length(self):
+        save_path = self.client.download_file("files/data.bin", self.get_save_path(), blocking=True, length=100)
+        self.assertEqual(self.read_file(save_path), self.content[:100])
+
+        save_path = self.client.download_file("files/data.bin", self.get_save_path("background.bin"), length=100)
+        self.client.downloader.wait(10)
+        self.assertEqual(self.read_file(save_path), self.content[:100])
+
+        async def download():
+            client = piver.AsyncPiverClient(*self.server.server_address)
+            try:
+                await client.login("alice", PASSWORD)
+                return await client.download_file("files/data.bin", self.get_save_path("async.bin"), length=100)
+            finally:
+                await client.close()
+        self.assertEqual(self.read_file(asyncio.run(download())), self.content[:100])
+
+    def test_resume(self):
+        with open(self.get_save_path(), "wb") as file:
+            file.write(self.content[:1000])
+        save_path = self.client.download_file("files/data.bin", self.get_save_path(), blocking=True)
+        self.assertEqual(self.read_file(save_path), self.content)
+
+    def test_corrupted_partial_file_is_downloaded_again(self):
+        with open(self.get_save_path(), "wb") as file:
+            file.write(bytes(1000))
+        save_path = self.client.download_file("files/data.bin", self.get_save_path(), blocking=True)
+        self.assertEqual(self.read_file(save_path), self.content)
+
+    def test_invalid_range(self):
+        for offset, length in (("0", None), (None, None), (self.FILE_SIZE + 1, None), (0, -1), (0, 1.5)):
+            with self.assertRaises(ValueError):
+                self.client.request("download_file", ["files/data.bin", offset, length])
+
+
+class StreamFileTest(FileTestCase):
+
+    def test_stream_file(self):
+        for persistent in (False, True):
+            client = piver.PiverClient(*self.server.server_address, persistent=persistent)
+            try:
+                client.login("alice", PASSWORD)
+                save_path = client.stream_file("files/data.bin", self.get_save_path(str(persistent)))
+                self.assertEqual(self.read_file(save_path), self.content)
+                # The connection can still be used after the streamed response
+                self.assertEqual(client.request("echo", [1]), 1)
+            finally:
+                client.close()
+        self.assertEqual(self.port_manager.ports_in_use(), 0)
+
+    def test_stream_range(self):
+        save_path = self.client.stream_file("files/data.bin", self.get_save_path(), length=100)
+        self.assertEqual(self.read_file(save_path), self.content[:100])
+        save_path = self.client.stream_file("files/data.bin", self.get_save_path("range.bin"), offset=200,
+                                            length=100)
+        self.assertEqual(self.read_file(save_path)[200:], self.content[200:300])
+
+    def test_async_stream_file(self):
+        async def download():
+            client = piver.AsyncPiverClient(*self.server.server_address)
+            try:
+                await client.login("alice", PASSWORD)
+                return await client.stream_file("files/data.bin", self.get_save_path())
+            finally:
+                await client.close()
+        self.assertEqual(self.read_file(asyncio.run(download())), self.content)
+
+    def test_paths_outside_of_the_main_folder(self):
+        for relative_server_path in ("../../../../etc/passwd", "/etc/passwd", "files/../../outside.bin"):
+            with self.assertRaises(PermissionError):
+                self.client.stream_file(relative_server_path, self.get_save_path())
+        with self.assertRaises(FileNotFoundError):
+            self.client.stream_file("files/missing.bin", self.get_save_path())
+
+
+class PortManagerTest(unittest.TestCase):
+
+    def test_acquire_and_release(self):
+        port_manager = piver.PortManager(range(100, 102))
+        ports = {port_manager.acquire(), port_manager.acquire()}
+        self.assertEqual(ports, {100, 101})
+        with self.assertRaises(piver.ServerBusyError):
+            port_manager.acquire()
+        port_manager.release(100)
+        # Releasing a port twice or one, that was never leased, has no effect
+        port_manager.release(100)
+        port_manager.release(200)
+        self.assertEqual(port_manager.acquire(), 100)
+        self.assertEqual(port_manager.get_statistics(), {"in_use": 2, "available": 0, "reclaimed": 0})
+
+    def test_expired_leases_are_reclaimed(self):
+        port_manager = piver.PortManager(range(100, 101))
+        port_manager.acquire(lease_time=0)
+        self.assertEqual(port_manager.reclaim(), 1)
+        self.assertEqual(port_manager.ports_in_use(), 0)
+        # Acquiring reclaims the expired leases as well
+        port_manager.acquire(lease_time=0)
+        self.assertEqual(port_manager.acquire(), 100)
+        self.assertEqual(port_manager.reclaimed_count, 2)
+
+    def test_partition(self):
+        port_manager = piver.PortManager(range(100, 106))
+        port_manager.acquire()
+        partitions = port_manager.partition(2)
+        self.assertEqual(sorted(port for partition in partitions for port in partition), list(range(100, 106)))
+        self.assertEqual([len(partition) for partition in partitions], [3, 3])
+
+
+class PortLeaseTest(FileTestCase):
+
+    def test_ports_are_released_after_downloads(self):
+        for index in range(3):
+            self.client.download_file("files/data.bin", self.get_save_path(), blocking=True, resume=False)
+        deadline = time.monotonic() + 5
+        while self.port_manager.ports_in_use() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(self.port_manager.ports_in_use(), 0)
+
+
+class CountingDownloadCache(piver.DownloadCache):
+    # Counts the files, that were restored from the cache instead of being downloaded
+    restore_count = 0
+
+    def restore(self, digest, save_path):
+        restored = piver.DownloadCache.restore(self, digest, save_path)
+        self.restore_count += restored
+        return restored
+
+
+class DownloadCacheTest(FileTestCase):
+
+    def setUp(self):
+        FileTestCase.setUp(self)
+        self.cache_dir = os.path.join(self.save_folder, "cache")
+
+    def write_file(self, name, content):
+        file_path = self.get_save_path(name)
+        with open(file_path, "wb") as file:
+            file.write(content)
+        return file_path
+
+    def test_store_and_restore(self):
+        cache = piver.DownloadCache(self.cache_dir)
+        cache.store("key", "abc123", self.write_file("a.bin", b"piver"))
+        self.assertEqual(cache.lookup("key"), "abc123")
+        self.assertTrue(cache.restore("abc123", self.get_save_path("restored.bin")))
+        self.assertEqual(self.read_file(self.get_save_path("restored.bin")), b"piver")
+        # The index is kept on the disk
+        self.assertEqual(piver.DownloadCache(self.cache_dir).lookup("key"), "abc123")
+        self.assertIsNone(cache.lookup("other"))
+        self.assertFalse(cache.restore("def456", self.get_save_path("missing.bin")))
+
+    def test_invalid_digests_are_not_stored(self):
+        cache = piver.DownloadCache(self.cache_dir)
+        for digest in ("", "../escape", "ABC"):
+            cache.store("key", digest, self.write_file("a.bin", b"piver"))
+        self.assertIsNone(cache.lookup("key"))
+        self.assertEqual(cache.get_size(), 0)
+
+    def test_least_recently_used_files_are_evicted(self):
+        cache = piver.DownloadCache(self.cache_dir, max_size=10)
+        cache.store("first", "aa", self.write_file("a.bin", b"12345"))
+        cache.store("second", "bb", self.write_file("b.bin", b"12345"))
+        # Aging the second file, so that it is the least recently used one
+        past = time.time() - 60
+        os.utime(os.path.join(self.cache_dir, "bb"), (past, past))
+        cache.store("third", "cc", self.write_file("c.bin", b"12345"))
+        self.assertEqual(cache.get_size(), 10)
+        self.assertIsNone(cache.lookup("second"))
+        self.assertEqual(cache.lookup("first"), "aa")
+
+    def test_unchanged_files_are_restored_from_the_cache(self):
+        cache = CountingDownloadCache(self.cache_dir)
+        client = piver.PiverClient(*self.server.server_address, download_cache=cache)
+        client.login("alice", PASSWORD)
+        client.stream_file("files/data.bin", self.get_save_path("first.bin"))
+        save_path = client.stream_file("files/data.bin", self.get_save_path("second.bin"))
+        self.assertEqual(self.read_file(save_path), self.content)
+        self.assertEqual(cache.restore_count, 1)
+
+        # A file, that changed on the server, is downloaded again
+        self.write_server_file("files/data.bin", b"changed")
+        save_path = client.stream_file("files/data.bin", self.get_save_path("third.bin"))
+        self.assertEqual(self.read_file(save_path), b"changed")
+        self.assertEqual(cache.restore_count, 1)
+
+
+class DownloadFilesTest(FileTestCase):
+
+    def setUp(self):
+        FileTestCase.setUp(self)
+        self.contents = {}
+        for index in range(4):
+            relative_server_path = "files/file{}.bin".format(index)
+            self.contents[relative_server_path] = os.urandom(50000 + index)
+            self.write_server_file(relative_server_path, self.contents[relative_server_path])
+
+    def test_download_files(self):
+        files = [(relative_server_path, self.get_save_path(os.path.basename(relative_server_path)))
+                 for relative_server_path in self.contents]
+        finished = []
+        progress = piver.DownloadProgress(callback=lambda progress: finished.append(progress.finished_files))
+        client = piver.PooledPiverClient(*self.server.server_address, max_size=2)
+        try:
+            client.login("alice", PASSWORD)
+            results = client.download_files(files, max_concurrent=2, progress=progress)
+        finally:
+            client.close()
+        self.assertEqual(results, [save_path for relative_server_path, save_path in files])
+        for relative_server_path, save_path in files:
+            self.assertEqual(self.read_file(save_path), self.contents[relative_server_path])
+        self.assertTrue(progress.is_done())
+        self.assertEqual(progress.received_bytes, sum(len(content) for content in self.contents.values()))
+        self.assertEqual(sorted(finished), [1, 2, 3, 4])
+
+    def test_failed_download_does_not_affect_the_others(self):
+        files = [("files/file0.bin", self.get_save_path("file0.bin")),
+                 ("files/missing.bin", self.get_save_path("missing.bin")),
+                 ("files/file1.bin", self.get_save_path("file1.bin"))]
+        progress = piver.DownloadProgress()
+        results = self.client.download_files(files, progress=progress)
+        self.assertEqual(results[0], files[0][1])
+        self.assertIsInstance(results[1], FileNotFoundError)
+        self.assertEqual(results[2], files[2][1])
+        self.assertEqual(progress.finished_files, 2)
+        self.assertEqual([save_path for save_path, error in progress.failed_files], [files[1][1]])
+        self.assertEqual(self.client.download_files([]), [])
+
+
+class UploadTest(FileTestCase):
+
+    def setUp(self):
+        FileTestCase.setUp(self)
+        self.upload_path = self.get_save_path("upload.bin")
+        with open(self.upload_path, "wb") as file:
+            file.write(self.content)
+
+    def get_upload_folder_content(self):
+        return sorted(os.listdir(os.path.join(self.project_path, "uploads")))
+
+    def test_upload(self):
+        for persistent in (False, True):
+            client = piver.PiverClient(*self.server.server_address, persistent=persistent)
+            try:
+                client.login("alice", PASSWORD)
+                ticket = client.upload_file(self.upload_path, "uploads/data.bin", overwrite=True)
+                self.assertEqual(ticket.get_digest(), piver.compute_file_digest(self.upload_path))
+                self.assertEqual(self.read_file(os.path.join(self.project_path, "uploads/data.bin")), self.content)
+                self.assertEqual(client.request("echo", [1]), 1)
+            finally:
+                client.close()
+
+    def test_async_upload(self):
+        async def upload():
+            client = piver.AsyncPiverClient(*self.server.server_address)
+            try:
+                await client.login("alice", PASSWORD)
+                await client.upload_file(self.upload_path, "uploads/async.bin")
+            finally:
+                await client.close()
+        asyncio.run(upload())
+        self.assertEqual(self.read_file(os.path.join(self.project_path, "uploads/async.bin")), self.content)
+
+    def test_rejected_uploads(self):
+        client = piver.PiverClient(*self.server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            client.upload_file(self.upload_path, "uploads/data.bin")
+            with self.assertRaises(FileExistsError):
+                client.upload_file(self.upload_path, "uploads/data.bin")
+            with self.assertRaises(PermissionError):
+                client.upload_file(self.upload_path, "../outside.bin")
+
+            # Data, that does not match the announced digest or size, never replaces the file
+            request_transfer = piver.RequestTransfer(client.authentication_code, "upload_file",
+                                                     ["uploads/data.bin", 5, "0" * 64, True])
+            with self.assertRaises(piver.FileIntegrityError):
+                client.send(request_transfer, source=iter([b"piver"]))
+            request_transfer = piver.RequestTransfer(client.authentication_code, "upload_file",
+                                                     ["uploads/data.bin", 4, "0" * 64, True])
+            with self.assertRaises(ValueError):
+                client.send(request_transfer, source=iter([b"piver"]))
+            self.assertEqual(self.read_file(os.path.join(self.project_path, "uploads/data.bin")), self.content)
+            self.assertEqual(self.get_upload_folder_content(), ["data.bin"])
+            self.assertEqual(client.request("echo", [1]), 1)
+        finally:
+            client.close()
+
+    def test_maximum_upload_size(self):
+        server = start_server(max_upload_size=self.FILE_SIZE - 1)
+        client = piver.PiverClient(*server.server_address)
+        try:
+            client.login("alice", PASSWORD)
+            with self.assertRaises(ValueError):
+                client.upload_file(self.upload_path, "uploads/data.bin")
+        finally:
+            stop_server(server)
+        self.assertFalse(os.path.exists(os.path.join(self.project_path, "uploads/data.bin")))
+
+
+class AuthenticationGuardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.guard = piver.AuthenticationGuard()
+
+    def test_codes_of_a_user(self):
+        first_code = self.guard.create_authentication_code("alice")
+        second_code = self.guard.create_authentication_code("alice")
+        for code in (first_code, second_code):
+            self.assertTrue(self.guard.is_valid_authentication(code))
+            self.assertEqual(self.guard.get_username(code), "alice")
+        # The reverse index points to the most recent code, also after an older code was removed
+        self.assertEqual(self.guard.get_authentication_code("alice"), second_code)
+        self.guard.remove_authentication_code(first_code)
+        self.assertFalse(self.guard.is_valid_authentication(first_code))
+        self.assertEqual(self.guard.get_authentication_code("alice"), second_code)
+        self.guard.remove_authentication_code(second_code)
+        self.assertFalse(self.guard.user_exists("alice"))
+        with self.assertRaises(KeyError):
+            self.guard.get_authentication_code("alice")
+
+    def test_expired_codes_are_removed(self):
+        self.guard.CODE_LIFETIME_HOURS = -1
+        expired_codes = [self.guard.create_authentication_code(username) for username in ("alice", "bob")]
+        self.assertFalse(self.guard.is_valid_authentication(expired_codes[0]))
+        self.assertIsNone(self.guard.get_username(expired_codes[0]))
+        self.assertEqual(self.guard.remove_expired_codes(), 1)
+        self.assertFalse(self.guard.user_exists("bob"))
+
+        self.guard.CODE_LIFETIME_HOURS = 24
+        valid_code = self.guard.create_authentication_code("alice")
+        self.assertEqual(self.guard.remove_expired_codes(), 0)
+        self.assertTrue(self.guard.is_valid_authentication(valid_code))
+        self.assertEqual(self.guard.expiration_heap, [(self.guard.expiration_dictionary[valid_code], valid_code)])
+
+    def test_codes_of_other_types(self):
+        for code in (None, 1, ["0x1:0x2"], {}):
+            self.assertFalse(self.guard.is_valid_authentication(code))
+            self.assertIsNone(self.guard.get_username(code))
+        self.assertFalse(self.guard.is_valid_authentication("0x1:0x2"))
+
+    def test_requests_with_invalid_codes(self):
+        server = start_server()
+        client = piver.PiverClient(*server.server_address)
+        try:
+            for code in ("0x1:0x2", ["0x1"], None):
+                with self.assertRaises(PermissionError):
+                    client.send(piver.RequestTransfer(code, "echo", [1]))
+        finally:
+            stop_server(server)
+
+
+class SignedAuthenticationGuardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.guard = piver.SignedAuthenticationGuard(b"secret")
+
+    def test_token_round_trip(self):
+        for username in ("alice", "user:with:colons", "ünïcode"):
+            token = self.guard.create_authentication_code(username)
+            self.assertTrue(self.guard.is_valid_authentication(token))
+            self.assertEqual(self.guard.get_username(token), username)
+        # Any guard with the same secret key accepts the tokens, also a guard of another process
+        other_guard = piver.SignedAuthenticationGuard("secret")
+        self.assertEqual(other_guard.get_username(self.guard.create_authentication_code("bob")), "bob")
+
+    def test_tampered_tokens(self):
+        token = self.guard.create_authentication_code("alice")
+        username_part, expiration_part, signature = token.split(":")
+        tampered_tokens = [
+            "{}:{}:{}".format("bob".encode("utf-8").hex(), expiration_part, signature),
+            "{}:{}:{}".format(username_part, hex(int(expiration_part, 16) + 3600), signature),
+            "{}:{}:{}".format(username_part, expiration_part, "0" * len(signature)),
+            "{}:{}".format(username_part, expiration_part),
+            token + "\ud800",
+            "\ud800:" + token,
+            "",
+            None,
+            ["alice"]
+        ]
+        for tampered_token in tampered_tokens:
+            self.assertFalse(self.guard.is_valid_authentication(tampered_token))
+            self.assertIsNone(self.guard.get_username(tampered_token))
+        self.assertIsNone(piver.SignedAuthenticationGuard(b"other").get_username(token))
+
+    def test_expired_tokens(self):
+        self.guard.CODE_LIFETIME_HOURS = -1
+        token = self.guard.create_authentication_code("alice")
+        self.assertFalse(self.guard.is_valid_authentication(token))
+        self.assertIsNone(self.guard.get_username(token))
+
+    def test_login_and_request(self):
+        server = start_server(authentication_guard=self.guard)
+        client = piver.PiverClient(*server.server_address)
+        try:
+            client.login("alice", PASSWORD)
+            self.assertEqual(self.guard.get_username(client.authentication_code), "alice")
+            self.assertEqual(client.request("echo", [1]), 1)
+            with self.assertRaises(PermissionError):
+                client.send(piver.RequestTransfer(client.authentication_code + "0", "echo", [1]))
+        finally:
+            stop_server(server)
+
+
+class ProcessRequestHandler(EchoRequestHandler):
+
+    @piver.remote(idempotent=True)
+    def get_pid(self, received_object):
+        return os.getpid()
+
+    @piver.remote
+    def crash(self, received_object):
+        os._exit(1)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "The prefork server needs os.fork")
+class PreforkServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server(piver.PreforkPiverServer, piver.SignedAuthenticationGuard(b"secret"),
+                                   handler_class=ProcessRequestHandler, worker_count=2)
+
+    def tearDown(self):
+        stop_server(self.server)
+
+    def test_login_and_request(self):
+        client = piver.PiverClient(*self.server.server_address)
+        client.login("alice", PASSWORD)
+        self.assertEqual(client.request("echo", ["piver"]), "piver")
+        self.assertEqual(client.request_batch([("echo", [1]), ("echo", [2])]), [1, 2])
+        # Every request is served by one of the workers, which accept the tokens issued by each other
+        worker_pids = set(self.server.get_worker_pids())
+        self.assertEqual(len(worker_pids), 2)
+        self.assertNotIn(os.getpid(), worker_pids)
+        for index in range(10):
+            self.assertIn(client.request("get_pid", []), worker_pids)
+
+    def test_crashed_worker_is_restarted(self):
+        client = piver.PiverClient(*self.server.server_address)
+        client.login("alice", PASSWORD)
+        with self.assertRaises((ConnectionError, EOFError)):
+            client.request("crash", [])
+        deadline = time.monotonic() + 10
+        while self.server.restart_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(self.server.restart_count, 1)
+        self.assertEqual(len(self.server.get_worker_pids()), 2)
+        self.assertEqual(client.request("echo", [1]), 1)
+
+
+class OverridingRequestHandler(SlowRequestHandler):
+
+    # Overriding a remote method without the decorator keeps its description
+    def echo(self, received_object, value):
+        return [value]
+
+    # Replacing a remote method with something, that can not be called, removes it
+    sleep = None
+
+    def helper(self, received_object):
+        return "not remote"
+
+
+class RemoteMethodRegistryTest(unittest.TestCase):
+
+    def test_registry_of_the_subclasses(self):
+        self.assertTrue(SlowRequestHandler.remote_methods["echo"].idempotent)
+        self.assertIn("sleep", SlowRequestHandler.remote_methods)
+        remote_method = OverridingRequestHandler.remote_methods["echo"]
+        self.assertTrue(remote_method.idempotent)
+        self.assertIs(remote_method.function, OverridingRequestHandler.echo)
+        self.assertNotIn("sleep", OverridingRequestHandler.remote_methods)
+        self.assertNotIn("helper", OverridingRequestHandler.remote_methods)
+
+    def test_cacheable_methods_have_to_be_idempotent(self):
+        with self.assertRaises(ValueError):
+            piver.remote(lambda self, received_object: None, cacheable=True)
+
+    def test_dispatch(self):
+        server = start_server(handler_class=OverridingRequestHandler)
+        client = piver.PiverClient(*server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            self.assertEqual(client.request("echo", [1]), [1])
+            descriptions = client.request("get_remote_methods", [])
+            self.assertEqual(descriptions["echo"]["name"], "echo")
+            self.assertTrue(descriptions["echo"]["idempotent"])
+            # Only the registered methods can be called, no matter what else the handler has
+            for method_name in ("helper", "sleep", "handle", "__init__", None, ["echo"]):
+                with self.assertRaises(AttributeError):
+                    client.request(method_name, [])
+            self.assertEqual(client.request("echo", [2]), [2])
+        finally:
+            client.close()
+            stop_server(server)
+
+
+class ServerStatisticsTest(unittest.TestCase):
+
+    def test_record(self):
+        statistics = piver.ServerStatistics()
+        for duration in (0.001, 0.002, 0.5):
+            statistics.record("echo", duration, 10, 20)
+        statistics.record("echo", 0.001, 10, 0, failed=True)
+        echo_statistics = statistics.get_statistics()["methods"]["echo"]
+        self.assertEqual(echo_statistics["count"], 4)
+        self.assertEqual(echo_statistics["errors"], 1)
+        self.assertEqual((echo_statistics["bytes_in"], echo_statistics["bytes_out"]), (40, 60))
+        self.assertEqual(echo_statistics["max"], 0.5)
+        self.assertLessEqual(echo_statistics["p50"], echo_statistics["p99"])
+        self.assertLessEqual(echo_statistics["p99"], 0.5)
+
+    def test_dump(self):
+        statistics = piver.ServerStatistics()
+        statistics.record("echo", 0.001, 10, 20)
+        folder = tempfile.mkdtemp()
+        try:
+            file_path = os.path.join(folder, "statistics.json")
+            statistics.dump(file_path, extra={"server": "test"})
+            with open(file_path, "r") as file:
+                dumped_statistics = json.load(file)
+            self.assertEqual(dumped_statistics["requests"], 1)
+            self.assertEqual(dumped_statistics["server"], "test")
+            self.assertEqual(os.listdir(folder), ["statistics.json"])
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    def test_get_server_stats(self):
+        for server_class in (piver.PiverServer, piver.AsyncPiverServer):
+            server = start_server(server_class)
+            client = piver.PiverClient(*server.server_address, persistent=True)
+            try:
+                client.login("alice", PASSWORD)
+                for index in range(3):
+                    client.request("echo", [index])
+                client.request_batch([("echo", [1])])
+                for method_name in ("missing", "other missing"):
+                    with self.assertRaises(AttributeError):
+                        client.request(method_name, [])
+
+                # The requests are recorded right after their response was sent
+                deadline = time.monotonic() + 5
+                while server.server_statistics.get_statistics()["requests"] < 7 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                methods = client.request("get_server_stats", [])["methods"]
+                self.assertEqual(methods["echo"]["count"], 3)
+                self.assertEqual(methods["login"]["count"], 1)
+                self.assertEqual(methods["batch"]["count"], 1)
+                # Unknown method names must not add entries to the statistics
+                self.assertEqual((methods["unknown"]["count"], methods["unknown"]["errors"]), (2, 2))
+                self.assertIn("compression", client.request("get_server_stats", []))
+            finally:
+                client.close()
+                stop_server(server)
+
+
+class CachingRequestHandler(EchoRequestHandler):
+
+    @piver.remote(idempotent=True, cacheable=True)
+    def count(self, received_object, value):
+        self.server.call_count += 1
+        return [value, self.server.call_count]
+
+    @piver.remote(mutating=True)
+    def change(self, received_object):
+        return True
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = start_server(handler_class=CachingRequestHandler)
+        self.server.call_count = 0
+        self.client = piver.PiverClient(*self.server.server_address, persistent=True)
+        self.client.login("alice", PASSWORD)
+
+    def tearDown(self):
+        self.client.close()
+        stop_server(self.server)
+
+    def test_cache_hit(self):
+        self.assertEqual(self.client.request("count", ["a"]), ["a", 1])
+        self.assertEqual(self.client.request("count", ["a"]), ["a", 1])
+        self.assertEqual(self.client.request("count", ["b"]), ["b", 2])
+        statistics = self.server.response_cache.get_statistics()
+        self.assertEqual((statistics["hits"], statistics["misses"]), (1, 2))
+
+    def test_mutating_method_invalidates(self):
+        self.assertEqual(self.client.request("count", ["a"]), ["a", 1])
+        self.assertTrue(self.client.request("change", []))
+        self.assertEqual(self.client.request("count", ["a"]), ["a", 2])
+
+    def test_parameters_not_iterable(self):
+        with self.assertRaises(TypeError):
+            self.client.request("count", None)
+        # The request is not cached, but the connection is still usable
+        self.assertEqual(self.client.request("count", ["a"]), ["a", 1])
+        self.assertIsNone(piver.ResponseCache.get_key("alice", piver.RequestTransfer(None, "count", None),
+                                                      piver.PickleCodec(), None))
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_token_bucket(self):
+        bucket = piver.TokenBucket(10, 2)
+        self.assertEqual(bucket.take(), 0)
+        self.assertEqual(bucket.get_wait_time(), 0)
+        self.assertEqual(bucket.take(), 0)
+        self.assertGreater(bucket.get_wait_time(), 0)
+        self.assertGreater(bucket.take(), 0)
+        time.sleep(0.15)
+        self.assertEqual(bucket.take(), 0)
+
+    def test_rate_limiter(self):
+        rate_limiter = piver.RateLimiter(1, burst=2)
+        self.assertEqual(rate_limiter.get_wait_time("alice"), 0)
+        self.assertEqual(rate_limiter.acquire("alice"), 0)
+        self.assertEqual(rate_limiter.acquire("alice"), 0)
+        self.assertGreater(rate_limiter.acquire("alice"), 0)
+        # Checking takes no tokens and is not counted
+        for index in range(3):
+            self.assertGreater(rate_limiter.get_wait_time("alice"), 0)
+        # Costs exceeding the burst are capped, the other users have buckets of their own
+        self.assertEqual(rate_limiter.acquire("bob", cost=10), 0)
+        self.assertEqual(rate_limiter.get_statistics(), {"users": 2, "requests": 4, "limited": 1})
+
+    def test_rate_limit(self):
+        server = start_server(rate_limit=1, rate_limit_burst=3)
+        client = piver.PiverClient(*server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            self.assertEqual(client.request("echo", [1]), 1)
+            self.assertEqual(client.request("echo", [2]), 2)
+            with self.assertRaises(piver.RateLimitError):
+                client.request("echo", [3])
+            # The connection is still usable once the bucket was refilled
+            time.sleep(1.1)
+            self.assertEqual(client.request("echo", [4]), 4)
+        finally:
+            client.close()
+            stop_server(server)
+
+    def test_failed_logins_do_not_drain_the_user_bucket(self):
+        server = start_server(rate_limit=1, rate_limit_burst=3)
+        client = piver.PiverClient(*server.server_address, persistent=True)
+        try:
+            client.login("alice", PASSWORD)
+            rate_limited = 0
+            for index in range(6):
+                try:
+                    piver.PiverClient(*server.server_address).login("alice", "wrong")
+                except piver.RateLimitError:
+                    rate_limited += 1
+                except PermissionError:
+                    pass
+            self.assertGreater(rate_limited, 0)
+            # The login took one of the three tokens of the user, the failed logins none
+            self.assertEqual(client.request("echo", [1]), 1)
+            self.assertEqual(client.request("echo", [2]), 2)
+            # The rejected logins were only checked, so they are not counted as limited failed logins
+            login_statistics = server.login_rate_limiter.get_statistics()
+            self.assertEqual(login_statistics["requests"], 6 - rate_limited)
+            self.assertLessEqual(login_statistics["limited"], login_statistics["requests"])
+        finally:
+            client.close()
+            stop_server(server)
+
+
+class FairSchedulerTest(unittest.TestCase):
+
+    def test_weighted_order(self):
+        scheduler = piver.FairScheduler(1, weights={"alice": 2.0})
+        self.assertTrue(scheduler.acquire("bob"))
+        granted = []
+
+        def acquire(username):
+            self.assertTrue(scheduler.acquire(username, timeout=5))
+            granted.append(username)
+            scheduler.release()
+        threads = []
+        for username in ("bob", "bob", "alice", "alice"):
+            thread = threading.Thread(target=acquire, args=(username,))
+            thread.start()
+            threads.append(thread)
+            # Wait until the request is queued, so that the sequence numbers are deterministic
+            while len(scheduler.queue) < len(threads):
+                time.sleep(0.001)
+        scheduler.release()
+        for thread in threads:
+            thread.join()
+        # Bob already used up his share, while alice has twice the weight of bob
+        self.assertEqual(granted, ["alice", "alice", "bob", "bob"])
+        self.assertEqual(scheduler.available, 1)
+
+    def test_cancelled_scheduler_entry_is_rolled_back(self):
+        scheduler = piver.FairScheduler(1)
+        self.assertTrue(scheduler.acquire("alice"))
+        self.assertFalse(scheduler.acquire("bob", cost=10, timeout=0.05))
+        self.assertLessEqual(scheduler.finish_times["bob"], scheduler.virtual_time)
+
+        async def acquire():
+            return await scheduler.acquire_async("bob", cost=10, timeout=0.05)
+        self.assertFalse(asyncio.run(acquire()))
+        self.assertLessEqual(scheduler.finish_times["bob"], scheduler.virtual_time)
+        scheduler.release()
+        self.assertEqual(scheduler.available, 1)
+
+    def test_async_scheduler_does_not_block_the_executor(self):
+        server = start_server(piver.AsyncPiverServer, max_workers=2, max_concurrent_requests=1)
+        try:
+            def flood():
+                client = piver.PiverClient(*server.server_address, persistent=True)
+                try:
+                    client.login("bob", PASSWORD)
+                    for index in range(20):
+                        client.request("echo", [index])
+                finally:
+                    client.close()
+            with concurrent.futures.ThreadPoolExecutor(4) as executor:
+                futures = [executor.submit(flood) for index in range(4)]
+                for future in futures:
+                    future.result()
+            self.assertEqual(server.request_scheduler.available, 1)
+        finally:
+            stop_server(server)
+
+
+if __name__ == "__main__":
+    unittest.main()